@@ -1,53 +1,153 @@
+import numbers
+import numpy as np
 import pygame
 import random
 import sys
 
-pygame.mixer.init()
+from math import floor
+from assets import shared_assets, headless_assets, OPAQUE
+from atlas import SpriteAtlas, Viewport
+from audio import open_audio, NullAudio, HIT, WAVE, GAME_OVER
+from controls import keys_to_actions, allow_input_events, InputState, LEFT, RIGHT, UP, DOWN
+from pool import ShipPool
+from fleet import ShipFleet
+from collision import SpatialHash, collide_pairs, masks_overlap, RECT, MASK, COLLISION_MODES
+from render import (create_renderer, RENDER_BACKENDS, SOFTWARE, TEXTURE, DEFAULT_LAYERS,
+                    ENTITIES, HUD)
+from hud import TextCache, build_game_over_overlay
+from scenes import SceneStack, PlayScene, TitleScene
+from profiler import FrameProfiler, NullProfiler
+from particles import ParticleSystem, EXPLOSION, SPLASH, SNOW, DEFAULT_CAPACITY
+from timestep import SimulationClock, DEFAULT_TICK_RATE
+from waves import Level
+
+PENGUIN_SIZE = (75, 75)
+SHIP_SIZE = (65, 65)
+DEFAULT_POOL_SIZE = 32
+DEFAULT_ASSET_CACHE_DIR = ".asset_cache"
+IDLE_WAIT_MS = 500
+SNOW_INTERVAL = 3  # ticks between snowflakes
+MAX_SEED = (1 << 64) - 1  # snapshots and replays store the seed as a u64
+
+def roll_speed(rng, speed_range):
+    """
+    Pick a speed from an inclusive (min, max) range.
+
+    Integer bounds give whole-pixel speeds as before; if either bound is
+    a float the speed is drawn uniformly, allowing sub-pixel speeds.
+    """
+    low, high = speed_range
+    if isinstance(low, int) and isinstance(high, int):
+        return rng.randint(low, high)
+    return rng.uniform(low, high)
+
+def check_seed(seed):
+    """
+    Return seed if it is a whole number from 0 to MAX_SEED.
+
+    Raises:
+        ValueError: for any other seed, which snapshots and replays could
+            not store.
+    """
+    if not isinstance(seed, numbers.Integral) or not 0 <= seed <= MAX_SEED:
+        raise ValueError(f"Seed must be a whole number from 0 to {MAX_SEED}: {seed!r}")
+    return int(seed)
+
 
 class Penguin:
     """
     Represents the penguin controlled by the player using arrow keys.
+
+    The position is kept as floats (x, y) so speeds can be fractional.
+    rect is synced from them after every move and is what is blitted and
+    collided; if something moves rect directly, the floats follow it.
     """
 
-    def __init__(self, image_path, screen_width, screen_height, start_health=50):
+    __slots__ = ("image", "mask", "rect", "x", "y", "prev_pos", "health", "speed",
+                 "screen_width", "screen_height")
+
+    def __init__(self, image_path, screen_width, screen_height, start_health=50,
+                 assets=None, speed=5):
         """Initialize penguin attributes."""
-        original_image = pygame.image.load(image_path).convert_alpha()
-        self.image = pygame.transform.scale(original_image, (75, 75))
+        if assets is None:
+            assets = shared_assets
+        self.image = assets.get(image_path, PENGUIN_SIZE)
+        self.mask = assets.mask(image_path, PENGUIN_SIZE)
 
         self.rect = self.image.get_rect(
             center=(screen_width // 2, screen_height - 80)
         )
+        self.x, self.y = self.rect.topleft
+        self.prev_pos = (self.x, self.y)
 
         self.health = start_health
-        self.speed = 5
+        self.speed = speed
         self.screen_width = screen_width
         self.screen_height = screen_height
 
-    def handle_input(self):
-        """Handle keyboard input."""
-        keys = pygame.key.get_pressed()
-
-        if keys[pygame.K_LEFT]:
-            self.rect.x -= self.speed
-        if keys[pygame.K_RIGHT]:
-            self.rect.x += self.speed
-        if keys[pygame.K_UP]:
-            self.rect.y -= self.speed
-        if keys[pygame.K_DOWN]:
-            self.rect.y += self.speed
-
-        self.keep_in_bounds()
+    def handle_input(self, actions=None):
+        """
+        Handle keyboard input.
+
+        Args:
+            actions: action bitmask from controls.py. When None, the
+                keyboard is polled with pygame.key.get_pressed().
+        """
+        if actions is None:
+            actions = keys_to_actions(pygame.key.get_pressed())
+
+        self._follow_rect()
+        if actions & LEFT:
+            self.x -= self.speed
+        if actions & RIGHT:
+            self.x += self.speed
+        if actions & UP:
+            self.y -= self.speed
+        if actions & DOWN:
+            self.y += self.speed
+
+        self._clamp()
 
     def keep_in_bounds(self):
         """Keep penguin within screen limits."""
-        self.rect.left = max(0, self.rect.left)
-        self.rect.right = min(self.screen_width, self.rect.right)
-        self.rect.top = max(0, self.rect.top)
-        self.rect.bottom = min(self.screen_height, self.rect.bottom)
+        self._follow_rect()
+        self._clamp()
+
+    def _clamp(self):
+        """Clamp the float position to the screen and sync rect to it."""
+        rect = self.rect
+        self.x = min(max(0, self.x), self.screen_width - rect.width)
+        self.y = min(max(0, self.y), self.screen_height - rect.height)
+        rect.x = floor(self.x)
+        rect.y = floor(self.y)
+
+    def _follow_rect(self):
+        """Take the rect's position if it was moved from outside."""
+        rect = self.rect
+        if rect.x != floor(self.x):
+            self.x = rect.x
+        if rect.y != floor(self.y):
+            self.y = rect.y
+
+    def sprite(self, alpha=1.0):
+        """
+        Return the (image, position) to blit for this frame.
+
+        Args:
+            alpha: how far between the previous and current tick to draw
+                it (1.0 draws the current position).
+        """
+        if alpha >= 1.0:
+            return self.image, self.rect
+        prev_x, prev_y = self.prev_pos
+        return self.image, (
+            round(prev_x + (self.x - prev_x) * alpha),
+            round(prev_y + (self.y - prev_y) * alpha),
+        )
 
-    def draw(self, screen):
-        """Draw penguin."""
-        screen.blit(self.image, self.rect)
+    def draw(self, screen, alpha=1.0):
+        """Draw penguin and return the area drawn."""
+        return screen.blit(*self.sprite(alpha))
 
     def take_damage(self, amount):
         """Reduce health."""
@@ -62,57 +162,152 @@ class Penguin:
         self.health = 50
         self.rect.centerx = self.screen_width // 2
         self.rect.bottom = self.screen_height - 40
+        self.x, self.y = self.rect.topleft
+        self.prev_pos = (self.x, self.y)
 
-    def update(self):
-        """Update penguin movement."""
-        self.handle_input()
+    def update(self, actions=None):
+        """Update penguin movement by one tick."""
+        self._follow_rect()
+        self.prev_pos = (self.x, self.y)
+        self.handle_input(actions)
 
     def get_rect(self):
         """Return collision rect."""
         return self.rect
 
 
-class Ship:
+class ShipConfig:
     """
-    Represents enemy ships that fall from top to bottom.
+    Settings and sprite shared by every ship of one kind.
+
+    Ships only hold a reference to this, so a large wave does not repeat
+    the same image, mask, screen width, speed range, and rng in every ship.
     """
 
-    def __init__(self, image_path, screen_width):
-        """Initialize ship."""
-        original_image = pygame.image.load(image_path).convert_alpha()
-        self.image = pygame.transform.scale(original_image, (65, 65))
+    __slots__ = ("image", "screen_width", "speed_range", "rng", "mask")
 
-        self.rect = self.image.get_rect()
-        self.speed = random.randint(3, 6)
+    def __init__(self, image, screen_width, speed_range=(3, 6), rng=None,
+                 mask=None):
+        """
+        Initialize config (rng is a random.Random; the random module if None).
+
+        mask is the collision mask of image, used for pixel-perfect checks.
+        """
+        self.image = image
         self.screen_width = screen_width
+        self.speed_range = speed_range
+        self.rng = rng
+        self.mask = mask
+
+
+class Ship:
+    """
+    Represents enemy ships that fall from top to bottom.
+
+    Like Penguin, the position is kept as floats and synced to rect.
+    """
+
+    __slots__ = ("config", "rect", "x", "y", "prev_y", "speed")
+
+    def __init__(self, image_path, screen_width, assets=None, speed_range=(3, 6),
+                 rng=None, config=None):
+        """
+        Initialize ship (rng is a random.Random; the random module if None).
+
+        Pass config to share one ShipConfig between many ships; the other
+        arguments are then ignored.
+        """
+        if config is None:
+            if assets is None:
+                assets = shared_assets
+            config = ShipConfig(
+                assets.get(image_path, SHIP_SIZE), screen_width, speed_range, rng,
+                mask=assets.mask(image_path, SHIP_SIZE)
+            )
+        self.config = config
+
+        self.rect = config.image.get_rect()
         self.spawn()
 
+    @property
+    def image(self):
+        return self.config.image
+
+    @property
+    def mask(self):
+        return self.config.mask
+
+    @property
+    def screen_width(self):
+        return self.config.screen_width
+
+    @property
+    def speed_range(self):
+        return self.config.speed_range
+
+    @property
+    def rng(self):
+        return self.config.rng
+
     def spawn(self):
-        """Spawn ship within horizontal screen limits."""
-        self.rect.x = random.randint(
-            0, self.screen_width - self.rect.width
+        """Reset speed and spawn ship within horizontal screen limits."""
+        config = self.config
+        rng = random if config.rng is None else config.rng
+        self.speed = roll_speed(rng, config.speed_range)
+        self.rect.x = rng.randint(
+            0, config.screen_width - self.rect.width
         )
-        self.rect.y = random.randint(-120, -40)
+        self.rect.y = rng.randint(-120, -40)
+        self.x = self.rect.x
+        self.y = self.prev_y = self.rect.y
+
+    def place(self, x, y, speed):
+        """Put ship at (x, y) with a given speed instead of rolling them."""
+        self.speed = speed
+        self.x = self.rect.x = floor(x)
+        self.y = self.prev_y = y
+        self.rect.y = floor(y)
 
     def move(self):
         """Move ship downward."""
-        self.rect.y += self.speed
+        rect = self.rect
+        if rect.y != floor(self.y):
+            self.y = rect.y
+        self.prev_y = self.y
+        self.y += self.speed
+        rect.y = floor(self.y)
 
     def update(self):
-        """Update ship movement."""
+        """Update ship movement by one tick."""
         self.move()
 
-    def draw(self, screen):
-        """Draw ship."""
-        screen.blit(self.image, self.rect)
+    def sprite(self, alpha=1.0):
+        """Return the (image, position) to blit, alpha of the way into its last move."""
+        if alpha >= 1.0:
+            return self.config.image, self.rect
+        y = round(self.prev_y + (self.y - self.prev_y) * alpha)
+        return self.config.image, (self.rect.x, y)
+
+    def draw(self, screen, alpha=1.0):
+        """Draw ship and return the area drawn."""
+        return screen.blit(*self.sprite(alpha))
 
     def is_off_screen(self, screen_height):
         """Check if ship left screen."""
         return self.rect.top > screen_height
 
-    def check_collision(self, penguin_rect):
-        """Check collision with penguin."""
-        return self.rect.colliderect(penguin_rect)
+    def check_collision(self, penguin_rect, penguin_mask=None):
+        """
+        Check collision with penguin.
+
+        With penguin_mask (and a ship mask), overlapping rects only count
+        if opaque pixels of both sprites overlap.
+        """
+        if not self.rect.colliderect(penguin_rect):
+            return False
+        if penguin_mask is None or self.config.mask is None:
+            return True
+        return masks_overlap(penguin_rect, penguin_mask, self.rect, self.config.mask)
 
     def get_rect(self):
         """Return collision rect."""
@@ -124,39 +319,220 @@ class Game:
     Controls game setup, loop, and logic.
     """
 
-    def __init__(self):
-        """Initialize game."""
-        pygame.init()
-
-    # Load background first (no conversion yet)
-        raw_background = pygame.image.load("GameplayBackground.PNG")
-
-    # Set screen size to background size
-        self.width = raw_background.get_width()
-        self.height = raw_background.get_height()
-
-    # Create the display window
-        self.screen = pygame.display.set_mode((self.width, self.height))
-        pygame.display.set_caption("Save the Penguin")
-
-    # Now convert background safely
-        self.background = raw_background.convert()
+    def __init__(self, assets=None, pool_size=DEFAULT_POOL_SIZE, wave_size=(1, 3),
+                 vectorized=False, headless=False, input_source=None,
+                 ship_speed=(3, 6), damage=10, penguin_speed=5, dirty_rects=True,
+                 seed=None, rng=None, profile=None, profile_trace=None,
+                 asset_cache_dir=None, tick_rate=DEFAULT_TICK_RATE, max_fps=60,
+                 layers=DEFAULT_LAYERS, collision_mode=RECT, title_screen=False,
+                 level=None, window_size=None, render_backend=SOFTWARE,
+                 particles=True, particle_cap=DEFAULT_CAPACITY, snow=False):
+        """
+        Initialize game.
+
+        Args:
+            assets: AssetManager to load surfaces from (shared cache by default).
+            pool_size: number of ships preallocated for waves.
+            wave_size: (min, max) number of ships in a wave.
+            vectorized: store ships in an array-backed ShipFleet instead
+                of individual Ship objects (for very large waves).
+            headless: run without a window, fonts, or music. Use step()
+                or simulate() instead of run().
+            input_source: zero-argument callable returning an action
+                bitmask each tick (the game's event-driven InputState,
+                self.input, when None).
+            ship_speed: inclusive (min, max) ship speed in pixels per tick
+                (floats allow sub-pixel speeds).
+            damage: health lost per ship collision.
+            penguin_speed: penguin speed in pixels per tick (may be a float).
+            dirty_rects: only repaint and push the screen areas that
+                changed each frame instead of flipping the whole display.
+            seed: seed for this game's random numbers, from 0 to
+                MAX_SEED (drawn from the random module if None).
+            rng: random.Random to use instead of one seeded with seed.
+            profile: time every loop phase with a FrameProfiler (on by
+                default unless headless). F3 toggles the overlay.
+            profile_trace: CSV or JSON file the profiler trace is written
+                to when run() exits.
+            asset_cache_dir: folder for the on-disk cache of converted,
+                scaled sprites, so later launches skip decoding.
+            tick_rate: simulation ticks per second, independent of how
+                often frames are drawn.
+            max_fps: cap on drawn frames per second in run() (0 for
+                uncapped).
+            layers: render layer names from bottom to top (background,
+                entities, and HUD by default).
+            collision_mode: "rect" to collide bounding boxes, or "mask" to
+                also require opaque pixels of the sprites to overlap.
+            title_screen: show the title scene when run() starts.
+            level: Level, or path to a JSON level file, whose timeline
+                spawns the ships instead of random waves.
+            window_size: (width, height) of the window. The game still
+                runs in the background's logical size and is scaled to
+                fit (the background's size if None).
+            render_backend: "software" to draw with Surface blits, or
+                "texture" to draw with the SDL GPU renderer (dirty_rects
+                then has no effect).
+            particles: show explosion and splash effects (never in
+                headless games).
+            particle_cap: most particles alive at once.
+            snow: let snow fall over the game.
+        """
+        if collision_mode not in COLLISION_MODES:
+            raise ValueError(f"Unknown collision mode: {collision_mode}")
+        if render_backend not in RENDER_BACKENDS:
+            raise ValueError(f"Unknown render backend: {render_backend}")
+        self.collision_mode = collision_mode
+        self.headless = headless
+        self.input = InputState()
+        self.input_source = self.input if input_source is None else input_source
+        self.seed = random.getrandbits(32) if seed is None else check_seed(seed)
+        self.rng = random.Random(self.seed) if rng is None else rng
+        if profile is None:
+            profile = not headless
+        self.profiler = FrameProfiler() if profile else NullProfiler()
+        self.profile_trace = profile_trace
+        if headless or render_backend == TEXTURE:
+            # Nothing to convert to: headless games have no display and
+            # the texture backend uploads the surfaces as they are
+            default_assets = headless_assets
+        else:
+            default_assets = shared_assets
+        self.assets = default_assets if assets is None else assets
+        if not headless:
+            # Only what the first frame needs; the mixer starts in run()
+            pygame.display.init()
+            pygame.font.init()
+            pygame.joystick.init()
+            allow_input_events()
+        if asset_cache_dir is not None:
+            self.assets.cache_dir = asset_cache_dir
+
+    # Decode every image on background threads, and only wait for the
+    # background, which sets the window size
+        self.assets.prefetch([
+            ("GameplayBackground.PNG", None, OPAQUE),
+            ("PenguinCharacter.PNG", PENGUIN_SIZE),
+            ("Ship.PNG", SHIP_SIZE),
+        ])
+
+    # The logical size, which the game runs in, is the background size;
+    # the window may be any size
+        self.width, self.height = self.assets.native_size("GameplayBackground.PNG")
+        if headless or window_size is None:
+            window_size = (self.width, self.height)
+        self.viewport = Viewport((self.width, self.height), window_size)
+
+    # Create the window and the renderer for the chosen backend
+        self.render_backend = render_backend
+        if headless:
+            self.renderer = None
+            self.screen = None
+        else:
+            self.renderer = create_renderer(render_backend, self.viewport.output_size,
+                                            layers, dirty_rects)
+            self.screen = self.renderer.screen
+
+    # Now convert background safely, scale it to the window once, and show
+    # it as the first frame while the sprites finish decoding
+        self.background = self.viewport.scale_surface(
+            self.assets.get("GameplayBackground.PNG", pixel_format=OPAQUE)
+        )
+        if not headless:
+            self.renderer.background = self.background
+            self.renderer.viewport = self.viewport
+            self.renderer.show(self.background)
+    # Pin the sprites so spawning ships mid-game never touches the disk
+        self.assets.preload([
+            ("PenguinCharacter.PNG", PENGUIN_SIZE),
+            ("Ship.PNG", SHIP_SIZE),
+        ])
 
         self.clock = pygame.time.Clock()
+        self.audio = NullAudio()
+        self.sim_clock = SimulationClock(tick_rate)
+        self.max_fps = max_fps
         self.running = True
         self.game_over = False
+        self.damage = damage
+
+        # Per-game stats, reported by the batch runner
+        self.frame = 0
+        self.hits = 0
+        self.ships_dodged = 0
 
-        self.font = pygame.font.SysFont(None, 36)
+        self.font = None if headless else pygame.font.SysFont(None, 36)
+        self.text_cache = None if headless else TextCache(self.font)
+        self.game_over_overlay = None
 
         self.penguin = Penguin(
-        "PenguinCharacter.PNG", self.width, self.height
+        "PenguinCharacter.PNG", self.width, self.height, assets=self.assets,
+        speed=penguin_speed
         )
 
-        self.ships = []
+        if headless:
+            self.atlas = None
+        else:
+            self.atlas = SpriteAtlas({
+                "penguin": self.penguin.image,
+                "ship": self.assets.get("Ship.PNG", SHIP_SIZE),
+            }).variant(self.viewport.scale)
+            self.renderer.atlas = self.atlas
+
+        if headless or not particles:
+            self.particles = None
+        else:
+            self.particles = ParticleSystem(particle_cap, np.random.default_rng(self.seed))
+        self.snow = snow and self.particles is not None
+
+        self.wave_size = wave_size
+        self.collision_grid = SpatialHash()
+        ship_mask = self.assets.mask("Ship.PNG", SHIP_SIZE)
+        if vectorized:
+            self.ship_config = None
+            self.ship_pool = None
+            self.fleet = ShipFleet(
+                pool_size, self.width, self.height,
+                self.assets.get("Ship.PNG", SHIP_SIZE),
+                speed_range=ship_speed,
+                rng=np.random.default_rng(self.rng.getrandbits(64)),
+                mask=ship_mask
+            )
+            self.ships = self.fleet
+        else:
+            self.fleet = None
+            self.ship_config = ShipConfig(
+                self.assets.get("Ship.PNG", SHIP_SIZE), self.width,
+                speed_range=ship_speed, rng=self.rng, mask=ship_mask
+            )
+            self.ship_pool = ShipPool(
+                lambda: Ship("Ship.PNG", self.width, config=self.ship_config),
+                pool_size
+            )
+            self.ships = []
+
+        if isinstance(level, str):
+            level = Level.load(level)
+        self.level = level
+        self.timeline = None
+        self.compile_level()
         self.spawn_wave()
 
+        self.title_screen = title_screen
+        self.scenes = SceneStack()
+        self.scenes.push(PlayScene(self))
+
+    def start_audio(self):
+        """Start the music and the sound effects service."""
+        self.start_music()
+        self.audio = open_audio()
+
+    def start_music(self):
+        """Initialize the mixer and start the background music loop."""
         #Add music in a cont. loop
         try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
             pygame.mixer.music.load("music.mp3")
             pygame.mixer.music.set_volume(0.5)  # optional: adjust volume
             pygame.mixer.music.play(loops=-1, fade_ms=2000)
@@ -164,120 +540,364 @@ class Game:
             print(f"Music file not found or could not play: {e}")
 
 
+    def compile_level(self):
+        """
+        Roll the level's random spawns into a fresh timeline. The rolls
+        depend only on the seed, so the same seed gives the same level.
+        """
+        if self.level is None:
+            return
+        ship_width = self.assets.get("Ship.PNG", SHIP_SIZE).get_width()
+        self.timeline = self.level.compile(
+            self.width, ship_width, self.sim_clock.tick_rate,
+            np.random.default_rng(self.seed)
+        )
+
     def spawn_wave(self):
-        """Spawn a wave of 1–3 ships."""
-        self.ships.clear()
-        for _ in range(random.randint(1, 3)):
-            self.ships.append(Ship("Ship.PNG", self.width))
+        """
+        Recycle the current ships and spawn a new wave from the pool.
+
+        With a level, only the current ships are cleared; the level's
+        timeline decides when the next ones arrive.
+        """
+        if self.fleet is not None:
+            self.fleet.clear()
+            if self.timeline is None:
+                self.fleet.spawn(self.rng.randint(*self.wave_size))
+            return
+
+        self.ship_pool.release_all(self.ships)
+        if self.timeline is not None:
+            return
+        for _ in range(self.rng.randint(*self.wave_size)):
+            ship = self.ship_pool.acquire()
+            if ship is None:
+                break
+            self.ships.append(ship)
 
     def draw_background(self):
-        """Draw background."""
-        self.screen.blit(self.background, (0, 0))
+        """Draw background (only the dirty areas with the dirty-rect renderer)."""
+        self.renderer.clear()
 
     def draw_health(self):
-        """Draw health text."""
+        """Queue the health text on the HUD layer."""
         if self.penguin.health <= 20:
             color = (255, 0, 0)   # red
         else:
             color = (255, 255, 255)  # white
         
-        text = self.font.render(
-            f"Health: {self.penguin.health}", True, color
+        text = self.text_cache.render(
+            f"Health: {self.penguin.health}", color
         )
-        self.screen.blit(text, (10, 10))
+        self.renderer.queue(HUD, text, (10, 10))
 
     def handle_collisions(self):
-        """Handle collisions."""
-        for ship in self.ships:
-            if ship.check_collision(self.penguin.get_rect()):
-                self.penguin.take_damage(10)
-                self.spawn_wave()
+        """
+        Handle collisions.
+
+        Rects are always tested first; in mask mode, only the ships whose
+        rects overlap the penguin get the pixel-perfect check.
+        """
+        penguin_rect = self.penguin.get_rect()
+        if self.fleet is not None:
+            candidates = [self.fleet[i].get_rect()
+                          for i in self.fleet.collide_rect(penguin_rect)]
+        else:
+            ship_rects = [ship.get_rect() for ship in self.ships]
+            candidates = [
+                ship_rects[j]
+                for _, j in collide_pairs([penguin_rect], ship_rects, self.collision_grid)
+            ]
+
+        if self.collision_mode == MASK:
+            penguin_mask = self.penguin.mask
+            ship_mask = self.ship_config.mask if self.fleet is None else self.fleet.mask
+            hit = next((rect for rect in candidates
+                        if masks_overlap(penguin_rect, penguin_mask, rect, ship_mask)), None)
+        else:
+            hit = candidates[0] if candidates else None
+
+        if hit is not None:
+            if self.particles is not None:
+                self.particles.emit(EXPLOSION, *penguin_rect.clip(hit).center)
+            self.audio.play(HIT)
+            self.penguin.take_damage(self.damage)
+            self.hits += 1
+            self.spawn_wave()
+
+    def spawn_scheduled(self):
+        """Spawn the level timeline's ships that are due this tick."""
+        timeline = self.timeline
+        due = timeline.due(self.frame)
+        if due is None:
+            return
+        start, end = due
+        x, y, speed = timeline.x[start:end], timeline.y[start:end], timeline.speed[start:end]
+        if self.fleet is not None:
+            self.fleet.add(x, y, speed)
+            return
+        for ship_x, ship_y, ship_speed in zip(x.tolist(), y.tolist(), speed.tolist()):
+            ship = self.ship_pool.acquire(spawn=False)
+            if ship is None:
                 break
+            ship.place(ship_x, ship_y, ship_speed)
+            self.ships.append(ship)
 
     def update_ships(self):
-        """Update ships and waves."""
-        for ship in self.ships:
-            ship.update()
-
-        self.ships = [
-            ship for ship in self.ships
-            if not ship.is_off_screen(self.height)
-        ]
+        """
+        Update ships, recycle off-screen ones, and start new waves (or
+        spawn the level's scheduled ships).
+        """
+        particles = self.particles
+        if self.fleet is not None:
+            self.ships_dodged += self.fleet.update()
+            if particles is not None and len(self.fleet.gone_x):
+                particles.emit(SPLASH, self.fleet.gone_x, self.height)
+            if self.timeline is not None:
+                self.spawn_scheduled()
+            elif not self.fleet:
+                self.audio.play(WAVE)
+                self.spawn_wave()
+            return
 
-        if not self.ships:
+        ships = self.ships
+        live = 0
+        for ship in ships:
+            ship.update()
+            if ship.is_off_screen(self.height):
+                self.ship_pool.release(ship)
+                self.ships_dodged += 1
+                if particles is not None:
+                    particles.emit(SPLASH, ship.rect.centerx, self.height)
+            else:
+                ships[live] = ship
+                live += 1
+        del ships[live:]
+
+        if self.timeline is not None:
+            self.spawn_scheduled()
+        elif not ships:
+            self.audio.play(WAVE)
             self.spawn_wave()
 
+    def update_particles(self):
+        """Let snow fall and move every particle one tick."""
+        particles = self.particles
+        if self.snow and self.frame % SNOW_INTERVAL == 0:
+            particles.emit(SNOW, particles.rng.uniform(0, self.width), -SNOW.size)
+        particles.update()
+
     def check_game_over(self):
         """Check game over."""
-        if not self.penguin.is_alive():
+        if not self.penguin.is_alive() and not self.game_over:
             self.game_over = True
+            self.audio.play(GAME_OVER)
 
     def draw_game_over(self):
-        """Draw game over screen."""
-        line1 = self.font.render("Game Over!", True, (255, 255, 255))
-        line2 = self.font.render("Press R to Restart or Q to Quit", True, (255, 255, 255))
-
-        spacing = 10  
-
-        line1_rect = line1.get_rect(center=(self.width // 2, self.height // 2 - (line1.get_height() // 2 + spacing)))
-        line2_rect = line2.get_rect(center=(self.width // 2, self.height // 2 + (line2.get_height() // 2)))
-
-        self.screen.blit(line1, line1_rect)
-        self.screen.blit(line2, line2_rect)
-
+        """Queue the game over screen (composited once, then reused)."""
+        if self.game_over_overlay is None:
+            self.game_over_overlay = build_game_over_overlay(
+                self.font, *self.renderer.size
+            )
+
+        overlay, rect = self.game_over_overlay
+        self.renderer.queue(HUD, overlay, rect)
+
+
+    def reseed(self, seed):
+        """
+        Restart this game's random numbers from seed. Followed by
+        reset_game(), the game plays out like a new Game(seed=seed).
+        """
+        self.seed = check_seed(seed)
+        self.rng.seed(seed)
+        if self.fleet is not None:
+            self.fleet.rng = np.random.default_rng(self.rng.getrandbits(64))
+        self.compile_level()
 
     def reset_game(self):
         """Reset game."""
         self.penguin.reset()
+        if self.particles is not None:
+            self.particles.clear()
+        if self.timeline is not None:
+            self.timeline.reset()
         self.spawn_wave()
         self.game_over = False
-
-    def handle_events(self):
-        """Handle events."""
-        for event in pygame.event.get():
+        self.frame = 0
+        self.hits = 0
+        self.ships_dodged = 0
+
+    def handle_events(self, wait=False):
+        """
+        Drain the event queue once, update the input state, and pass each
+        event to the active scene.
+
+        Args:
+            wait: sleep until an event arrives (or IDLE_WAIT_MS passes)
+                instead of returning straight away when there is none.
+        """
+        events = pygame.event.get()
+        if wait and not events:
+            event = pygame.event.wait(IDLE_WAIT_MS)
+            if event.type != pygame.NOEVENT:
+                events = [event]
+        self.input.process(events)
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
-
-            if self.game_over and event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_r:
-                    self.reset_game()
-                elif event.key == pygame.K_q:
-                    self.running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.scenes.top.invalidate()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.toggle_overlay()
+            self.scenes.top.handle_event(event)
 
     def update(self):
-        """Update game state."""
+        """Update game state by one fixed tick."""
         if not self.game_over:
-            self.penguin.update()
-            self.update_ships()
-            self.handle_collisions()
+            profiler = self.profiler
+            actions = self.input_source() if self.input_source else None
+            self.penguin.update(actions)
+            with profiler.phase("update.ships"):
+                self.update_ships()
+            with profiler.phase("update.collisions"):
+                self.handle_collisions()
+            if self.particles is not None:
+                with profiler.phase("update.particles"):
+                    self.update_particles()
             self.check_game_over()
-
-    def draw(self):
-        """Draw everything."""
-        self.draw_background()
-        self.penguin.draw(self.screen)
-
-        for ship in self.ships:
-            ship.draw(self.screen)
-
-        self.draw_health()
+            self.frame += 1
+
+    def step(self, frames=1):
+        """
+        Advance the simulation by up to frames ticks as fast as possible,
+        with no drawing and no frame cap.
+
+        Returns:
+            int: number of ticks actually simulated (fewer if the game ended).
+        """
+        start = self.frame
+        for _ in range(frames):
+            if self.game_over:
+                break
+            self.update()
+        return self.frame - start
+
+    def simulate(self, max_frames):
+        """Run until game over or max_frames ticks, and return the tick count."""
+        self.step(max_frames)
+        return self.frame
+
+    def draw(self, alpha=1.0):
+        """
+        Draw everything.
+
+        Sprites (in logical coordinates, drawn from the sprite atlas) and
+        HUD text (in window coordinates) are queued on the renderer's
+        layers and drawn with one batched blit per layer.
+
+        Args:
+            alpha: fraction of a tick since the last update, used to
+                interpolate sprite positions between ticks.
+        """
+        renderer = self.renderer
+        profiler = self.profiler
+        with profiler.phase("draw.background"):
+            self.draw_background()
+
+        with profiler.phase("draw.sprites"):
+            renderer.queue_sprites(ENTITIES, [self.penguin.sprite(alpha)])
+            if self.fleet is not None:
+                renderer.queue_positions(ENTITIES, self.fleet.image,
+                                         *self.fleet.positions(alpha))
+            else:
+                renderer.queue_sprites(ENTITIES, [ship.sprite(alpha) for ship in self.ships])
+            if self.particles is not None:
+                self.particles.queue(renderer, ENTITIES, alpha)
+
+        with profiler.phase("draw.health"):
+            self.draw_health()
 
         if self.game_over:
             self.draw_game_over()
 
-        pygame.display.flip()
+        overlay = profiler.overlay(self.font, renderer.size[0])
+        if overlay is not None:
+            renderer.queue(HUD, *overlay)
+
+        with profiler.phase("draw.blits"):
+            renderer.flush()
+
+        with profiler.phase("draw.flip"):
+            renderer.present()
 
     def run(self):
-        """Run game loop."""
+        """
+        Run game loop.
+
+        The scene on top of self.scenes decides what happens each frame.
+        While playing, game logic advances in fixed ticks from sim_clock
+        and frames are drawn as fast as max_fps allows, so the game runs
+        at the same speed on any display rate. While a static scene
+        (pause, game over, title) is on screen and already drawn, the loop
+        sleeps until the next event, and the profiler skips that frame.
+        """
+        profiler = self.profiler
+        sim_clock = self.sim_clock
+        scenes = self.scenes
+        self.start_audio()
+        if self.title_screen:
+            scenes.push(TitleScene(self))
+        self.clock.tick()
         while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(60)
+            scene = scenes.top
+            idle = scene.idle
+            with profiler.phase("tick"):
+                elapsed = 0.0 if idle else self.clock.tick(self.max_fps) / 1000
+            with profiler.phase("events"):
+                self.handle_events(wait=idle)
+            scene = scenes.top
+            if scene.simulates:
+                with profiler.phase("update"):
+                    for _ in range(sim_clock.advance(elapsed)):
+                        scene.update()
+                        if scenes.top is not scene:
+                            break
+            with profiler.phase("draw"):
+                scenes.top.draw(sim_clock.alpha)
+            # A frame that slept waiting for events would record the wait
+            # as frame time
+            if idle:
+                profiler.skip_frame()
+            else:
+                profiler.end_frame()
+
+        self.audio.stop()
+        if self.profile_trace:
+            profiler.export(self.profile_trace)
 
         pygame.quit()
         sys.exit()
 
 
 if __name__ == "__main__":
-    Game().run()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Save the Penguin")
+    parser.add_argument("--profile-trace", help="write a frame-time trace (.csv or .json) on exit")
+    parser.add_argument("--asset-cache", default=DEFAULT_ASSET_CACHE_DIR,
+                        help="folder for pre-scaled sprite data (default: %(default)s)")
+    parser.add_argument("--no-title", action="store_true", help="skip the title screen")
+    parser.add_argument("--max-fps", type=int, default=60,
+                        help="frame rate cap, 0 for uncapped (default: %(default)s)")
+    parser.add_argument("--level", help="JSON level file to play instead of random waves")
+    parser.add_argument("--window", metavar="WIDTHxHEIGHT",
+                        help="window size; the game is scaled to fit (default: background size)")
+    parser.add_argument("--renderer", choices=RENDER_BACKENDS, default=SOFTWARE,
+                        help="drawing backend (default: %(default)s)")
+    parser.add_argument("--snow", action="store_true", help="let snow fall over the game")
+    args = parser.parse_args()
+    window_size = tuple(int(n) for n in args.window.split("x")) if args.window else None
+    Game(profile_trace=args.profile_trace, asset_cache_dir=args.asset_cache,
+         max_fps=args.max_fps, title_screen=not args.no_title, level=args.level,
+         window_size=window_size, render_backend=args.renderer, snow=args.snow).run()
@@ -0,0 +1,303 @@
+"""
+Shared image cache for Save the Penguin
+
+Every sprite and background surface is requested through an AssetManager
+instead of calling pygame.image.load directly. Each file is decoded once,
+and each (path, size, pixel format) variant is converted and scaled once,
+so building new ships mid-game never touches the disk.
+
+To shorten cold starts, prefetch() decodes images on a background thread
+pool while the game opens its window, and an optional on-disk cache keeps
+the pixels of every converted, scaled variant so the next launch can skip
+PNG decoding and scaling entirely.
+
+Collision masks for pixel-perfect collisions are built once per scaled
+sprite with mask() and cached alongside the surface they came from.
+"""
+
+import hashlib
+import os
+import pygame
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Pixel formats a cached surface can be stored in
+RAW = "raw"        # decoded straight from disk, no display conversion
+OPAQUE = "opaque"  # Surface.convert() for fast opaque blits
+ALPHA = "alpha"    # Surface.convert_alpha() for sprites with transparency
+
+# Pixel layout used to store each format in the disk cache
+DISK_MODES = {OPAQUE: "RGB", ALPHA: "RGBA"}
+
+
+class AssetManager:
+    """
+    Caches decoded, converted, and scaled surfaces keyed by
+    (path, size, pixel_format).
+
+    The cache holds at most max_entries surfaces and evicts the least
+    recently used one when full. Surfaces loaded through preload() are
+    pinned and never evicted.
+
+    With convert=False, OPAQUE and ALPHA requests skip display conversion,
+    so the cache works without a display mode (headless simulation).
+
+    When cache_dir is set, every OPAQUE or ALPHA surface requested through
+    get() is also written there as raw pixels, keyed by the source file's
+    modification time and size, and read back instead of being rebuilt.
+    """
+
+    def __init__(self, max_entries=64, convert=True, cache_dir=None, workers=4):
+        """Initialize an empty cache."""
+        self.max_entries = max_entries
+        self.convert = convert
+        self.cache_dir = cache_dir
+        self.workers = workers
+        self._surfaces = OrderedDict()
+        self._masks = {}
+        self._pinned = set()
+        self._pending = {}
+        self._executor = None
+
+    def get(self, path, size=None, pixel_format=ALPHA):
+        """
+        Return the surface for path, converted to pixel_format and
+        scaled to size (or left at native size when size is None).
+        """
+        return self._get(_key(path, size, pixel_format), persist=True)
+
+    def mask(self, path, size=None, pixel_format=ALPHA):
+        """
+        Return the pygame.mask.Mask of the opaque pixels of get(path,
+        size, pixel_format), built on first use and cached with it.
+        """
+        key = _key(path, size, pixel_format)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = pygame.mask.from_surface(self._get(key, persist=True))
+            self._masks[key] = mask
+        return mask
+
+    def prefetch(self, specs):
+        """
+        Start reading every asset in specs on the background thread pool.
+
+        Only file reads and PNG decoding happen off the main thread;
+        conversion and scaling still happen in get(), which waits for the
+        prefetched data if it is not ready yet.
+
+        Args:
+            specs: iterable of (path, size) or (path, size, pixel_format).
+        """
+        for spec in specs:
+            key = _key(*spec)
+            if key in self._surfaces or key in self._pending:
+                continue
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="assets"
+                )
+            self._pending[key] = self._executor.submit(self._fetch, key)
+
+    def native_size(self, path):
+        """
+        Return the (width, height) of path as stored on disk.
+
+        Uses a cached or prefetched copy when there is one, so the size is
+        known before the display exists and before anything is converted.
+        """
+        raw = self._surfaces.get((path, None, RAW))
+        if raw is not None:
+            return raw.get_size()
+
+        for pixel_format in (OPAQUE, ALPHA):
+            key = (path, None, pixel_format)
+            if key in self._surfaces:
+                return self._surfaces[key].get_size()
+            pending = self._pending.get(key)
+            if pending is not None:
+                kind, data = pending.result()
+                return data.get_size() if kind == "raw" else data[0]
+
+        return self._get((path, None, RAW)).get_size()
+
+    def preload(self, specs):
+        """
+        Load and pin every asset in specs.
+
+        Args:
+            specs: iterable of (path, size) or (path, size, pixel_format).
+        """
+        specs = [_key(*spec) for spec in specs]
+        self.prefetch(specs)
+        for key in specs:
+            self._get(key, persist=True)
+            self._pinned.add(key)
+
+    def clear(self):
+        """Drop every cached surface, including pinned ones."""
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._surfaces.clear()
+        self._masks.clear()
+        self._pinned.clear()
+
+    def __contains__(self, key):
+        return key in self._surfaces
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def _get(self, key, persist=False):
+        """
+        Return the surface for key from memory, a prefetch, the disk
+        cache, or by building it, in that order.
+
+        Only surfaces fetched with persist=True are written to the disk
+        cache, so intermediate native-size conversions stay in memory.
+        """
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+
+        pending = self._pending.pop(key, None)
+        if pending is not None:
+            kind, data = pending.result()
+        else:
+            kind, data = "disk", self._read_disk(key)
+
+        if kind == "raw":
+            # The worker decoded the source file; keep it for _build()
+            raw_key = (key[0], None, RAW)
+            self._store(raw_key, data)
+            if key == raw_key:
+                return data
+        elif data is not None:
+            surface = self._from_pixels(key, data)
+
+        if surface is None:
+            surface = self._build(*key)
+            if persist:
+                self._write_disk(key, surface)
+
+        self._store(key, surface)
+        return surface
+
+    def _build(self, path, size, pixel_format):
+        """Create a surface from the nearest cached ancestor."""
+        if pixel_format == RAW and size is None:
+            return pygame.image.load(path)
+
+        if size is not None:
+            # Scale from the converted native-size surface so the
+            # conversion is shared between every size of the same image
+            native = self._get((path, None, pixel_format))
+            return pygame.transform.scale(native, size)
+
+        raw = self._get((path, None, RAW))
+        if not self.convert:
+            return raw
+        if pixel_format == OPAQUE:
+            return raw.convert()
+        if pixel_format == ALPHA:
+            return raw.convert_alpha()
+        return raw
+
+    def _store(self, key, surface):
+        """Insert surface and evict unpinned entries over the bound."""
+        self._surfaces[key] = surface
+        if len(self._surfaces) <= self.max_entries:
+            return
+
+        for old_key in list(self._surfaces):
+            if len(self._surfaces) <= self.max_entries:
+                break
+            if old_key in self._pinned or old_key == key:
+                continue
+            del self._surfaces[old_key]
+            self._masks.pop(old_key, None)
+
+    def _fetch(self, key):
+        """
+        Background thread: read cached pixels for key, or decode the file.
+
+        Returns:
+            tuple: ("disk", (size, bytes)) or ("raw", decoded surface).
+        """
+        data = self._read_disk(key)
+        if data is not None:
+            return "disk", data
+        return "raw", pygame.image.load(key[0])
+
+    def _disk_path(self, key):
+        """Return the cache file for key, or None if it cannot be cached."""
+        path, size, pixel_format = key
+        if self.cache_dir is None or pixel_format not in DISK_MODES:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        ident = f"{path}|{size}|{pixel_format}|{stat.st_mtime_ns}|{stat.st_size}"
+        name = hashlib.sha1(ident.encode()).hexdigest()
+        return os.path.join(self.cache_dir, name + ".px")
+
+    def _read_disk(self, key):
+        """Return ((width, height), pixel bytes) from the disk cache, or None."""
+        cache_path = self._disk_path(key)
+        if cache_path is None:
+            return None
+        try:
+            with open(cache_path, "rb") as f:
+                header = f.read(8)
+                pixels = f.read()
+        except OSError:
+            return None
+        width = int.from_bytes(header[:4], "little")
+        height = int.from_bytes(header[4:], "little")
+        if len(pixels) != width * height * len(DISK_MODES[key[2]]):
+            return None
+        return (width, height), pixels
+
+    def _write_disk(self, key, surface):
+        """Store surface's pixels in the disk cache (best effort)."""
+        cache_path = self._disk_path(key)
+        if cache_path is None:
+            return
+        width, height = surface.get_size()
+        pixels = pygame.image.tobytes(surface, DISK_MODES[key[2]])
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(width.to_bytes(4, "little") + height.to_bytes(4, "little"))
+                f.write(pixels)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            pass
+
+    def _from_pixels(self, key, data):
+        """Rebuild a surface from disk cache pixels."""
+        size, pixels = data
+        surface = pygame.image.frombytes(pixels, size, DISK_MODES[key[2]])
+        if not self.convert:
+            return surface
+        if key[2] == OPAQUE:
+            return surface.convert()
+        return surface.convert_alpha()
+
+
+def _key(path, size=None, pixel_format=ALPHA):
+    """Return the cache key for an asset spec."""
+    return (path, tuple(size) if size else None, pixel_format)
+
+
+# Process-wide cache shared by Penguin, Ship, and Game
+shared_assets = AssetManager()
+
+# Process-wide cache for games with no display surface to convert to (headless
+# games and the texture render backend)
+headless_assets = AssetManager(convert=False)
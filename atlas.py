@@ -0,0 +1,130 @@
+"""
+Sprite atlas and logical coordinates for Save the Penguin
+
+The game simulates in a fixed logical coordinate space, the size of the
+background image, whatever the size of the window. A Viewport maps that
+space onto the window: one uniform scale, centred, with black bars when
+the aspect ratios differ.
+
+SpriteAtlas packs the penguin and ship sprites into one surface. Each
+scale gets its own atlas built once by variant(scale), with every sprite
+smooth-scaled from its logical-size source, so drawing never scales
+anything and each sprite exists once per scale. A sprite is drawn as an
+area blit out of the atlas surface.
+"""
+
+import pygame
+
+
+class Viewport:
+    """Maps logical coordinates onto a window of a different size."""
+
+    def __init__(self, logical_size, output_size):
+        """
+        Initialize the mapping.
+
+        Args:
+            logical_size: (width, height) the game simulates in.
+            output_size: (width, height) of the window.
+        """
+        self.logical_size = tuple(logical_size)
+        self.output_size = tuple(output_size)
+        width, height = self.logical_size
+        out_width, out_height = self.output_size
+        self.scale = min(out_width / width, out_height / height)
+        self.offset = (round((out_width - width * self.scale) / 2),
+                       round((out_height - height * self.scale) / 2))
+        self.identity = self.scale == 1.0 and self.offset == (0, 0)
+
+    def to_output(self, pos):
+        """Return the window position of a logical (x, y) position."""
+        scale = self.scale
+        return (self.offset[0] + round(pos[0] * scale),
+                self.offset[1] + round(pos[1] * scale))
+
+    def scale_surface(self, surface, fill=(0, 0, 0)):
+        """
+        Return surface (logical size) scaled to cover the viewport, on a
+        window-size surface with fill in the bars.
+        """
+        if self.identity:
+            return surface
+        width, height = self.logical_size
+        scaled = pygame.transform.smoothscale(
+            surface, (round(width * self.scale), round(height * self.scale))
+        )
+        output = pygame.Surface(self.output_size)
+        output.fill(fill)
+        output.blit(scaled, self.offset)
+        return output
+
+
+class SpriteAtlas:
+    """
+    Named sprites packed into one surface at one scale.
+
+    areas maps each name to its area in surface, and lookup maps each
+    logical-size source surface to the same area, so a sprite blit
+    (image, pos) can be swapped for (atlas.surface, pos, area).
+    """
+
+    def __init__(self, sprites, scale=1.0, max_width=1024):
+        """
+        Pack sprites.
+
+        Args:
+            sprites: dict of name to logical-size surface.
+            scale: size of the packed sprites relative to the sources.
+            max_width: width past which a new row of sprites is started.
+        """
+        self.sprites = dict(sprites)
+        self.scale = scale
+        self._variants = {scale: self}
+
+        scaled = {name: self._scaled(surface) for name, surface in self.sprites.items()}
+        self.areas = _pack({name: surface.get_size() for name, surface in scaled.items()},
+                           max_width)
+        width = max((area.right for area in self.areas.values()), default=1)
+        height = max((area.bottom for area in self.areas.values()), default=1)
+
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+        self.surface.fill((0, 0, 0, 0))
+        for name, surface in scaled.items():
+            self.surface.blit(surface, self.areas[name])
+        self.lookup = {self.sprites[name]: area for name, area in self.areas.items()}
+
+    def _scaled(self, surface):
+        """Return surface at this atlas's scale."""
+        if self.scale == 1.0:
+            return surface
+        width, height = surface.get_size()
+        size = (max(1, round(width * self.scale)), max(1, round(height * self.scale)))
+        return pygame.transform.smoothscale(surface, size)
+
+    def variant(self, scale):
+        """Return the atlas of the same sprites at scale (built on first use)."""
+        atlas = self._variants.get(scale)
+        if atlas is None:
+            atlas = SpriteAtlas(self.sprites, scale)
+            atlas._variants = self._variants
+            self._variants[scale] = atlas
+        return atlas
+
+
+def _pack(sizes, max_width):
+    """
+    Shelf-pack sizes (dict of name to (width, height)), tallest first,
+    and return a dict of name to Rect.
+    """
+    areas = {}
+    x = y = shelf_height = 0
+    for name, (width, height) in sorted(sizes.items(), key=lambda item: -item[1][1]):
+        if x and x + width > max_width:
+            x, y = 0, y + shelf_height
+            shelf_height = 0
+        areas[name] = pygame.Rect(x, y, width, height)
+        x += width
+        shelf_height = max(shelf_height, height)
+    return areas
@@ -0,0 +1,165 @@
+"""
+Sound effects for Save the Penguin
+
+AudioService loads every sound effect into a pygame.mixer.Sound once,
+reserves a small pool of mixer channels for them, and plays them from a
+background thread. The game loop only calls play(name), which puts the
+name on a queue.SimpleQueue and returns immediately, so a hit or a new
+wave never stalls a frame. When every reserved channel is busy, the
+sound that has been playing longest is cut off (voice stealing).
+
+Sound files that are missing are replaced by a short generated tone, so
+the effects work before real sounds are added. NullAudio has the same
+interface and does nothing; open_audio() returns it when there is no
+audio device, as on headless servers.
+"""
+
+import os
+import threading
+import time
+from queue import SimpleQueue
+
+import numpy as np
+import pygame
+
+
+# Sound effect names
+HIT = "hit"
+WAVE = "wave"
+GAME_OVER = "game_over"
+
+SOUND_FILES = {
+    HIT: "hit.wav",
+    WAVE: "wave.wav",
+    GAME_OVER: "game_over.wav",
+}
+
+# (frequency in Hz, length in ms) of the tone used when a file is missing
+FALLBACK_TONES = {
+    HIT: (220, 120),
+    WAVE: (660, 80),
+    GAME_OVER: (110, 600),
+}
+
+DEFAULT_CHANNELS = 4
+
+_STOP = object()
+
+
+class AudioService:
+    """
+    Plays preloaded sound effects on reserved channels from a worker thread.
+
+    The mixer must already be initialized (see open_audio).
+    """
+
+    def __init__(self, sound_files=None, channels=DEFAULT_CHANNELS, volume=0.6):
+        """
+        Load every sound and start the worker thread.
+
+        Args:
+            sound_files: effect name -> file path (SOUND_FILES by default).
+            channels: number of mixer channels reserved for effects.
+            volume: volume of every effect, from 0.0 to 1.0.
+
+        Raises:
+            pygame.error: if the mixer is not initialized.
+        """
+        sound_files = SOUND_FILES if sound_files is None else sound_files
+        if pygame.mixer.get_num_channels() < channels:
+            pygame.mixer.set_num_channels(channels)
+        pygame.mixer.set_reserved(channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(channels)]
+        self._started = [0.0] * channels
+
+        self.sounds = {}
+        for name, path in sound_files.items():
+            sound = _load_sound(name, path)
+            if sound is not None:
+                sound.set_volume(volume)
+                self.sounds[name] = sound
+
+        self._requests = SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="audio", daemon=True)
+        self._thread.start()
+
+    def play(self, name):
+        """Queue a sound effect by name. Never blocks."""
+        self._requests.put(name)
+
+    def stop(self):
+        """Finish the queued requests and stop the worker thread."""
+        if self._thread.is_alive():
+            self._requests.put(_STOP)
+            self._thread.join()
+
+    def _run(self):
+        """Worker thread: play each queued sound until stop()."""
+        while True:
+            name = self._requests.get()
+            if name is _STOP:
+                return
+            sound = self.sounds.get(name)
+            if sound is not None:
+                self._play(sound)
+
+    def _play(self, sound):
+        """Play sound on a free channel, or steal the oldest one."""
+        index = None
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                index = i
+                break
+        if index is None:
+            index = self._started.index(min(self._started))
+        self.channels[index].play(sound)
+        self._started[index] = time.monotonic()
+
+
+class NullAudio:
+    """Audio service with the AudioService interface that plays nothing."""
+
+    def play(self, name):
+        pass
+
+    def stop(self):
+        pass
+
+
+def open_audio(sound_files=None, channels=DEFAULT_CHANNELS):
+    """
+    Return an AudioService, or NullAudio if the mixer is not running or
+    the sounds cannot be set up.
+    """
+    if not pygame.mixer.get_init():
+        return NullAudio()
+    try:
+        return AudioService(sound_files, channels)
+    except pygame.error as e:
+        print(f"Sound effects disabled: {e}")
+        return NullAudio()
+
+
+def _load_sound(name, path):
+    """Load path, or generate the fallback tone for name if it is missing."""
+    if os.path.exists(path):
+        return pygame.mixer.Sound(path)
+    if name in FALLBACK_TONES:
+        return _tone(*FALLBACK_TONES[name])
+    return None
+
+
+def _tone(frequency, length_ms):
+    """
+    Return a short sine tone with a linear fade out, or None if the mixer
+    is not using signed 16-bit samples.
+    """
+    rate, size, channels = pygame.mixer.get_init()
+    if size != -16:
+        return None
+    t = np.arange(rate * length_ms // 1000) / rate
+    wave = np.sin(2 * np.pi * frequency * t) * np.linspace(1.0, 0.0, len(t))
+    samples = (wave * 12000).astype(np.int16)
+    if channels > 1:
+        samples = np.repeat(samples[:, None], channels, axis=1)
+    return pygame.sndarray.make_sound(np.ascontiguousarray(samples))
@@ -0,0 +1,231 @@
+"""
+Parallel batch runner for Save the Penguin balancing sweeps
+
+Runs N seeds x M parameter sets as headless games spread across a
+process pool and writes one CSV row of stats per game.
+
+Run with:
+    python batch.py --seeds 200 --params sweep.json --workers 8 --out results.csv
+
+A parameter file is a JSON list of objects whose keys are Game keyword
+arguments, for example:
+    [{"ship_speed": [3, 6], "wave_size": [1, 3], "damage": 10, "penguin_speed": 5},
+     {"ship_speed": [4, 8], "wave_size": [2, 5], "damage": 10, "penguin_speed": 6}]
+"""
+
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from controls import LEFT, RIGHT
+from SaveThePenguin import Game
+
+
+DEFAULT_MAX_FRAMES = 60 * 60 * 5  # five minutes of play at 60 ticks/sec
+PARAM_KEYS = ("ship_speed", "wave_size", "damage", "penguin_speed")
+STAT_KEYS = ("frames", "hits", "ships_dodged")
+
+
+#Bot policies: each takes (game, rng) and returns an input source
+
+def idle_policy(game, rng):
+    """Never move."""
+    return lambda: 0
+
+
+def random_policy(game, rng):
+    """Hold a random direction for a random number of frames."""
+    state = {"action": 0, "frames_left": 0}
+    choices = (0, LEFT, RIGHT)
+
+    def act():
+        if state["frames_left"] <= 0:
+            state["action"] = rng.choice(choices)
+            state["frames_left"] = rng.randint(5, 30)
+        state["frames_left"] -= 1
+        return state["action"]
+
+    return act
+
+
+def dodge_policy(game, rng):
+    """Sidestep the lowest ship that is falling toward the penguin."""
+    def act():
+        penguin = game.penguin.get_rect()
+        threat = None
+        for ship in game.ships:
+            rect = ship.get_rect()
+            if (rect.bottom <= penguin.bottom
+                    and rect.right > penguin.left - 20
+                    and rect.left < penguin.right + 20
+                    and (threat is None or rect.bottom > threat.bottom)):
+                threat = rect
+        if threat is None:
+            return 0
+        if penguin.left <= 0:
+            return RIGHT
+        if penguin.right >= game.width:
+            return LEFT
+        return LEFT if threat.centerx >= penguin.centerx else RIGHT
+
+    return act
+
+
+POLICIES = {
+    "idle": idle_policy,
+    "random": random_policy,
+    "dodge": dodge_policy,
+}
+
+
+def run_game(seed, params, max_frames=DEFAULT_MAX_FRAMES, policy="dodge"):
+    """
+    Play one headless game to game over (or max_frames) and return its stats.
+
+    Args:
+        seed: seed for the game and the bot.
+        params: dict of Game keyword arguments.
+        max_frames: tick limit for the game.
+        policy: name of the bot policy in POLICIES.
+
+    Returns:
+        dict: frames survived, hits taken, and ships dodged.
+    """
+    game = Game(headless=True, seed=seed, **params)
+    game.input_source = POLICIES[policy](game, random.Random(seed))
+    game.simulate(max_frames)
+    return {
+        "frames": game.frame,
+        "hits": game.hits,
+        "ships_dodged": game.ships_dodged,
+    }
+
+
+def _run_task(task):
+    """Process pool entry point: run one (param_set, seed) game."""
+    index, seed, params, max_frames, policy = task
+    stats = run_game(seed, params, max_frames, policy)
+    return index, seed, stats
+
+
+def run_batch(seeds, param_sets, max_frames=DEFAULT_MAX_FRAMES, policy="dodge",
+              workers=None):
+    """
+    Run every seed against every parameter set.
+
+    Args:
+        seeds: iterable of integer seeds.
+        param_sets: list of dicts of Game keyword arguments.
+        max_frames: tick limit per game.
+        policy: name of the bot policy in POLICIES.
+        workers: number of worker processes (all cores if None, 1 to
+            run in this process).
+
+    Returns:
+        list: (param_set_index, seed, stats) tuples in task order.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy: {policy}")
+
+    tasks = [
+        (index, seed, params, max_frames, policy)
+        for index, params in enumerate(param_sets)
+        for seed in seeds
+    ]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return [_run_task(task) for task in tasks]
+
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_run_task, tasks, chunksize=chunksize))
+
+
+def _flatten_params(params):
+    """Split (min, max) parameters into two columns for the CSV."""
+    row = {}
+    for key in PARAM_KEYS:
+        value = params.get(key, "")
+        if isinstance(value, (list, tuple)):
+            row[f"{key}_min"], row[f"{key}_max"] = value
+        else:
+            row[key] = value
+    return row
+
+
+def write_results(path, results, param_sets):
+    """Write one CSV row per game: parameter set, seed, params, and stats."""
+    rows = []
+    for index, seed, stats in results:
+        row = {"param_set": index, "seed": seed}
+        row.update(_flatten_params(param_sets[index]))
+        row.update(stats)
+        rows.append(row)
+
+    fieldnames = []
+    for row in rows:
+        for key in row:
+            if key not in fieldnames:
+                fieldnames.append(key)
+
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def summarize(results, param_count):
+    """Return the mean of every stat per parameter set."""
+    totals = [dict.fromkeys(STAT_KEYS, 0) for _ in range(param_count)]
+    counts = [0] * param_count
+    for index, _, stats in results:
+        counts[index] += 1
+        for key in STAT_KEYS:
+            totals[index][key] += stats[key]
+    return [
+        {key: total[key] / count for key in STAT_KEYS} if count else {}
+        for total, count in zip(totals, counts)
+    ]
+
+
+def load_param_sets(path):
+    """Read a JSON list of Game keyword argument dicts."""
+    with open(path) as f:
+        param_sets = json.load(f)
+    for params in param_sets:
+        for key, value in params.items():
+            if isinstance(value, list):
+                params[key] = tuple(value)
+    return param_sets
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Run headless Save the Penguin games in parallel.")
+    parser.add_argument("--seeds", type=int, default=100, help="number of seeds per parameter set")
+    parser.add_argument("--first-seed", type=int, default=0, help="first seed to run")
+    parser.add_argument("--params", help="JSON file with a list of parameter sets")
+    parser.add_argument("--max-frames", type=int, default=DEFAULT_MAX_FRAMES)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="dodge")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--out", default="results.csv", help="CSV file to write")
+    args = parser.parse_args(argv)
+
+    param_sets = load_param_sets(args.params) if args.params else [{}]
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+
+    results = run_batch(seeds, param_sets, args.max_frames, args.policy, args.workers)
+    write_results(args.out, results, param_sets)
+
+    for index, means in enumerate(summarize(results, len(param_sets))):
+        print(f"set {index}: " + ", ".join(f"{k}={v:.1f}" for k, v in means.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Benchmark for Save the Penguin collision detection
+
+Compares the original per-ship check_collision loop against
+collide_pairs() (collidelistall or spatial hash) and the vectorized
+ShipFleet.collide_rect for a range of ship and actor counts.
+
+Run with:
+    python bench_collision.py
+"""
+
+import random
+import timeit
+
+import pygame
+
+from collision import SpatialHash, collide_pairs
+from fleet import ShipFleet
+
+
+WIDTH, HEIGHT = 1200, 800
+SHIP_COUNTS = (3, 100, 1000, 10000)
+ACTOR_COUNTS = (1, 50, 500)
+
+
+def make_rects(count, size, rng):
+    """Return count random rects of the given size on screen."""
+    return [
+        pygame.Rect(rng.randint(0, WIDTH - size), rng.randint(0, HEIGHT - size), size, size)
+        for _ in range(count)
+    ]
+
+
+def loop_pairs(actors, ships):
+    """The original handle_collisions strategy: one colliderect per pair."""
+    return [
+        (i, j)
+        for i, actor in enumerate(actors)
+        for j, ship in enumerate(ships)
+        if ship.colliderect(actor)
+    ]
+
+
+def time_call(func, repeat=5):
+    """Return the best per-call time in microseconds."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number * 1e6
+
+
+def main():
+    """Print a table of per-frame collision costs."""
+    rng = random.Random(0)
+    grid = SpatialHash()
+    print(f"{'ships':>7} {'actors':>7} {'loop us':>10} {'pairs us':>10} {'hash us':>10} {'fleet us':>10}")
+
+    for ship_count in SHIP_COUNTS:
+        ships = make_rects(ship_count, 65, rng)
+        fleet = ShipFleet(ship_count, WIDTH, HEIGHT, pygame.Surface((65, 65)))
+        fleet.spawn(ship_count)
+        fleet.x[:ship_count] = [r.x for r in ships]
+        fleet.y[:ship_count] = [r.y for r in ships]
+
+        for actor_count in ACTOR_COUNTS:
+            actors = make_rects(actor_count, 75, rng)
+            expected = loop_pairs(actors, ships)
+            assert collide_pairs(actors, ships, grid) == expected
+            assert collide_pairs(actors, ships, grid, small_n=0, min_grid_queries=0) == expected
+
+            loop_us = time_call(lambda: loop_pairs(actors, ships))
+            pairs_us = time_call(lambda: collide_pairs(actors, ships, grid))
+            hash_us = time_call(lambda: collide_pairs(actors, ships, grid, small_n=0, min_grid_queries=0))
+            fleet_us = time_call(lambda: [fleet.collide_rect(a) for a in actors])
+            print(f"{ship_count:>7} {actor_count:>7} {loop_us:>10.1f} {pairs_us:>10.1f} "
+                  f"{hash_us:>10.1f} {fleet_us:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Shared fixtures for the Save the Penguin benchmark suite
+
+The benchmarks reuse the pygame mocks from the top-level conftest.py and
+run on SDL's dummy video and audio drivers, so they work on machines with
+no display or sound card. The real image loading and scaling functions
+are saved here, before any mock is applied, for the benchmarks that have
+to measure them.
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pytest
+import pygame
+from unittest.mock import patch
+
+from SaveThePenguin import Game
+
+
+REAL_IMAGE_LOAD = pygame.image.load
+REAL_TRANSFORM_SCALE = pygame.transform.scale
+
+
+@pytest.fixture
+def real_assets():
+    """Undo the image mocks so asset benchmarks decode the real files."""
+    with patch("pygame.image.load", REAL_IMAGE_LOAD), \
+         patch("pygame.transform.scale", REAL_TRANSFORM_SCALE):
+        yield
+
+
+@pytest.fixture
+def make_game():
+    """
+    Factory for a game with a fixed wave of ship_count ships.
+
+    The penguin cannot die, so a benchmark never stops simulating
+    partway through its rounds.
+    """
+    def build(ship_count, vectorized=False, **kwargs):
+        game = Game(
+            seed=1234, pool_size=ship_count, wave_size=(ship_count, ship_count),
+            vectorized=vectorized, profile=False, input_source=lambda: 0, **kwargs
+        )
+        game.penguin.health = float("inf")
+        return game
+
+    return build
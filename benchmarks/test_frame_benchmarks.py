@@ -0,0 +1,147 @@
+"""
+Per-frame hot path benchmarks for Save the Penguin
+
+Run with:
+    python -m pytest benchmarks --benchmark-only
+
+Each benchmark reports its rate in operations per second, which for the
+update and draw benchmarks is frames per second.
+"""
+
+import numpy as np
+import pygame
+import pytest
+from assets import AssetManager, OPAQUE, RAW
+from particles import ParticleSystem, Effect, EXPLOSION
+from render import FullScreenRenderer, ENTITIES
+from snapshot import snapshot, restore
+from SaveThePenguin import Game, PENGUIN_SIZE, SHIP_SIZE
+
+
+SHIP_COUNTS = (3, 100, 1000, 10000)
+SHIP_MODES = ("objects", "vectorized")
+
+
+#Frame Loop Benchmarks
+
+@pytest.mark.parametrize("mode", SHIP_MODES)
+@pytest.mark.parametrize("ship_count", SHIP_COUNTS)
+def test_update_fps(benchmark, make_game, ship_count, mode):
+    """Frames per second for Game.update() alone."""
+    game = make_game(ship_count, vectorized=mode == "vectorized")
+    benchmark.group = f"update-{mode}"
+    benchmark.extra_info["ships"] = ship_count
+    benchmark(game.update)
+
+@pytest.mark.parametrize("mode", SHIP_MODES)
+@pytest.mark.parametrize("ship_count", SHIP_COUNTS)
+def test_update_and_draw_fps(benchmark, make_game, ship_count, mode):
+    """Frames per second for Game.update() followed by Game.draw()."""
+    game = make_game(ship_count, vectorized=mode == "vectorized")
+    benchmark.group = f"update+draw-{mode}"
+    benchmark.extra_info["ships"] = ship_count
+
+    def frame():
+        game.update()
+        game.draw()
+
+    benchmark(frame)
+
+
+#Hot Path Benchmarks
+
+@pytest.mark.parametrize("ship_count", SHIP_COUNTS)
+def test_spawn_wave(benchmark, make_game, ship_count):
+    """Cost of recycling the current wave and spawning a new one."""
+    game = make_game(ship_count)
+    benchmark.group = "spawn_wave"
+    benchmark.extra_info["ships"] = ship_count
+    benchmark(game.spawn_wave)
+
+@pytest.mark.parametrize("ship_count", SHIP_COUNTS)
+def test_handle_collisions(benchmark, make_game, ship_count):
+    """Cost of the per-frame collision check with no hits."""
+    game = make_game(ship_count)
+    for ship in game.ships:
+        ship.rect.y = -500
+    benchmark.group = "handle_collisions"
+    benchmark.extra_info["ships"] = ship_count
+    benchmark(game.handle_collisions)
+
+@pytest.mark.parametrize("collision_mode", ("rect", "mask"))
+@pytest.mark.parametrize("overlap", ("none", "corner"))
+def test_collision_modes(benchmark, make_game, real_assets, collision_mode, overlap):
+    """
+    Rect-only against pixel-perfect collisions with the real sprites.
+
+    With no overlap the mask check never runs; with a corner overlap it
+    runs once per frame and finds only transparent pixels. Hits do not
+    respawn the wave, so every round tests the same positions.
+    """
+    game = make_game(100, collision_mode=collision_mode)
+    game.spawn_wave = lambda: None
+    for ship in game.ships:
+        ship.rect.y = -500
+    if overlap == "corner":
+        penguin = game.penguin.get_rect()
+        game.ships[0].rect.topleft = (penguin.right - 3, penguin.bottom - 3)
+    benchmark.group = f"collision-{overlap}"
+    benchmark.extra_info["mode"] = collision_mode
+    benchmark(game.handle_collisions)
+
+@pytest.mark.parametrize("mode", SHIP_MODES)
+@pytest.mark.parametrize("ship_count", (3, 100, 1000))
+def test_snapshot_restore(benchmark, make_game, ship_count, mode):
+    """Forks per second: restoring one snapshot, as a search bot would."""
+    game = make_game(ship_count, vectorized=mode == "vectorized")
+    data = snapshot(game)
+    benchmark.group = f"snapshot-restore-{mode}"
+    benchmark.extra_info["ships"] = ship_count
+    benchmark.extra_info["bytes"] = len(data)
+    benchmark(restore, game, data)
+
+
+#Effects Benchmarks
+
+@pytest.mark.parametrize("particle_count", (500, 4096))
+def test_particles_frame(benchmark, particle_count):
+    """Per-frame cost of moving, culling, and drawing a full particle system."""
+    screen = pygame.Surface((800, 600))
+    renderer = FullScreenRenderer(screen, pygame.Surface((800, 600)))
+    particles = ParticleSystem(particle_count, rng=np.random.default_rng(0))
+    burst = Effect(particle_count, (0.5, 3.0), (10**6, 10**6), EXPLOSION.colors)
+
+    def frame():
+        particles.clear()
+        particles.emit(burst, 400, 300)
+        particles.update()
+        particles.queue(renderer, ENTITIES, 0.5)
+        renderer.flush()
+
+    benchmark.group = "particles"
+    benchmark.extra_info["particles"] = particle_count
+    benchmark(frame)
+
+
+#Startup Benchmarks
+
+def test_asset_load(benchmark, real_assets):
+    """Decoding, converting, and scaling every image from disk."""
+    def load():
+        assets = AssetManager()
+        assets.get("GameplayBackground.PNG", pixel_format=RAW)
+        assets.get("GameplayBackground.PNG", pixel_format=OPAQUE)
+        assets.get("PenguinCharacter.PNG", PENGUIN_SIZE)
+        assets.get("Ship.PNG", SHIP_SIZE)
+
+    benchmark.group = "startup"
+    benchmark.pedantic(load, rounds=5, iterations=1)
+
+def test_startup(benchmark, real_assets):
+    """Time from Game() to a game ready for its first frame, cold cache."""
+    def setup():
+        from assets import shared_assets
+        shared_assets.clear()
+
+    benchmark.group = "startup"
+    benchmark.pedantic(lambda: Game(profile=False), setup=setup, rounds=5, iterations=1)
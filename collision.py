@@ -0,0 +1,134 @@
+"""
+Broad-phase collision detection for Save the Penguin
+
+SpatialHash buckets rects into a uniform grid so a query only tests the
+rects that share a cell with it, instead of every rect in the game.
+collide_pairs() is the batch entry point used by Game.handle_collisions:
+it returns every overlapping (a, b) pair and falls back to pygame's
+Rect.collidelistall when there are too few rects for the grid to pay off.
+
+In MASK mode, rect overlaps found by the broad phase are confirmed with
+masks_overlap(), a pixel-perfect narrow phase that ignores transparent
+pixels. It only runs for pairs whose rects already overlap.
+"""
+
+from collections import defaultdict
+
+
+DEFAULT_CELL_SIZE = 128
+
+# Collision modes
+RECT = "rect"  # bounding boxes only
+MASK = "mask"  # bounding boxes, then opaque pixels
+COLLISION_MODES = (RECT, MASK)
+
+# Rebuilding the grid costs about a microsecond of Python per rect, while
+# collidelistall tests a pair in C in a few nanoseconds. The grid only
+# pays off once there are enough rects on both sides (see bench_collision.py)
+SMALL_N = 64
+MIN_GRID_QUERIES = 32
+
+
+class SpatialHash:
+    """
+    Uniform grid of cell_size x cell_size buckets keyed by (column, row).
+
+    Each inserted rect is stored in every cell it touches and identified
+    by its insertion index.
+    """
+
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+        """Initialize an empty grid."""
+        self.cell_size = cell_size
+        self._cells = defaultdict(list)
+        self._rects = []
+
+    def clear(self):
+        """Remove every rect from the grid."""
+        self._cells.clear()
+        self._rects.clear()
+
+    def rebuild(self, rects):
+        """Replace the grid contents with rects, indexed by position."""
+        self.clear()
+        for rect in rects:
+            self.insert(rect)
+
+    def insert(self, rect):
+        """Add a rect to the grid and return its index."""
+        index = len(self._rects)
+        self._rects.append(rect)
+        cells = self._cells
+        for key in self._cell_keys(rect):
+            cells[key].append(index)
+        return index
+
+    def query(self, rect):
+        """Return the sorted indices of stored rects overlapping rect."""
+        cells = self._cells
+        rects = self._rects
+        found = set()
+        for key in self._cell_keys(rect):
+            bucket = cells.get(key)
+            if bucket:
+                found.update(bucket)
+        return sorted(i for i in found if rects[i].colliderect(rect))
+
+    def query_pairs(self, rects):
+        """Return (i, j) for every rects[i] overlapping stored rect j."""
+        return [(i, j) for i, rect in enumerate(rects) for j in self.query(rect)]
+
+    def _cell_keys(self, rect):
+        """Yield the (column, row) of every cell rect touches."""
+        size = self.cell_size
+        left, top = rect.left // size, rect.top // size
+        right, bottom = (rect.right - 1) // size, (rect.bottom - 1) // size
+        for col in range(left, right + 1):
+            for row in range(top, bottom + 1):
+                yield (col, row)
+
+    def __len__(self):
+        return len(self._rects)
+
+
+def collide_pairs(rects_a, rects_b, grid=None, small_n=SMALL_N,
+                  min_grid_queries=MIN_GRID_QUERIES):
+    """
+    Return every (i, j) pair where rects_a[i] overlaps rects_b[j].
+
+    Args:
+        rects_a: rects to test, usually the few moving actors.
+        rects_b: rects to test against, usually the ships.
+        grid: SpatialHash to rebuild with rects_b (a new one if None).
+        small_n: use collidelistall when rects_b has at most this many rects.
+        min_grid_queries: use collidelistall when rects_a has fewer rects.
+
+    Returns:
+        list: (i, j) index pairs in ascending order.
+    """
+    if not rects_a or not rects_b:
+        return []
+
+    if len(rects_b) <= small_n or len(rects_a) < min_grid_queries:
+        return [
+            (i, j)
+            for i, rect in enumerate(rects_a)
+            for j in rect.collidelistall(rects_b)
+        ]
+
+    if grid is None:
+        grid = SpatialHash()
+    grid.rebuild(rects_b)
+    return grid.query_pairs(rects_a)
+
+
+def masks_overlap(rect_a, mask_a, rect_b, mask_b):
+    """
+    Return True if the opaque pixels of two sprites overlap.
+
+    Args:
+        rect_a, rect_b: where each sprite is on screen.
+        mask_a, mask_b: pygame.mask.Mask of each sprite's image.
+    """
+    offset = (rect_b[0] - rect_a[0], rect_b[1] - rect_a[1])
+    return mask_a.overlap(mask_b, offset) is not None
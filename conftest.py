@@ -12,6 +12,12 @@ import sys
 from unittest.mock import MagicMock, patch
 from collections import defaultdict
 
+from assets import shared_assets, headless_assets
+
+
+# The benchmark suite is slow; run it explicitly with `pytest benchmarks`
+collect_ignore = ["benchmarks"]
+
 
 def make_keys(*pressed_keys):
     """
@@ -41,7 +47,10 @@ def mock_pygame():
     Sets a minimal video mode so convert_alpha() works
     Mocks image loading, scaling, fonts, clocks, and music
     prevents file I/O and audio playback during testing
+    Empties the shared asset cache so each test sees fresh loads
     """
+    shared_assets.clear()
+    headless_assets.clear()
     pygame.display.init()
     pygame.font.init()
 
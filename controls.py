@@ -0,0 +1,271 @@
+"""
+Player input for Save the Penguin
+
+Penguin movement is driven by a small bitmask of actions rather than
+directly by pygame's keyboard state. That lets the same movement code
+take input from the keyboard, a scripted sequence, or a bot.
+
+An input source is any zero-argument callable that returns an action
+bitmask for the current frame.
+
+InputState is the game's event-driven source: the game loop hands it the
+events it drains each frame, and it folds KEYDOWN/KEYUP and gamepad
+events into the held-actions bitmask, so the keyboard is never polled.
+Bots and tests can push events into its queue instead.
+"""
+
+import pygame
+from collections import deque
+
+
+# Action bits
+LEFT = 1
+RIGHT = 2
+UP = 4
+DOWN = 8
+
+# Default keyboard bindings
+KEY_ACTIONS = {
+    pygame.K_LEFT: LEFT,
+    pygame.K_RIGHT: RIGHT,
+    pygame.K_UP: UP,
+    pygame.K_DOWN: DOWN,
+}
+
+# Default gamepad bindings (buttons of the d-pad on most controllers)
+BUTTON_ACTIONS = {
+    11: UP,
+    12: DOWN,
+    13: LEFT,
+    14: RIGHT,
+}
+
+# Analog stick position past which it counts as a held direction
+AXIS_DEADZONE = 0.5
+
+# The only events the game reads; everything else is dropped by SDL
+# before it reaches the queue (see allow_input_events)
+INPUT_EVENTS = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.WINDOWFOCUSLOST,
+    pygame.WINDOWEXPOSED,
+    pygame.JOYAXISMOTION,
+    pygame.JOYHATMOTION,
+    pygame.JOYBUTTONDOWN,
+    pygame.JOYBUTTONUP,
+    pygame.JOYDEVICEADDED,
+    pygame.JOYDEVICEREMOVED,
+)
+
+
+def keys_to_actions(keys):
+    """
+    Convert a pygame.key.get_pressed()-style mapping to an action bitmask.
+
+    Args:
+        keys: mapping of pygame key constants to pressed states.
+
+    Returns:
+        int: bitwise OR of the actions whose keys are held.
+    """
+    actions = 0
+    for key, action in KEY_ACTIONS.items():
+        if keys[key]:
+            actions |= action
+    return actions
+
+
+def keyboard_actions():
+    """Input source that polls the keyboard for the current frame."""
+    return keys_to_actions(pygame.key.get_pressed())
+
+
+class ScriptedInput:
+    """
+    Input source that plays back a fixed sequence of action bitmasks,
+    one per frame.
+
+    Once the sequence runs out it either starts over (loop=True) or
+    keeps returning 0 (no keys held).
+    """
+
+    def __init__(self, actions, loop=False):
+        """Initialize with a sequence of per-frame action bitmasks."""
+        self.actions = list(actions)
+        self.loop = loop
+        self.frame = 0
+
+    def __call__(self):
+        """Return the action bitmask for the next frame."""
+        frame = self.frame
+        self.frame += 1
+        if frame >= len(self.actions):
+            if not self.loop or not self.actions:
+                return 0
+            frame %= len(self.actions)
+        return self.actions[frame]
+
+
+def allow_input_events(event_types=INPUT_EVENTS):
+    """Block every pygame event type except event_types."""
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(list(event_types))
+
+
+class InputState:
+    """
+    Event-driven input source holding the currently held actions.
+
+    Feed it each frame's events with process(); calling it returns the
+    action bitmask. Keyboard and gamepad state are kept separately and
+    combined, so releasing a key does not cancel a direction still held
+    on the stick. Losing window focus releases everything, since the
+    matching KEYUP events would never arrive.
+    """
+
+    def __init__(self, key_actions=None, button_actions=None,
+                 deadzone=AXIS_DEADZONE):
+        """
+        Initialize with nothing held.
+
+        Args:
+            key_actions: pygame key -> action bit (KEY_ACTIONS by default).
+            button_actions: gamepad button -> action bit (BUTTON_ACTIONS
+                by default).
+            deadzone: stick deflection below which the stick is ignored.
+        """
+        self.key_actions = dict(KEY_ACTIONS if key_actions is None else key_actions)
+        self.button_actions = dict(
+            BUTTON_ACTIONS if button_actions is None else button_actions
+        )
+        self.deadzone = deadzone
+        self.actions = 0
+        self.queue = deque()
+        self.joysticks = {}
+        self._keys_down = set()
+        self._buttons_down = set()
+        self._key_bits = 0
+        self._button_bits = 0
+        self._hat_bits = 0
+        self._axis_bits = 0
+
+    def __call__(self):
+        """Apply any queued events and return the held-actions bitmask."""
+        if self.queue:
+            self.process(self._drain())
+        return self.actions
+
+    def bind(self, key, action):
+        """Make key trigger action (replacing any action it had)."""
+        self.key_actions[key] = action
+        self._refresh_keys()
+
+    def unbind(self, key):
+        """Stop key from triggering anything."""
+        self.key_actions.pop(key, None)
+        self._refresh_keys()
+
+    def bind_button(self, button, action):
+        """Make a gamepad button trigger action."""
+        self.button_actions[button] = action
+        self._refresh_buttons()
+
+    def push(self, event):
+        """Queue an event to be applied on the next call or process()."""
+        self.queue.append(event)
+
+    def process(self, events):
+        """Fold a sequence of pygame events into the held actions."""
+        if self.queue:
+            events = self._drain() + list(events)
+        for event in events:
+            kind = event.type
+            if kind == pygame.KEYDOWN:
+                if event.key in self.key_actions:
+                    self._keys_down.add(event.key)
+                    self._key_bits |= self.key_actions[event.key]
+            elif kind == pygame.KEYUP:
+                if event.key in self._keys_down:
+                    self._keys_down.discard(event.key)
+                    self._refresh_keys()
+            elif kind == pygame.JOYHATMOTION:
+                self._hat_bits = _direction_bits(*event.value, threshold=1)
+            elif kind == pygame.JOYAXISMOTION:
+                self._axis_motion(event.axis, event.value)
+            elif kind == pygame.JOYBUTTONDOWN:
+                if event.button in self.button_actions:
+                    self._buttons_down.add(event.button)
+                    self._button_bits |= self.button_actions[event.button]
+            elif kind == pygame.JOYBUTTONUP:
+                if event.button in self._buttons_down:
+                    self._buttons_down.discard(event.button)
+                    self._refresh_buttons()
+            elif kind == pygame.JOYDEVICEADDED:
+                joystick = pygame.joystick.Joystick(event.device_index)
+                self.joysticks[joystick.get_instance_id()] = joystick
+            elif kind == pygame.JOYDEVICEREMOVED:
+                self.joysticks.pop(event.instance_id, None)
+                self._release_gamepad()
+            elif kind == pygame.WINDOWFOCUSLOST:
+                self.release_all()
+        self._combine()
+
+    def release_all(self):
+        """Forget every held key, button, and stick direction."""
+        self._keys_down.clear()
+        self._key_bits = 0
+        self._release_gamepad()
+        self.actions = 0
+
+    def _combine(self):
+        self.actions = (self._key_bits | self._button_bits
+                        | self._hat_bits | self._axis_bits)
+
+    def _release_gamepad(self):
+        self._buttons_down.clear()
+        self._button_bits = self._hat_bits = self._axis_bits = 0
+
+    def _drain(self):
+        events = list(self.queue)
+        self.queue.clear()
+        return events
+
+    def _refresh_keys(self):
+        bits = 0
+        for key in self._keys_down:
+            bits |= self.key_actions.get(key, 0)
+        self._key_bits = bits
+        self._combine()
+
+    def _refresh_buttons(self):
+        bits = 0
+        for button in self._buttons_down:
+            bits |= self.button_actions.get(button, 0)
+        self._button_bits = bits
+        self._combine()
+
+    def _axis_motion(self, axis, value):
+        """Update the stick bits from the left stick's x (0) or y (1) axis."""
+        if axis == 0:
+            self._axis_bits &= ~(LEFT | RIGHT)
+            self._axis_bits |= _direction_bits(value, 0, self.deadzone)
+        elif axis == 1:
+            self._axis_bits &= ~(UP | DOWN)
+            # Stick y grows downward, unlike the hat
+            self._axis_bits |= _direction_bits(0, -value, self.deadzone)
+
+
+def _direction_bits(x, y, threshold):
+    """Return the action bits for a direction with y pointing up."""
+    bits = 0
+    if x <= -threshold:
+        bits |= LEFT
+    elif x >= threshold:
+        bits |= RIGHT
+    if y >= threshold:
+        bits |= UP
+    elif y <= -threshold:
+        bits |= DOWN
+    return bits
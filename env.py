@@ -0,0 +1,206 @@
+"""
+Reinforcement learning environments for Save the Penguin
+
+PenguinEnv wraps one headless, vectorized Game in the familiar
+reset()/step(action) interface, and VectorEnv steps many independent
+games in lockstep in one process. Nothing is drawn and no window is
+opened. Observations and rewards are written into NumPy buffers that are
+allocated once and reused on every step, so copy them if you keep them.
+
+An action is the same bitmask the keyboard produces (see controls.py),
+so there are ACTION_COUNT possible actions, 0 to 15.
+
+Observation layout (float32, OBS_BASE + SHIP_FEATURES * k_ships values):
+    penguin x, penguin y     centre, as a fraction of the screen size
+    health                   as a fraction of the starting health
+    then for each of the k nearest ships, nearest first:
+        dx, dy               ship centre minus penguin centre, as a
+                             fraction of the screen size
+        speed                pixels per tick / MAX_SPEED
+        present              1.0, or 0.0 for an empty slot (all zeros)
+"""
+
+import numpy as np
+
+from SaveThePenguin import Game
+
+
+ACTION_COUNT = 16
+OBS_BASE = 3
+SHIP_FEATURES = 4
+MAX_SPEED = 10.0
+START_HEALTH = 50
+
+# Reward per tick survived, per ship dodged, and per hit taken
+TICK_REWARD = 0.01
+DODGE_REWARD = 0.1
+HIT_REWARD = -1.0
+
+
+def observation_size(k_ships):
+    """Return the length of one observation for k_ships nearest ships."""
+    return OBS_BASE + SHIP_FEATURES * k_ships
+
+
+class PenguinEnv:
+    """
+    Single-game environment with reset()/step() returning NumPy data.
+
+    step() returns (observation, reward, terminated, truncated, info).
+    terminated is True when the penguin dies, and truncated is True when
+    max_steps ticks have passed.
+    """
+
+    def __init__(self, k_ships=4, max_steps=None, seed=None, obs_buffer=None,
+                 **game_kwargs):
+        """
+        Initialize the environment and its game.
+
+        Args:
+            k_ships: number of nearest ships in each observation.
+            max_steps: ticks before an episode is truncated (None for no limit).
+            seed: seed for the first episode.
+            obs_buffer: float32 array to write observations into (one is
+                allocated if None). VectorEnv passes rows of its buffer.
+            **game_kwargs: extra Game keyword arguments, such as ship_speed.
+        """
+        self.k_ships = k_ships
+        self.max_steps = max_steps
+        self.action = 0
+        self.game = Game(headless=True, vectorized=True, seed=seed,
+                         input_source=self._next_action, **game_kwargs)
+        size = observation_size(k_ships)
+        if obs_buffer is None:
+            obs_buffer = np.zeros(size, dtype=np.float32)
+        self.observation = obs_buffer
+
+    def reset(self, seed=None):
+        """
+        Start a new episode (reseeded if seed is given).
+
+        Returns:
+            tuple: (observation, info)
+        """
+        game = self.game
+        if seed is not None:
+            game.reseed(seed)
+        game.reset_game()
+        self.action = 0
+        self._observe()
+        return self.observation, {"seed": game.seed}
+
+    def step(self, action):
+        """
+        Advance the game one tick with the penguin holding action.
+
+        Returns:
+            tuple: (observation, reward, terminated, truncated, info)
+        """
+        game = self.game
+        hits, dodged = game.hits, game.ships_dodged
+        self.action = int(action)
+        game.update()
+
+        reward = (TICK_REWARD
+                  + DODGE_REWARD * (game.ships_dodged - dodged)
+                  + HIT_REWARD * (game.hits - hits))
+        terminated = game.game_over
+        truncated = self.max_steps is not None and game.frame >= self.max_steps
+        self._observe()
+        return self.observation, reward, terminated, truncated, {}
+
+    def _next_action(self):
+        """Input source for the game: the action passed to step()."""
+        return self.action
+
+    def _observe(self):
+        """Write the current observation into self.observation."""
+        game = self.game
+        out = self.observation
+        penguin = game.penguin.rect
+        width, height = game.width, game.height
+        px, py = penguin.centerx, penguin.centery
+        out[0] = px / width
+        out[1] = py / height
+        out[2] = game.penguin.health / START_HEALTH
+
+        ships = out[OBS_BASE:].reshape(self.k_ships, SHIP_FEATURES)
+        ships[:] = 0.0
+        fleet = game.fleet
+        n = fleet.count
+        if not n:
+            return
+
+        dx = fleet.x[:n] + fleet.w[:n] * 0.5 - px
+        dy = fleet.y[:n] + fleet.h[:n] * 0.5 - py
+        distance = dx * dx + dy * dy
+        k = min(self.k_ships, n)
+        if n > k:
+            nearest = np.argpartition(distance, k - 1)[:k]
+            nearest = nearest[np.argsort(distance[nearest])]
+        else:
+            nearest = np.argsort(distance)
+        ships[:k, 0] = dx[nearest] / width
+        ships[:k, 1] = dy[nearest] / height
+        ships[:k, 2] = fleet.speed[nearest] / MAX_SPEED
+        ships[:k, 3] = 1.0
+
+
+class VectorEnv:
+    """
+    num_envs independent games stepped in lockstep.
+
+    step(actions) takes one action per game and returns arrays with one
+    row or value per game. A game that ends is reset straight away, so
+    the observation returned for it is the first one of its next
+    episode; its terminated or truncated flag still reports the ending.
+    """
+
+    def __init__(self, num_envs, k_ships=4, max_steps=None, seed=0, **game_kwargs):
+        """
+        Initialize every game.
+
+        Args:
+            num_envs: number of games.
+            k_ships: number of nearest ships in each observation.
+            max_steps: ticks before an episode is truncated.
+            seed: game i starts with seed + i.
+            **game_kwargs: extra Game keyword arguments for every game.
+        """
+        self.num_envs = num_envs
+        self.observations = np.zeros((num_envs, observation_size(k_ships)),
+                                     dtype=np.float32)
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.terminated = np.zeros(num_envs, dtype=bool)
+        self.truncated = np.zeros(num_envs, dtype=bool)
+        self.envs = [
+            PenguinEnv(k_ships, max_steps, seed + i, self.observations[i], **game_kwargs)
+            for i in range(num_envs)
+        ]
+        self._next_seed = seed + num_envs
+
+    def reset(self, seed=None):
+        """
+        Reset every game (game i reseeded with seed + i if seed is given).
+
+        Returns:
+            tuple: (observations, info)
+        """
+        for i, env in enumerate(self.envs):
+            env.reset(None if seed is None else seed + i)
+        return self.observations, {}
+
+    def step(self, actions):
+        """
+        Step every game with its action.
+
+        Returns:
+            tuple: (observations, rewards, terminated, truncated, info)
+        """
+        rewards, terminated, truncated = self.rewards, self.terminated, self.truncated
+        for i, env in enumerate(self.envs):
+            _, rewards[i], terminated[i], truncated[i], _ = env.step(actions[i])
+            if terminated[i] or truncated[i]:
+                env.reset(self._next_seed)
+                self._next_seed += 1
+        return self.observations, rewards, terminated, truncated, {}
@@ -0,0 +1,264 @@
+"""
+Array-backed ship storage for Save the Penguin
+
+ShipFleet keeps every ship's position, size, and speed in parallel NumPy
+arrays, so moving, culling, and respawning the whole fleet takes a few
+vectorized operations per frame instead of one Python call per ship.
+ShipView wraps one slot of the fleet with the same interface as Ship, so
+existing draw() and get_rect() call sites keep working. Like Ship, every
+pixel position is the float position floored.
+"""
+
+import numpy as np
+import pygame
+from itertools import islice
+from math import floor
+from collision import masks_overlap
+
+
+_NONE_GONE = np.zeros(0)
+
+
+class ShipFleet:
+    """
+    Struct-of-arrays store for up to capacity ships.
+
+    Live ships always occupy slots [0, count). When recycle is True,
+    ships that fall off the screen are respawned above it in place;
+    otherwise they are culled and the live slots are compacted.
+    """
+
+    def __init__(self, capacity, screen_width, screen_height, image,
+                 speed_range=(3, 6), recycle=False, rng=None, mask=None):
+        """
+        Initialize an empty fleet.
+
+        Args:
+            capacity: maximum number of live ships.
+            screen_width: width used for horizontal spawn limits.
+            screen_height: height past which ships are off screen.
+            image: sprite surface shared by every ship.
+            speed_range: inclusive (min, max) speed in pixels per tick
+                (floats allow sub-pixel speeds).
+            recycle: respawn off-screen ships instead of culling them.
+            rng: numpy Generator used for spawning.
+            mask: collision mask of image, used for pixel-perfect checks.
+        """
+        self.capacity = capacity
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.image = image
+        self.speed_range = speed_range
+        self.recycle = recycle
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.mask = mask
+        self.count = 0
+        self.gone_x = _NONE_GONE
+
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.w = np.full(capacity, float(image.get_width()))
+        self.h = np.full(capacity, float(image.get_height()))
+        self.speed = np.zeros(capacity)
+        self._arrays = (self.x, self.y, self.w, self.h, self.speed)
+
+        self._views = [ShipView(self, i) for i in range(capacity)]
+
+    def spawn(self, count):
+        """Add up to count ships above the screen and return how many fit."""
+        start = self.count
+        stop = min(self.capacity, start + count)
+        self._respawn(np.arange(start, stop))
+        self.count = stop
+        return stop - start
+
+    def add(self, x, y, speed):
+        """
+        Add ships at the given positions and speeds (equal-length arrays),
+        as far as capacity allows, and return how many were added.
+        """
+        start = self.count
+        stop = min(self.capacity, start + len(x))
+        added = stop - start
+        self.x[start:stop] = x[:added]
+        self.y[start:stop] = y[:added]
+        self.speed[start:stop] = speed[:added]
+        self.count = stop
+        return added
+
+    def clear(self):
+        """Remove every live ship."""
+        self.count = 0
+
+    def update(self):
+        """
+        Move every live ship and handle the ones that left the screen.
+        Their centre x positions are left in gone_x.
+
+        Returns:
+            int: number of ships that went off screen this frame.
+        """
+        self.gone_x = _NONE_GONE
+        n = self.count
+        if not n:
+            return 0
+
+        y = self.y[:n]
+        y += self.speed[:n]
+        off = y > self.screen_height
+        gone = int(np.count_nonzero(off))
+        if not gone:
+            return 0
+
+        self.gone_x = self.x[:n][off] + self.w[:n][off] * 0.5
+
+        if self.recycle:
+            self._respawn(np.flatnonzero(off))
+        else:
+            keep = ~off
+            live = n - gone
+            for array in self._arrays:
+                array[:live] = array[:n][keep]
+            self.count = live
+        return gone
+
+    def collide_rect(self, rect):
+        """Return the indices of live ships overlapping rect."""
+        n = self.count
+        x, y = np.floor(self.x[:n]), np.floor(self.y[:n])
+        hit = (
+            (x < rect.right) & (x + self.w[:n] > rect.left)
+            & (y < rect.bottom) & (y + self.h[:n] > rect.top)
+        )
+        return np.flatnonzero(hit)
+
+    def positions(self, alpha=1.0):
+        """
+        Return the x and y arrays of every live ship, interpolated alpha
+        of the way into the last tick (floored pixel positions at the end
+        of the tick, as Ship draws).
+        """
+        n = self.count
+        if alpha < 1.0:
+            y = self.y[:n] - self.speed[:n] * (1.0 - alpha)
+        else:
+            y = np.floor(self.y[:n])
+        return np.floor(self.x[:n]), y
+
+    def _respawn(self, index):
+        """Give the ships at index a new speed and spawn position."""
+        low, high = self.speed_range
+        size = len(index)
+        if isinstance(low, int) and isinstance(high, int):
+            self.speed[index] = self.rng.integers(low, high + 1, size)
+        else:
+            self.speed[index] = self.rng.uniform(low, high, size)
+        self.x[index] = self.rng.integers(
+            0, (self.screen_width - self.w[index]).astype(np.int64) + 1, size
+        )
+        self.y[index] = self.rng.integers(-120, -39, size)
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return islice(self._views, self.count)
+
+    def __getitem__(self, index):
+        if not -self.count <= index < self.count:
+            raise IndexError("ship index out of range")
+        return self._views[index % self.count]
+
+
+class ShipView:
+    """
+    Ship-compatible view of one slot in a ShipFleet.
+
+    The rect is built from the fleet arrays on access. Assign a new rect
+    (view.rect = ...) rather than mutating the returned one to move it.
+    """
+
+    __slots__ = ("fleet", "index")
+
+    def __init__(self, fleet, index):
+        self.fleet = fleet
+        self.index = index
+
+    @property
+    def image(self):
+        return self.fleet.image
+
+    @property
+    def rect(self):
+        fleet, i = self.fleet, self.index
+        return pygame.Rect(
+            floor(fleet.x[i]), floor(fleet.y[i]), int(fleet.w[i]), int(fleet.h[i])
+        )
+
+    @rect.setter
+    def rect(self, rect):
+        fleet, i = self.fleet, self.index
+        fleet.x[i], fleet.y[i] = rect[0], rect[1]
+
+    @property
+    def speed(self):
+        return float(self.fleet.speed[self.index])
+
+    @speed.setter
+    def speed(self, value):
+        self.fleet.speed[self.index] = value
+
+    def spawn(self):
+        """Respawn this ship above the screen."""
+        self.fleet._respawn(np.array([self.index]))
+
+    def move(self):
+        """Move ship downward."""
+        self.fleet.y[self.index] += self.fleet.speed[self.index]
+
+    def update(self):
+        """Update ship movement."""
+        self.move()
+
+    def sprite(self, alpha=1.0):
+        """
+        Return the (image, position) to blit for this frame.
+
+        Ships move in a straight line at a fixed speed, so the position
+        alpha of the way into the last tick is derived from the speed
+        instead of storing the previous position.
+        """
+        fleet, i = self.fleet, self.index
+        y = fleet.y[i]
+        if alpha < 1.0:
+            y = round(y - fleet.speed[i] * (1.0 - alpha))
+        else:
+            y = floor(y)
+        return fleet.image, (floor(fleet.x[i]), y)
+
+    def draw(self, screen, alpha=1.0):
+        """Draw ship and return the area drawn."""
+        return screen.blit(*self.sprite(alpha))
+
+    def is_off_screen(self, screen_height):
+        """Check if ship left screen."""
+        return bool(self.fleet.y[self.index] > screen_height)
+
+    def check_collision(self, penguin_rect, penguin_mask=None):
+        """
+        Check collision with penguin.
+
+        With penguin_mask (and a fleet mask), overlapping rects only count
+        if opaque pixels of both sprites overlap.
+        """
+        rect = self.rect
+        if not rect.colliderect(penguin_rect):
+            return False
+        mask = self.fleet.mask
+        if penguin_mask is None or mask is None:
+            return True
+        return masks_overlap(penguin_rect, penguin_mask, rect, mask)
+
+    def get_rect(self):
+        """Return collision rect."""
+        return self.rect
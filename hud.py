@@ -0,0 +1,91 @@
+"""
+HUD text rendering for Save the Penguin
+
+Font rasterization is expensive, and the HUD almost never changes from one
+frame to the next. TextCache keeps recently rendered strings so a glyph
+surface is only rebuilt when the text or its color actually changes, and
+build_game_over_overlay() composites the game-over message once.
+"""
+
+import pygame
+from collections import OrderedDict
+
+
+WHITE = (255, 255, 255)
+
+
+class TextCache:
+    """
+    Small LRU cache of rendered text surfaces keyed by
+    (text, color, antialias).
+    """
+
+    def __init__(self, font, maxsize=16):
+        """Initialize an empty cache for one font."""
+        self.font = font
+        self.maxsize = maxsize
+        self._surfaces = OrderedDict()
+
+    def render(self, text, color, antialias=True):
+        """Return the rendered surface for text, rasterizing it on a miss."""
+        key = (text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+
+        surface = self.font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Drop every cached surface."""
+        self._surfaces.clear()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+
+def build_game_over_overlay(font, width, height, spacing=10):
+    """
+    Composite both game-over lines onto one transparent surface.
+
+    Returns:
+        tuple: (surface, rect) where rect positions the overlay on a
+        width x height screen.
+    """
+    line1 = font.render("Game Over!", True, WHITE)
+    line2 = font.render("Press R to Restart or Q to Quit", True, WHITE)
+
+    line1_rect = line1.get_rect(center=(width // 2, height // 2 - (line1.get_height() // 2 + spacing)))
+    line2_rect = line2.get_rect(center=(width // 2, height // 2 + (line2.get_height() // 2)))
+    rect = line1_rect.union(line2_rect)
+
+    overlay = pygame.Surface(rect.size, pygame.SRCALPHA)
+    overlay.blit(line1, line1_rect.move(-rect.x, -rect.y))
+    overlay.blit(line2, line2_rect.move(-rect.x, -rect.y))
+    return overlay, rect
+
+
+def build_text_panel(font, lines, width, height, spacing=10):
+    """
+    Composite lines of text, centred one under another, onto one
+    transparent surface.
+
+    Returns:
+        tuple: (surface, rect) where rect centres the panel on a
+        width x height screen.
+    """
+    rendered = [font.render(line, True, WHITE) for line in lines]
+    panel_width = max(surface.get_width() for surface in rendered)
+    panel_height = (sum(surface.get_height() for surface in rendered)
+                    + spacing * (len(rendered) - 1))
+
+    panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+    y = 0
+    for surface in rendered:
+        panel.blit(surface, surface.get_rect(midtop=(panel_width // 2, y)))
+        y += surface.get_height() + spacing
+    return panel, panel.get_rect(center=(width // 2, height // 2))
@@ -0,0 +1,194 @@
+"""
+Particle effects for Save the Penguin
+
+ParticleSystem keeps every live particle's position, velocity,
+acceleration, remaining life, and color in preallocated NumPy arrays,
+like ShipFleet does for ships. Emitting, moving, and culling a burst
+take a few vectorized operations, and drawing queues one batch of blits
+per color on the renderer, so a screen full of sparks costs about the
+same Python work as a single sprite.
+
+The system never holds more than capacity particles. Particles emitted
+while it is full are dropped.
+
+Effects are described by Effect presets: EXPLOSION for hits, SPLASH for
+ships falling into the sea, and SNOW for falling snow.
+"""
+
+import numpy as np
+import pygame
+
+
+DEFAULT_CAPACITY = 4096
+
+
+class Effect:
+    """How the particles of one kind of effect are emitted."""
+
+    def __init__(self, count, speed, life, colors, angle=(0.0, 360.0), gravity=0.0,
+                 size=3):
+        """
+        Initialize an effect.
+
+        Args:
+            count: particles per emission.
+            speed: (min, max) starting speed in pixels per tick.
+            life: (min, max) lifetime in ticks.
+            colors: RGB colors, picked at random per particle.
+            angle: (min, max) direction in degrees (0 is right, 90 is down).
+            gravity: downward acceleration in pixels per tick per tick.
+            size: particle width and height in pixels.
+        """
+        self.count = count
+        self.speed = speed
+        self.life = life
+        self.colors = colors
+        self.angle = angle
+        self.gravity = gravity
+        self.size = size
+
+
+EXPLOSION = Effect(48, (1.5, 5.0), (20, 45), [(255, 220, 90), (255, 140, 30), (220, 50, 20)],
+                   gravity=0.08)
+SPLASH = Effect(16, (1.5, 4.0), (15, 30), [(200, 230, 255), (120, 180, 240)],
+                angle=(225.0, 315.0), gravity=0.2, size=2)
+SNOW = Effect(1, (0.6, 1.4), (300, 600), [(255, 255, 255), (225, 235, 245)],
+              angle=(80.0, 100.0), size=2)
+
+
+class ParticleSystem:
+    """
+    Struct-of-arrays store for up to capacity particles.
+
+    Live particles always occupy slots [0, count).
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, rng=None):
+        """
+        Initialize an empty system.
+
+        Args:
+            capacity: hard cap on live particles.
+            rng: numpy Generator for emission (kept apart from the game's
+                RNG, so effects never change how a seeded game plays).
+        """
+        self.capacity = capacity
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.count = 0
+
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.ay = np.zeros(capacity)
+        self.life = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros(capacity, dtype=np.int32)
+        self._arrays = (self.x, self.y, self.vx, self.vy, self.ay, self.life, self.color)
+
+        # One small surface per (color, size), indexed by self.color, and
+        # the same surfaces per viewport scale
+        self._palette = {}
+        self.surfaces = []
+        self._scaled = {1.0: self.surfaces}
+
+    def emit(self, effect, x, y, count=None):
+        """
+        Emit effect.count particles (or count) at (x, y), and return how
+        many fit under the cap.
+
+        x and y may also be arrays of origins (or one array and one
+        number), and each origin then gets count particles.
+        """
+        per_origin = effect.count if count is None else count
+        origins_x, origins_y = np.broadcast_arrays(np.atleast_1d(np.asarray(x, dtype=float)),
+                                                   np.atleast_1d(np.asarray(y, dtype=float)))
+        start = self.count
+        stop = min(self.capacity, start + per_origin * len(origins_x))
+        size = stop - start
+        if size <= 0:
+            return 0
+
+        rng = self.rng
+        index = slice(start, stop)
+        angle = np.radians(rng.uniform(*effect.angle, size))
+        speed = rng.uniform(*effect.speed, size)
+        self.x[index] = np.repeat(origins_x, per_origin)[:size]
+        self.y[index] = np.repeat(origins_y, per_origin)[:size]
+        self.vx[index] = np.cos(angle) * speed
+        self.vy[index] = np.sin(angle) * speed
+        self.ay[index] = effect.gravity
+        self.life[index] = rng.integers(effect.life[0], effect.life[1] + 1, size)
+        colors = [self._color_index(color, effect.size) for color in effect.colors]
+        self.color[index] = rng.choice(colors, size)
+        self.count = stop
+        return size
+
+    def _color_index(self, color, size):
+        """Return the palette index of a color and size, making its surface."""
+        key = (tuple(color), size)
+        index = self._palette.get(key)
+        if index is None:
+            surface = pygame.Surface((size, size))
+            surface.fill(color)
+            index = self._palette[key] = len(self.surfaces)
+            self.surfaces.append(surface)
+        return index
+
+    def surfaces_at(self, scale):
+        """Return the palette surfaces at a viewport scale (built on first use)."""
+        scaled = self._scaled.setdefault(scale, [])
+        for surface in self.surfaces[len(scaled):]:
+            size = max(1, round(surface.get_width() * scale))
+            square = pygame.Surface((size, size))
+            square.fill(surface.get_at((0, 0)))
+            scaled.append(square)
+        return scaled
+
+    def update(self):
+        """Move every live particle one tick and cull the expired ones."""
+        n = self.count
+        if not n:
+            return
+        self.vy[:n] += self.ay[:n]
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        life = self.life[:n]
+        life -= 1
+
+        alive = life > 0
+        live = int(np.count_nonzero(alive))
+        if live < n:
+            for array in self._arrays:
+                array[:live] = array[:n][alive]
+            self.count = live
+
+    def queue(self, renderer, layer, alpha=1.0):
+        """
+        Queue every live particle on a renderer layer, one batch of blits
+        per color, alpha of the way into the last tick. Particles are
+        drawn at the size of the renderer's viewport scale.
+        """
+        n = self.count
+        if not n:
+            return
+        x, y = self.x[:n], self.y[:n]
+        if alpha < 1.0:
+            back = 1.0 - alpha
+            x = x - self.vx[:n] * back
+            y = y - self.vy[:n] * back
+        viewport = renderer.viewport
+        surfaces = self.surfaces if viewport is None else self.surfaces_at(viewport.scale)
+        color = self.color[:n]
+        if len(surfaces) == 1:
+            renderer.queue_positions(layer, surfaces[0], x, y)
+            return
+        for index in np.unique(color).tolist():
+            mask = color == index
+            renderer.queue_positions(layer, surfaces[index], x[mask], y[mask])
+
+    def clear(self):
+        """Remove every live particle."""
+        self.count = 0
+
+    def __len__(self):
+        return self.count
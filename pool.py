@@ -0,0 +1,57 @@
+"""
+Fixed-capacity object pool for Save the Penguin ships
+
+All ships are allocated once up front. Ships that fall off the screen or
+hit the penguin are handed back to the pool and reused for the next wave,
+so the frame loop never allocates new Ship objects.
+"""
+
+
+class ShipPool:
+    """
+    Holds a free list of preallocated ships.
+
+    acquire() hands out a ship reset through Ship.spawn(), and release()
+    returns it. The pool never grows past capacity: when the free list is
+    empty, acquire() returns None.
+    """
+
+    def __init__(self, factory, capacity):
+        """
+        Preallocate capacity ships.
+
+        Args:
+            factory: zero-argument callable that builds a new Ship.
+            capacity: number of ships the pool owns.
+        """
+        self.capacity = capacity
+        self._free = [factory() for _ in range(capacity)]
+
+    def acquire(self, spawn=True):
+        """
+        Return a freshly spawned ship, or None if the pool is empty.
+
+        With spawn=False the ship is handed out as it was released, for
+        callers that position it themselves.
+        """
+        if not self._free:
+            return None
+        ship = self._free.pop()
+        if spawn:
+            ship.spawn()
+        return ship
+
+    def release(self, ship):
+        """Return a ship to the free list."""
+        if len(self._free) < self.capacity:
+            self._free.append(ship)
+
+    def release_all(self, ships):
+        """Return every ship in a list to the pool and empty the list."""
+        for ship in ships:
+            self.release(ship)
+        ships.clear()
+
+    def free_count(self):
+        """Return how many ships are available."""
+        return len(self._free)
@@ -0,0 +1,242 @@
+"""
+Frame-time profiler for Save the Penguin
+
+FrameProfiler times each phase of the game loop (events, update, draw,
+and their sub-steps) with perf_counter_ns, keeps a rolling window of
+samples per phase for p50/p95/p99 reporting, can draw those numbers as an
+on-screen overlay, and exports everything it recorded to a CSV or JSON
+trace file.
+
+NullProfiler has the same interface and does nothing, so instrumented
+code costs almost nothing when profiling is off (headless simulation).
+"""
+
+import csv
+import json
+import pygame
+from collections import deque
+from time import perf_counter_ns
+
+
+FRAME = "frame"
+OVERLAY_COLOR = (255, 255, 0)
+OVERLAY_REFRESH_FRAMES = 30
+
+
+class _PhaseTimer:
+    """Reusable context manager that times one named phase."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, perf_counter_ns() - self.start)
+        return False
+
+
+class FrameProfiler:
+    """
+    Collects per-phase timings over a rolling window of frames.
+
+    Use `with profiler.phase("update"):` around each phase and call
+    end_frame() once per frame to record the total frame time.
+    """
+
+    def __init__(self, window=600, trace_limit=100_000):
+        """
+        Initialize an empty profiler.
+
+        Args:
+            window: number of recent samples kept per phase for percentiles.
+            trace_limit: maximum number of (frame, phase, time) rows kept
+                for export.
+        """
+        self.window = window
+        self.samples = {}
+        self.trace = deque(maxlen=trace_limit)
+        self.frame = 0
+        self.show_overlay = False
+        self._timers = {}
+        self._frame_start = perf_counter_ns()
+        self._frame_samples = []
+        self._overlay = None
+
+    def phase(self, name):
+        """Return a context manager that times the named phase."""
+        timer = self._timers.get(name)
+        if timer is None:
+            timer = self._timers[name] = _PhaseTimer(self, name)
+        return timer
+
+    def record(self, name, elapsed_ns):
+        """Add one timing sample for a phase."""
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.window)
+        samples.append(elapsed_ns)
+        self.trace.append((self.frame, name, elapsed_ns))
+        self._frame_samples.append(samples)
+
+    def end_frame(self):
+        """Record the total time since the previous end_frame() call."""
+        now = perf_counter_ns()
+        self.record(FRAME, now - self._frame_start)
+        self._frame_start = now
+        self._frame_samples.clear()
+        self.frame += 1
+
+    def skip_frame(self):
+        """
+        Drop every sample recorded since the previous end_frame() and
+        start a new frame without counting this one (for frames spent
+        asleep waiting for events, which would swamp the percentiles).
+        """
+        for samples in self._frame_samples:
+            samples.pop()
+            self.trace.pop()
+        self._frame_samples.clear()
+        self._frame_start = perf_counter_ns()
+
+    def percentiles(self, name):
+        """Return (p50, p95, p99) in milliseconds for a phase."""
+        samples = self.samples.get(name)
+        if not samples:
+            return (0.0, 0.0, 0.0)
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return tuple(ordered[round(last * q)] / 1e6 for q in (0.50, 0.95, 0.99))
+
+    def summary(self):
+        """Return {phase: {"p50": ms, "p95": ms, "p99": ms}} for every phase."""
+        return {
+            name: dict(zip(("p50", "p95", "p99"), self.percentiles(name)))
+            for name in self.samples
+        }
+
+    def toggle_overlay(self):
+        """Show or hide the on-screen overlay."""
+        self.show_overlay = not self.show_overlay
+        self._overlay = None
+
+    def draw_overlay(self, screen, font):
+        """
+        Draw the percentile table in the top-right corner of screen.
+
+        Returns:
+            pygame.Rect: the area drawn, or None when the overlay is hidden.
+        """
+        overlay = self.overlay(font, screen.get_width())
+        if overlay is None:
+            return None
+        return screen.blit(*overlay)
+
+    def overlay(self, font, screen_width):
+        """
+        Return the (surface, rect) of the percentile table in the top-right
+        corner of a screen_width wide screen, or None when it is hidden.
+
+        The table is only re-rendered every OVERLAY_REFRESH_FRAMES frames.
+        """
+        if not self.show_overlay:
+            return None
+
+        if self._overlay is None or self.frame % OVERLAY_REFRESH_FRAMES == 0:
+            lines = [f"{'phase':<18} p50   p95   p99"]
+            for name in sorted(self.samples):
+                p50, p95, p99 = self.percentiles(name)
+                lines.append(f"{name:<18}{p50:5.2f} {p95:5.2f} {p99:5.2f}")
+            rendered = [font.render(line, True, OVERLAY_COLOR) for line in lines]
+            width = max(surface.get_width() for surface in rendered)
+            height = sum(surface.get_height() for surface in rendered)
+            overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 160))
+            y = 0
+            for surface in rendered:
+                overlay.blit(surface, (0, y))
+                y += surface.get_height()
+            self._overlay = overlay
+
+        return self._overlay, self._overlay.get_rect(topright=(screen_width - 10, 10))
+
+    def export_csv(self, path):
+        """Write every traced sample as frame,phase,ms rows."""
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("frame", "phase", "ms"))
+            for frame, name, elapsed_ns in self.trace:
+                writer.writerow((frame, name, f"{elapsed_ns / 1e6:.4f}"))
+
+    def export_json(self, path):
+        """Write the percentile summary and every traced sample as JSON."""
+        with open(path, "w") as f:
+            json.dump({
+                "summary": self.summary(),
+                "trace": [
+                    {"frame": frame, "phase": name, "ms": elapsed_ns / 1e6}
+                    for frame, name, elapsed_ns in self.trace
+                ],
+            }, f)
+
+    def export(self, path):
+        """Export to JSON if path ends in .json, otherwise to CSV."""
+        if str(path).endswith(".json"):
+            self.export_json(path)
+        else:
+            self.export_csv(path)
+
+
+class _NullTimer:
+    """Context manager that does nothing."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class NullProfiler:
+    """Profiler with the FrameProfiler interface that records nothing."""
+
+    show_overlay = False
+    _timer = _NullTimer()
+
+    def phase(self, name):
+        return self._timer
+
+    def record(self, name, elapsed_ns):
+        pass
+
+    def end_frame(self):
+        pass
+
+    def skip_frame(self):
+        pass
+
+    def toggle_overlay(self):
+        pass
+
+    def draw_overlay(self, screen, font):
+        return None
+
+    def overlay(self, font, screen_width):
+        return None
+
+    def percentiles(self, name):
+        return (0.0, 0.0, 0.0)
+
+    def summary(self):
+        return {}
+
+    def export(self, path):
+        pass
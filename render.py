@@ -0,0 +1,358 @@
+"""
+Screen renderers for Save the Penguin
+
+Game.draw() queues every blit of the frame into named layers, and the
+renderer draws each layer with a single Surface.blits() call, bottom layer
+first, before presenting the frame:
+
+    FullScreenRenderer repaints the whole background and flips the whole
+    display every frame (the original behavior).
+
+    DirtyRectRenderer only repaints the background under what was drawn
+    last frame and only pushes the areas that changed to the display with
+    pygame.display.update(rects).
+
+    TextureRenderer draws with the SDL render API (pygame._sdl2.video)
+    instead of software blits: each surface is uploaded once as a texture
+    and the GPU composes the frame.
+
+All three take the same calls, so Game picks one at startup by backend
+name (see create_renderer) and draws the same way with any of them.
+Besides queueing and presenting, show(surface) presents one full-screen
+surface and capture() returns a copy of the last frame, for the static
+scenes.
+
+The default layer order is background, entities, HUD. Pass a different
+order as layers to draw, for example, the HUD under the sprites.
+
+Sprites queued with queue_sprites() are in logical coordinates. With a
+sprite atlas and viewport (see atlas.py), each one is drawn as an area
+blit out of the atlas at the window's scale, at its mapped position.
+queue() and queue_many() always take window coordinates.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+
+SOFTWARE = "software"
+TEXTURE = "texture"
+RENDER_BACKENDS = (SOFTWARE, TEXTURE)
+
+BACKGROUND = "background"
+ENTITIES = "entities"
+HUD = "hud"
+DEFAULT_LAYERS = (BACKGROUND, ENTITIES, HUD)
+
+
+class _LayeredRenderer:
+    """
+    Queues (surface, dest) blits per layer and draws them in batches.
+
+    Subclasses that set track_rects keep the areas drawn outside the
+    background layer in self._current.
+    """
+
+    track_rects = False
+
+    def __init__(self, screen, background, layers=DEFAULT_LAYERS, atlas=None,
+                 viewport=None):
+        """
+        Initialize with the display surface and background image.
+
+        Args:
+            background: window-size background surface.
+            layers: layer names from bottom to top.
+            atlas: SpriteAtlas at the viewport's scale that queue_sprites()
+                draws from (sprites are blitted as they are if None).
+            viewport: Viewport from logical to window coordinates (the
+                identity if None).
+        """
+        self.screen = screen
+        self.background = background
+        self.layers = tuple(layers)
+        self._queues = {layer: [] for layer in self.layers}
+        self.atlas = atlas
+        self.viewport = viewport
+
+    def queue(self, layer, surface, dest, area=None):
+        """Queue one blit on a layer."""
+        if area is None:
+            self._queues[layer].append((surface, dest))
+        else:
+            self._queues[layer].append((surface, dest, area))
+
+    def queue_many(self, layer, blits):
+        """Queue a sequence of (surface, dest) or (surface, dest, area) blits."""
+        self._queues[layer].extend(blits)
+
+    def queue_sprites(self, layer, sprites):
+        """
+        Queue (image, pos) sprite blits given in logical coordinates.
+
+        Images found in the atlas are drawn from it; any other image is
+        drawn unscaled at its mapped position.
+        """
+        atlas, viewport = self.atlas, self.viewport
+        if atlas is None and (viewport is None or viewport.identity):
+            self._queues[layer].extend(sprites)
+            return
+
+        surface = atlas.surface if atlas is not None else None
+        lookup = atlas.lookup if atlas is not None else {}
+        if viewport is None or viewport.identity:
+            blits = [(surface, pos, lookup[image]) if image in lookup else (image, pos)
+                     for image, pos in sprites]
+        else:
+            scale = viewport.scale
+            offset_x, offset_y = viewport.offset
+            blits = []
+            for image, pos in sprites:
+                dest = (offset_x + round(pos[0] * scale), offset_y + round(pos[1] * scale))
+                area = lookup.get(image)
+                blits.append((image, dest) if area is None else (surface, dest, area))
+        self._queues[layer].extend(blits)
+
+    def queue_positions(self, layer, image, x, y):
+        """
+        Queue one image at many logical positions, given as NumPy x and y
+        arrays, mapping them all to the window in one vectorized step.
+        """
+        atlas, viewport = self.atlas, self.viewport
+        if viewport is not None and not viewport.identity:
+            scale = viewport.scale
+            offset_x, offset_y = viewport.offset
+            x = x * scale + offset_x
+            y = y * scale + offset_y
+        dests = zip(np.round(x).astype(np.int64).tolist(),
+                    np.round(y).astype(np.int64).tolist())
+        area = atlas.lookup.get(image) if atlas is not None else None
+        if area is None:
+            self._queues[layer].extend([(image, dest) for dest in dests])
+        else:
+            surface = atlas.surface
+            self._queues[layer].extend([(surface, dest, area) for dest in dests])
+
+    @property
+    def size(self):
+        """Size of the window in pixels."""
+        return self.screen.get_size()
+
+    def capture(self):
+        """Return a copy of what is on the screen."""
+        return self.screen.copy()
+
+    def show(self, surface):
+        """Present a full-screen surface in place of the layers."""
+        self.screen.blit(surface, (0, 0))
+        pygame.display.flip()
+        self.invalidate()
+
+    def flush(self):
+        """Draw every queued blit, one Surface.blits() call per layer."""
+        blits = self.screen.blits
+        for layer in self.layers:
+            queued = self._queues[layer]
+            if not queued:
+                continue
+            if self.track_rects and layer != BACKGROUND:
+                self._current.extend([rect for rect in blits(queued) if rect])
+            else:
+                blits(queued, doreturn=False)
+            queued.clear()
+
+
+class FullScreenRenderer(_LayeredRenderer):
+    """Redraws and flips the entire screen every frame."""
+
+    def clear(self):
+        """Queue the whole background."""
+        self.queue(BACKGROUND, self.background, (0, 0))
+
+    def invalidate(self):
+        """Force a full redraw (every frame already is one)."""
+
+    def present(self):
+        """Draw the queued layers and push the whole frame to the display."""
+        self.flush()
+        pygame.display.flip()
+
+
+class DirtyRectRenderer(_LayeredRenderer):
+    """
+    Redraws and pushes only the areas that changed since the last frame.
+
+    Every area drawn outside the background layer is remembered. On the next frame, clear() restores the
+    background under those rects and present() updates both the old and
+    new rects on the display. After invalidate() (and on the first frame)
+    the whole screen is redrawn and flipped instead.
+    """
+
+    track_rects = True
+
+    def __init__(self, screen, background, layers=DEFAULT_LAYERS, atlas=None,
+                 viewport=None):
+        """Initialize with the display surface and background image."""
+        super().__init__(screen, background, layers, atlas, viewport)
+        self._previous = []
+        self._current = []
+        self._full_redraw = True
+
+    def clear(self):
+        """Queue the background under everything drawn last frame."""
+        if self._full_redraw:
+            self.queue(BACKGROUND, self.background, (0, 0))
+            return
+
+        background = self.background
+        self.queue_many(
+            BACKGROUND, [(background, rect, rect) for rect in self._previous]
+        )
+
+    def invalidate(self):
+        """Redraw and flip the whole screen on the next frame."""
+        self._full_redraw = True
+
+    def present(self):
+        """Draw the queued layers and push the old and new dirty areas."""
+        self.flush()
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            pygame.display.update(self._previous + self._current)
+
+        self._previous, self._current = self._current, []
+
+    def dirty_rects(self):
+        """Return the areas that present() would update right now."""
+        return self._previous + self._current
+
+
+class TextureRenderer(_LayeredRenderer):
+    """
+    Draws with the SDL render API: every surface becomes a texture once
+    and the whole frame is composed by the GPU and presented each frame.
+
+    The background and sprite atlas stay uploaded for the life of the
+    renderer. Other surfaces (HUD text, overlays) are kept in a small
+    least-recently-used cache of textures.
+    """
+
+    def __init__(self, window, background, layers=DEFAULT_LAYERS, atlas=None,
+                 viewport=None, texture_cache=64):
+        """
+        Initialize an SDL renderer for window.
+
+        Args:
+            window: pygame._sdl2.video.Window to draw into.
+            texture_cache: number of textures kept for surfaces other
+                than the background and atlas.
+        """
+        from pygame._sdl2.video import Renderer, Texture
+
+        super().__init__(None, background, layers, atlas, viewport)
+        self.window = window
+        self.sdl_renderer = Renderer(window)
+        self._make_texture = Texture.from_surface
+        self._pinned = {}
+        self._textures = OrderedDict()
+        self.texture_cache = texture_cache
+        self._last_frame = []
+        self._frame = []
+
+    @property
+    def size(self):
+        return self.window.size
+
+    def texture(self, surface):
+        """Return the texture for surface, uploading it on first use."""
+        texture = self._pinned.get(surface)
+        if texture is not None:
+            return texture
+        if surface is self.background or (self.atlas is not None
+                                          and surface is self.atlas.surface):
+            texture = self._pinned[surface] = self._make_texture(self.sdl_renderer, surface)
+            return texture
+
+        textures = self._textures
+        texture = textures.get(surface)
+        if texture is None:
+            texture = textures[surface] = self._make_texture(self.sdl_renderer, surface)
+            if len(textures) > self.texture_cache:
+                textures.popitem(last=False)
+        else:
+            textures.move_to_end(surface)
+        return texture
+
+    def clear(self):
+        """Queue the whole background (the GPU redraws every frame)."""
+        self.queue(BACKGROUND, self.background, (0, 0))
+
+    def invalidate(self):
+        """Force a full redraw (every frame already is one)."""
+
+    def flush(self):
+        """Draw every queued blit as a texture copy, bottom layer first."""
+        frame = self._frame
+        for layer in self.layers:
+            queued = self._queues[layer]
+            self._draw(queued)
+            frame.extend(queued)
+            queued.clear()
+
+    def _draw(self, blits):
+        """Copy (surface, dest) or (surface, dest, area) blits to the target."""
+        texture = self.texture
+        for blit in blits:
+            dest = blit[1]
+            if len(blit) > 2:
+                area = blit[2]
+                texture(blit[0]).draw(srcrect=area,
+                                      dstrect=(dest[0], dest[1], area[2], area[3]))
+            else:
+                texture(blit[0]).draw(dstrect=(dest[0], dest[1]))
+
+    def present(self):
+        """Draw the queued layers and present the frame."""
+        self.flush()
+        self.sdl_renderer.present()
+        self._last_frame, self._frame = self._frame, []
+
+    def capture(self):
+        """Return the last presented frame as a surface."""
+        self._draw(self._last_frame)
+        return self.sdl_renderer.to_surface()
+
+    def show(self, surface):
+        """Present a full-screen surface in place of the layers."""
+        self.sdl_renderer.clear()
+        self._make_texture(self.sdl_renderer, surface).draw(dstrect=(0, 0))
+        self.sdl_renderer.present()
+
+
+def create_renderer(backend, size, layers=DEFAULT_LAYERS, dirty_rects=True,
+                    title="Save the Penguin"):
+    """
+    Open a size window and return the renderer for a backend name.
+
+    The software backend opens the window with pygame.display.set_mode()
+    and uses DirtyRectRenderer (or FullScreenRenderer without dirty_rects);
+    the texture backend opens a pygame._sdl2.video.Window. The renderer
+    has no background, atlas, or viewport yet, since converting images
+    needs the window; set those attributes before drawing.
+
+    Raises:
+        ValueError: for an unknown backend name.
+    """
+    if backend == SOFTWARE:
+        screen = pygame.display.set_mode(size)
+        pygame.display.set_caption(title)
+        renderer = DirtyRectRenderer if dirty_rects else FullScreenRenderer
+        return renderer(screen, None, layers)
+    if backend == TEXTURE:
+        from pygame._sdl2.video import Window
+        return TextureRenderer(Window(title, size=size), None, layers)
+    raise ValueError(f"Unknown render backend: {backend}")
@@ -0,0 +1,177 @@
+"""
+Input recording and replay for Save the Penguin
+
+A recording is the game's seed plus the action bitmask the penguin
+received on every simulated tick. Because each game draws all of its
+random numbers from its own seeded RNG, feeding the same bitmasks back
+into a game with the same seed and settings reproduces the session
+exactly, which makes a recorded session a repeatable benchmark workload.
+
+File layout (little-endian):
+    header: magic b"STPR", version (u8), seed (u64), frame count (u32)
+    body:   runs of (action bitmask (u8), run length (u16))
+
+Run with:
+    python replay.py record session.stpr    # play normally and record
+    python replay.py play session.stpr      # replay headless at full speed
+"""
+
+import argparse
+import struct
+import sys
+import time
+from array import array
+
+from controls import ScriptedInput, keyboard_actions
+from SaveThePenguin import Game, check_seed
+
+
+MAGIC = b"STPR"
+VERSION = 1
+HEADER = struct.Struct("<4sBQI")
+RUN = struct.Struct("<BH")
+MAX_RUN = 0xFFFF
+
+
+class InputRecorder:
+    """
+    Input source wrapper that logs every action bitmask it hands out.
+
+    Wraps another input source (the keyboard by default) and is itself
+    an input source, so it can be passed straight to Game(input_source=...).
+
+    Given the game it feeds, the recorder stops at the end of the first
+    game: a restart carries on the same RNG stream instead of starting
+    over from the seed, so later games cannot be replayed from it.
+    """
+
+    def __init__(self, source=None, game=None):
+        """Initialize an empty recording of source."""
+        self.source = keyboard_actions if source is None else source
+        self.game = game
+        self.actions = array("B")
+
+    def __call__(self):
+        """Poll the wrapped source, record its bitmask, and return it."""
+        actions = self.source()
+        # The game polls once per tick, so a frame counter that no longer
+        # matches the recording means the game was restarted
+        if self.game is None or self.game.frame == len(self.actions):
+            self.actions.append(actions)
+        return actions
+
+    def to_replay(self, seed):
+        """Return the recording so far as a Replay."""
+        return Replay(seed, self.actions)
+
+
+class Replay:
+    """A recorded session: a seed and one action bitmask per tick."""
+
+    def __init__(self, seed, actions):
+        """
+        Initialize from a seed and a sequence of per-tick bitmasks.
+
+        Raises:
+            ValueError: if the seed does not fit the file's u64 field.
+        """
+        self.seed = check_seed(seed)
+        self.actions = array("B", actions)
+
+    def __len__(self):
+        return len(self.actions)
+
+    def input_source(self):
+        """Return a fresh input source that plays the recording back."""
+        return ScriptedInput(self.actions)
+
+    def to_bytes(self):
+        """Encode the replay as run-length compressed bytes."""
+        out = bytearray(HEADER.pack(MAGIC, VERSION, self.seed, len(self.actions)))
+        actions = self.actions
+        i = 0
+        while i < len(actions):
+            value = actions[i]
+            run = 1
+            while (i + run < len(actions) and actions[i + run] == value
+                   and run < MAX_RUN):
+                run += 1
+            out += RUN.pack(value, run)
+            i += run
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Decode bytes produced by to_bytes()."""
+        magic, version, seed, count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a Save the Penguin replay")
+
+        actions = array("B")
+        for value, run in RUN.iter_unpack(data[HEADER.size:]):
+            actions.extend([value] * run)
+        if len(actions) != count:
+            raise ValueError("Replay is truncated or corrupt")
+        return cls(seed, actions)
+
+    def save(self, path):
+        """Write the replay to a file."""
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """Read a replay written by save()."""
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+def play_replay(replay, **game_kwargs):
+    """
+    Run a replay headless at uncapped speed.
+
+    Args:
+        replay: the Replay to play.
+        **game_kwargs: Game settings, which must match the recorded game.
+
+    Returns:
+        Game: the game in its final state.
+    """
+    game = Game(headless=True, seed=replay.seed,
+                input_source=replay.input_source(), **game_kwargs)
+    game.simulate(len(replay))
+    return game
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Record or replay Save the Penguin input.")
+    parser.add_argument("mode", choices=("record", "play"))
+    parser.add_argument("path", help="replay file")
+    parser.add_argument("--seed", type=int, default=None, help="seed for a new recording")
+    args = parser.parse_args(argv)
+
+    if args.mode == "play":
+        replay = Replay.load(args.path)
+        start = time.perf_counter()
+        game = play_replay(replay)
+        elapsed = time.perf_counter() - start
+        print(f"{game.frame} ticks in {elapsed:.3f}s "
+              f"({game.frame / max(elapsed, 1e-9):.0f} ticks/sec), "
+              f"health {game.penguin.health}")
+        return 0
+
+    game = Game(seed=args.seed)
+    recorder = InputRecorder(game.input, game)
+    game.input_source = recorder
+    try:
+        game.run()
+    finally:
+        # The recorder stopped at the first game over, so restarts are
+        # not part of the replay
+        recorder.to_replay(game.seed).save(args.path)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
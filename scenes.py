@@ -0,0 +1,217 @@
+"""
+Scene stack for Save the Penguin
+
+The screen the player sees is the scene on top of a SceneStack. Only the
+play scene advances the simulation; while a pause, game-over, or title
+scene is on top, the game does not tick at all.
+
+Those three are static scenes: each is composed into one full-screen
+surface when it is entered, presented once, and then not drawn again
+until something invalidates it. While a static scene is on top the game
+loop also stops running at max_fps and blocks waiting for events, so an
+idle game-over screen uses almost no CPU.
+"""
+
+import pygame
+
+from hud import build_text_panel
+
+
+DIM_COLOR = (0, 0, 0, 150)
+
+
+class Scene:
+    """
+    Base scene: handles events, updates, and draws nothing.
+
+    simulates: advance the game's fixed-tick simulation while on top.
+    idle: nothing to draw until an event arrives, so the loop can sleep.
+    """
+
+    simulates = False
+    idle = False
+
+    def __init__(self, game):
+        """Initialize a scene for game."""
+        self.game = game
+
+    def enter(self):
+        """Called when the scene becomes the top of the stack."""
+
+    def exit(self):
+        """Called when the scene stops being the top of the stack."""
+
+    def handle_event(self, event):
+        """React to one pygame event."""
+
+    def update(self):
+        """Advance the scene by one fixed tick."""
+
+    def draw(self, alpha):
+        """Draw a frame."""
+
+    def invalidate(self):
+        """Redraw on the next frame (after the window was uncovered, say)."""
+
+
+class SceneStack:
+    """Stack of scenes; only the top one is active."""
+
+    def __init__(self):
+        """Initialize an empty stack."""
+        self._scenes = []
+
+    @property
+    def top(self):
+        """The active scene, or None when the stack is empty."""
+        return self._scenes[-1] if self._scenes else None
+
+    def push(self, scene):
+        """Put scene on top of the current one."""
+        if self._scenes:
+            self._scenes[-1].exit()
+        self._scenes.append(scene)
+        scene.enter()
+
+    def pop(self):
+        """Remove and return the top scene, resuming the one below."""
+        scene = self._scenes.pop()
+        scene.exit()
+        if self._scenes:
+            self._scenes[-1].enter()
+        return scene
+
+    def replace(self, scene):
+        """Swap the top scene for scene."""
+        self._scenes.pop().exit()
+        self._scenes.append(scene)
+        scene.enter()
+
+    def __len__(self):
+        return len(self._scenes)
+
+
+class PlayScene(Scene):
+    """The game itself: simulates every tick and draws every frame."""
+
+    simulates = True
+
+    def enter(self):
+        """Resume without catching up on the time spent in other scenes."""
+        game = self.game
+        game.clock.tick()
+        game.sim_clock.reset()
+        if game.renderer is not None:
+            game.renderer.invalidate()
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key in (pygame.K_p, pygame.K_ESCAPE):
+            self.game.scenes.push(PauseScene(self.game))
+
+    def update(self):
+        """Run one game tick and switch to the game-over scene on death."""
+        game = self.game
+        game.update()
+        if game.game_over:
+            game.scenes.replace(GameOverScene(game))
+
+    def draw(self, alpha):
+        self.game.draw(alpha)
+
+    def invalidate(self):
+        if self.game.renderer is not None:
+            self.game.renderer.invalidate()
+
+
+class StaticScene(Scene):
+    """
+    Scene whose whole screen is composed once into a cached surface.
+
+    The surface is presented when the scene is entered or invalidated;
+    every other frame draws nothing.
+    """
+
+    def __init__(self, game):
+        """Initialize with nothing composed yet."""
+        super().__init__(game)
+        self.surface = None
+        self.idle = False
+
+    def enter(self):
+        self.idle = False
+
+    def compose(self):
+        """Return the full-screen surface for this scene."""
+        raise NotImplementedError
+
+    def draw(self, alpha):
+        """Present the cached surface if it has not been shown yet."""
+        if self.idle:
+            return
+        if self.surface is None:
+            self.surface = self.compose()
+        self.game.renderer.show(self.surface)
+        self.idle = True
+
+    def invalidate(self):
+        self.idle = False
+
+    def _dimmed_frame(self, lines):
+        """Return the current screen, darkened, with lines of text on top."""
+        game = self.game
+        surface = game.renderer.capture()
+        shade = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        shade.fill(DIM_COLOR)
+        surface.blit(shade, (0, 0))
+        panel, rect = build_text_panel(game.font, lines, *surface.get_size())
+        surface.blit(panel, rect)
+        return surface
+
+
+class PauseScene(StaticScene):
+    """The frozen game, dimmed, until P or Escape is pressed."""
+
+    def compose(self):
+        return self._dimmed_frame(["Paused", "Press P to Resume"])
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key in (pygame.K_p, pygame.K_ESCAPE):
+            self.game.scenes.pop()
+
+
+class GameOverScene(StaticScene):
+    """The final frame with the game-over message, until R or Q."""
+
+    def compose(self):
+        # One last full frame, which includes the game-over overlay
+        game = self.game
+        game.draw()
+        return game.renderer.capture()
+
+    def handle_event(self, event):
+        if event.type != pygame.KEYDOWN:
+            return
+        game = self.game
+        if event.key == pygame.K_r:
+            game.reset_game()
+            game.scenes.replace(PlayScene(game))
+        elif event.key == pygame.K_q:
+            game.running = False
+
+
+class TitleScene(StaticScene):
+    """Title screen over the background, until any key is pressed."""
+
+    def compose(self):
+        game = self.game
+        surface = game.background.copy()
+        panel, rect = build_text_panel(
+            game.font, ["Save the Penguin!", "Press any key to start"],
+            *surface.get_size()
+        )
+        surface.blit(panel, rect)
+        return surface
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key != pygame.K_F3:
+            self.game.scenes.pop()
@@ -0,0 +1,223 @@
+"""
+Game state snapshots for Save the Penguin
+
+snapshot(game) packs everything a headless game needs to carry on (the
+penguin, every ship, the counters, the level cursor, and the state of
+both random number generators) into a small fixed-layout byte string,
+and restore(game, data) puts it back. A restored game plays out exactly
+like the original from that tick on, so a bot can try many futures from
+one position:
+
+    start = snapshot(game)
+    for action in range(ACTION_COUNT):
+        restore(game, start)
+        game.input_source = lambda: action
+        game.step(30)
+
+Snapshots are only meant for the game they came from (or one built with
+the same settings); they are not a save format across versions.
+SnapshotRing keeps the most recent snapshots for rewinding.
+
+Layout (little-endian):
+    header:  magic b"STPS", version (u8), flags (u8), seed (u64),
+             ship count (u32)
+    state:   frame, hits, ships dodged (u32), game over (u8), penguin
+             health, x, y, previous x, previous y (f64), level group
+             (i64), level offset (i64), next level tick (i64, -1 if done)
+    rng:     Mersenne Twister state (625 x u32), next gauss (f64)
+    fleet rng (vectorized games only): PCG64 state and increment
+             (4 x u64), has_uint32 (u8), uinteger (u32)
+    ships:   x, y, previous y, speed, each a block of ship count f64
+"""
+
+import struct
+from array import array
+from collections import deque
+from math import floor
+
+import numpy as np
+
+
+MAGIC = b"STPS"
+VERSION = 1
+HEADER = struct.Struct("<4sBBQI")
+STATE = struct.Struct("<IIIB5dqqq")
+RNG = struct.Struct("<625Id")
+FLEET_RNG = struct.Struct("<4QBI")
+
+# Header flags
+VECTORIZED = 1
+GAUSS = 2
+
+MASK_64 = (1 << 64) - 1
+
+
+def snapshot(game):
+    """Return the game's current state as bytes."""
+    fleet = game.fleet
+    flags = 0 if fleet is None else VECTORIZED
+    version, mt, gauss = game.rng.getstate()
+    if gauss is not None:
+        flags |= GAUSS
+
+    if fleet is None:
+        ships = game.ships
+        count = len(ships)
+        blocks = (array("d", [ship.x for ship in ships]),
+                  array("d", [ship.y for ship in ships]),
+                  array("d", [ship.prev_y for ship in ships]),
+                  array("d", [ship.speed for ship in ships]))
+    else:
+        count = fleet.count
+        y, speed = fleet.y[:count], fleet.speed[:count]
+        blocks = (fleet.x[:count], y, y - speed, speed)
+
+    penguin = game.penguin
+    prev_x, prev_y = penguin.prev_pos
+    group, offset, next_tick = _timeline_state(game.timeline)
+
+    parts = [
+        HEADER.pack(MAGIC, VERSION, flags, game.seed, count),
+        STATE.pack(game.frame, game.hits, game.ships_dodged, game.game_over,
+                   penguin.health, penguin.x, penguin.y, prev_x, prev_y,
+                   group, offset, next_tick),
+        RNG.pack(*mt, 0.0 if gauss is None else gauss),
+    ]
+    if fleet is not None:
+        state = fleet.rng.bit_generator.state
+        pcg = state["state"]
+        parts.append(FLEET_RNG.pack(
+            pcg["state"] >> 64, pcg["state"] & MASK_64,
+            pcg["inc"] >> 64, pcg["inc"] & MASK_64,
+            state["has_uint32"], state["uinteger"]
+        ))
+    parts.extend(block.tobytes() for block in blocks)
+    return b"".join(parts)
+
+
+def restore(game, data):
+    """
+    Put game back in the state recorded by snapshot().
+
+    Raises:
+        ValueError: if data is not a snapshot, or does not fit the game
+            (vectorized or not, or more ships than it can hold).
+    """
+    magic, version, flags, seed, count = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a Save the Penguin snapshot")
+    fleet = game.fleet
+    if bool(flags & VECTORIZED) != (fleet is not None):
+        raise ValueError("Snapshot was taken from a different kind of game")
+    capacity = game.ship_pool.capacity if fleet is None else fleet.capacity
+    if count > capacity:
+        raise ValueError("Snapshot has more ships than the game can hold")
+
+    offset = HEADER.size
+    (frame, hits, dodged, game_over, health, x, y, prev_x, prev_y,
+     group, level_offset, next_tick) = STATE.unpack_from(data, offset)
+    offset += STATE.size
+    rng_state = RNG.unpack_from(data, offset)
+    offset += RNG.size
+    gauss = rng_state[-1] if flags & GAUSS else None
+    game.rng.setstate((3, rng_state[:-1], gauss))
+
+    if fleet is not None:
+        state_hi, state_lo, inc_hi, inc_lo, has_uint32, uinteger = \
+            FLEET_RNG.unpack_from(data, offset)
+        offset += FLEET_RNG.size
+        fleet.rng.bit_generator.state = {
+            "bit_generator": "PCG64",
+            "state": {"state": state_hi << 64 | state_lo, "inc": inc_hi << 64 | inc_lo},
+            "has_uint32": has_uint32,
+            "uinteger": uinteger,
+        }
+
+    if fleet is None:
+        blocks = array("d")
+        blocks.frombytes(data[offset:offset + 4 * 8 * count])
+        _restore_ships(game, blocks[:count], blocks[count:2 * count],
+                       blocks[2 * count:3 * count], blocks[3 * count:])
+    else:
+        blocks = np.frombuffer(data, "<f8", 4 * count, offset).reshape(4, count)
+        fleet.count = count
+        fleet.x[:count] = blocks[0]
+        fleet.y[:count] = blocks[1]
+        fleet.speed[:count] = blocks[3]
+
+    penguin = game.penguin
+    penguin.health = int(health) if health.is_integer() else health
+    penguin.x, penguin.y = x, y
+    penguin.prev_pos = (prev_x, prev_y)
+    penguin.rect.x = floor(x)
+    penguin.rect.y = floor(y)
+
+    if game.timeline is not None:
+        game.timeline.seek(group, level_offset, None if next_tick < 0 else next_tick)
+
+    game.seed = seed
+    game.frame = frame
+    game.hits = hits
+    game.ships_dodged = dodged
+    game.game_over = bool(game_over)
+
+
+def _restore_ships(game, xs, ys, prev_ys, speeds):
+    """Refill a pooled game's ship list without rolling new spawns."""
+    pool, ships = game.ship_pool, game.ships
+    pool.release_all(ships)
+    for x, y, prev_y, speed in zip(xs, ys, prev_ys, speeds):
+        ship = pool.acquire(spawn=False)
+        ship.place(x, y, speed)
+        ship.prev_y = prev_y
+        ships.append(ship)
+
+
+def _timeline_state(timeline):
+    """Return the (group, offset, next tick) cursor of a level timeline."""
+    if timeline is None:
+        return 0, 0, -1
+    group, offset, next_tick = timeline.cursor()
+    return group, offset, -1 if next_tick is None else next_tick
+
+
+class SnapshotRing:
+    """
+    The most recent snapshots of a game, for rewinding.
+
+    Holds up to capacity snapshots; recording one more drops the oldest.
+    """
+
+    def __init__(self, capacity=300):
+        """Initialize an empty ring of capacity snapshots."""
+        self.capacity = capacity
+        self._snapshots = deque(maxlen=capacity)
+
+    def record(self, game):
+        """Snapshot game and keep it as the newest entry."""
+        self._snapshots.append(snapshot(game))
+
+    def rewind(self, game, steps=1):
+        """
+        Restore the snapshot recorded steps entries ago (1 is the newest)
+        and drop it along with the newer ones, so rewinding again goes
+        further back.
+
+        Returns:
+            bool: False (and game untouched) if fewer than steps
+            snapshots are held.
+        """
+        snapshots = self._snapshots
+        if steps < 1 or steps > len(snapshots):
+            return False
+        for _ in range(steps - 1):
+            snapshots.pop()
+        restore(game, snapshots.pop())
+        return True
+
+    def clear(self):
+        """Forget every snapshot."""
+        self._snapshots.clear()
+
+    def __len__(self):
+        return len(self._snapshots)
@@ -0,0 +1,110 @@
+import threading
+import pygame
+from assets import AssetManager, ALPHA, OPAQUE, RAW
+from SaveThePenguin import Ship, Penguin, SHIP_SIZE
+
+
+#AssetManager Tests
+
+def test_asset_decoded_and_scaled_once():
+    """Repeated requests for the same variant reuse the cached surface."""
+    assets = AssetManager()
+
+    first = assets.get("Ship.PNG", SHIP_SIZE)
+    second = assets.get("Ship.PNG", SHIP_SIZE)
+
+    assert first is second
+    assert first.get_size() == SHIP_SIZE
+    assert pygame.image.load.call_count == 1
+    assert pygame.transform.scale.call_count == 1
+
+def test_sizes_share_one_decode():
+    """Different sizes and formats of one file decode it only once."""
+    assets = AssetManager()
+
+    assets.get("Ship.PNG", (65, 65))
+    assets.get("Ship.PNG", (32, 32))
+    assets.get("Ship.PNG", pixel_format=OPAQUE)
+
+    assert pygame.image.load.call_count == 1
+    assert ("Ship.PNG", None, RAW) in assets
+
+def test_eviction_is_bounded_and_skips_pinned():
+    """Least recently used entries are evicted, preloaded ones are kept."""
+    assets = AssetManager(max_entries=3)
+    assets.preload([("PenguinCharacter.PNG", (75, 75))])
+
+    for size in range(10, 60, 10):
+        assets.get("Ship.PNG", (size, size))
+
+    assert len(assets) <= 3
+    assert ("PenguinCharacter.PNG", (75, 75), ALPHA) in assets
+
+def test_many_ships_never_reload_from_disk():
+    """Spawning a stream of ships decodes the sprite only once."""
+    assets = AssetManager()
+    Penguin("PenguinCharacter.PNG", 800, 600, assets=assets)
+    ships = [Ship("Ship.PNG", 800, assets=assets) for _ in range(20)]
+
+    assert pygame.image.load.call_count == 2
+    assert all(ship.image is ships[0].image for ship in ships)
+
+def test_mask_built_once_and_evicted_with_surface():
+    """Masks are cached per sprite variant and dropped with their surface."""
+    assets = AssetManager(max_entries=3)
+
+    mask = assets.mask("Ship.PNG", SHIP_SIZE)
+
+    assert mask is assets.mask("Ship.PNG", SHIP_SIZE)
+    assert mask.get_size() == SHIP_SIZE
+    for size in range(10, 60, 10):
+        assets.get("Ship.PNG", (size, size))
+    assert assets.mask("Ship.PNG", SHIP_SIZE) is not mask
+
+
+#Prefetch and Disk Cache Tests
+
+def test_prefetch_decodes_on_worker_thread():
+    """Prefetched assets are decoded off the main thread, then reused."""
+    threads = []
+    surface = pygame.Surface((100, 100), pygame.SRCALPHA)
+
+    def fake_load(path):
+        threads.append(threading.current_thread())
+        return surface
+
+    pygame.image.load.side_effect = fake_load
+    assets = AssetManager()
+    assets.prefetch([("Ship.PNG", SHIP_SIZE)])
+
+    assert assets.get("Ship.PNG", SHIP_SIZE).get_size() == SHIP_SIZE
+    assert assets.native_size("Ship.PNG") == (100, 100)
+    assert len(threads) == 1
+    assert threads[0] is not threading.main_thread()
+
+def test_disk_cache_skips_decode_on_next_launch(tmp_path):
+    """A second manager reads scaled pixels from disk instead of decoding."""
+    first = AssetManager(cache_dir=str(tmp_path))
+    first.get("Ship.PNG", SHIP_SIZE)
+    loads = pygame.image.load.call_count
+
+    second = AssetManager(cache_dir=str(tmp_path))
+    surface = second.get("Ship.PNG", SHIP_SIZE)
+
+    assert surface.get_size() == SHIP_SIZE
+    assert pygame.image.load.call_count == loads
+    assert pygame.transform.scale.call_count == 1
+    assert len(list(tmp_path.iterdir())) == 1
+
+def test_disk_cache_invalidated_when_source_changes(tmp_path):
+    """Editing the source image makes the cached pixels stale."""
+    source = tmp_path / "Sprite.PNG"
+    source.write_bytes(b"old")
+    cache_dir = str(tmp_path / "cache")
+    AssetManager(cache_dir=cache_dir).get(str(source), (10, 10))
+
+    source.write_bytes(b"newer")
+    loads = pygame.image.load.call_count
+    AssetManager(cache_dir=cache_dir).get(str(source), (10, 10))
+
+    assert pygame.image.load.call_count == loads + 1
@@ -0,0 +1,75 @@
+import pygame
+from atlas import SpriteAtlas, Viewport
+from render import FullScreenRenderer, ENTITIES
+from SaveThePenguin import Game
+
+
+def solid(size, color):
+    """Return an opaque SRCALPHA surface of one color."""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill(color)
+    return surface
+
+
+#SpriteAtlas Tests
+
+def test_atlas_packs_sprites_without_overlap():
+    """Every sprite gets its own area holding its pixels."""
+    red, green = solid((75, 75), (255, 0, 0, 255)), solid((65, 65), (0, 255, 0, 255))
+    atlas = SpriteAtlas({"penguin": red, "ship": green})
+
+    penguin, ship = atlas.areas["penguin"], atlas.areas["ship"]
+    assert not penguin.colliderect(ship)
+    assert atlas.surface.get_at(penguin.center)[:3] == (255, 0, 0)
+    assert atlas.surface.get_at(ship.center)[:3] == (0, 255, 0)
+    assert atlas.lookup[red] == penguin
+
+def test_variants_are_scaled_once_and_cached():
+    """variant(scale) builds a scaled atlas on first use and then reuses it."""
+    atlas = SpriteAtlas({"ship": solid((65, 65), (0, 0, 255, 255))})
+    double = atlas.variant(2.0)
+
+    assert double.areas["ship"].size == (130, 130)
+    assert atlas.variant(2.0) is double
+    assert double.variant(1.0) is atlas
+
+
+#Viewport Tests
+
+def test_viewport_scales_uniformly_and_letterboxes():
+    """A wider window keeps the aspect ratio with bars at the sides."""
+    viewport = Viewport((800, 600), (1920, 1080))
+
+    assert viewport.scale == 1.8
+    assert viewport.offset == (240, 0)
+    assert viewport.to_output((100, 50)) == (420, 90)
+    assert Viewport((800, 600), (800, 600)).identity
+
+
+#Scaled Rendering Tests
+
+def test_queue_sprites_draws_from_atlas_at_window_scale():
+    """Logical sprites become area blits from the atlas at mapped positions."""
+    image = solid((10, 10), (255, 0, 0, 255))
+    viewport = Viewport((100, 100), (200, 200))
+    atlas = SpriteAtlas({"ship": image}).variant(viewport.scale)
+    screen = pygame.Surface((200, 200))
+    renderer = FullScreenRenderer(screen, pygame.Surface((200, 200)), atlas=atlas,
+                                  viewport=viewport)
+
+    renderer.queue_sprites(ENTITIES, [(image, (30, 40))])
+    renderer.flush()
+
+    assert screen.get_at((60, 80))[:3] == (255, 0, 0)
+    assert screen.get_at((79, 99))[:3] == (255, 0, 0)
+    assert screen.get_at((80, 100))[:3] == (0, 0, 0)
+
+def test_game_runs_logically_in_any_window_size():
+    """The window takes window_size while the simulation keeps the background size."""
+    game = Game(window_size=(1600, 1200))
+
+    assert game.screen.get_size() == (1600, 1200)
+    assert game.background.get_size() == (1600, 1200)
+    assert (game.width, game.height) == (800, 600)
+    assert game.atlas.scale == 2.0
+    game.draw()
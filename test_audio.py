@@ -0,0 +1,78 @@
+import pygame
+import pytest
+from unittest.mock import MagicMock, patch
+from audio import AudioService, NullAudio, open_audio, HIT, WAVE, GAME_OVER
+from SaveThePenguin import Game
+
+
+@pytest.fixture
+def mixer(monkeypatch):
+    """Fixture for a real mixer on SDL's dummy audio driver."""
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    pygame.mixer.init()
+    yield
+    pygame.mixer.quit()
+
+
+#AudioService Tests
+
+def test_missing_files_get_generated_tones(mixer, tmp_path):
+    """Every effect is loaded once, as a tone when its file is missing."""
+    audio = AudioService({HIT: str(tmp_path / "hit.wav"), GAME_OVER: "nope.wav"})
+    try:
+        assert set(audio.sounds) == {HIT, GAME_OVER}
+        assert audio.sounds[GAME_OVER].get_length() > audio.sounds[HIT].get_length()
+    finally:
+        audio.stop()
+
+def test_full_pool_steals_oldest_voice(mixer):
+    """With every reserved channel busy, the oldest sound is replaced."""
+    audio = AudioService(channels=2)
+    try:
+        for name in (GAME_OVER, GAME_OVER, HIT):
+            audio.play(name)
+    finally:
+        audio.stop()
+
+    sounds = [channel.get_sound() for channel in audio.channels]
+    assert sounds == [audio.sounds[HIT], audio.sounds[GAME_OVER]]
+
+def test_play_returns_without_waiting_for_worker(mixer):
+    """play() only queues the request; the worker thread does the mixing."""
+    audio = AudioService()
+    with patch.object(audio, "_play") as play:
+        audio.play(WAVE)
+        audio.stop()
+    play.assert_called_once_with(audio.sounds[WAVE])
+
+
+#Fallback Tests
+
+def test_no_mixer_falls_back_to_null_audio():
+    """Without an initialized mixer, sound effects are silently skipped."""
+    with patch("pygame.mixer.get_init", return_value=None):
+        audio = open_audio()
+    assert isinstance(audio, NullAudio)
+    audio.play(HIT)
+    audio.stop()
+
+def test_mixer_errors_fall_back_to_null_audio():
+    """A mixer that fails while setting up channels gives NullAudio."""
+    with patch("pygame.mixer.get_init", return_value=(44100, -16, 2)), \
+         patch("pygame.mixer.set_reserved", side_effect=pygame.error("no device")):
+        assert isinstance(open_audio(), NullAudio)
+
+
+#Game Integration Tests
+
+def test_game_sends_hit_and_game_over_sounds():
+    """Collisions and the end of the game queue their sound effects."""
+    game = Game(wave_size=(1, 1), damage=50)
+    game.audio = MagicMock()
+    game.ships[0].rect = game.penguin.get_rect().copy()
+
+    game.update()
+    game.check_game_over()
+
+    played = [call.args[0] for call in game.audio.play.call_args_list]
+    assert played == [HIT, GAME_OVER]
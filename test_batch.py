@@ -0,0 +1,68 @@
+import csv
+import pytest
+from batch import run_game, run_batch, write_results, summarize, main
+
+
+PARAM_SETS = [
+    {"ship_speed": (3, 6), "wave_size": (1, 3), "damage": 10, "penguin_speed": 5},
+    {"ship_speed": (8, 10), "wave_size": (4, 6), "damage": 25, "penguin_speed": 3},
+]
+
+
+#run_game Tests
+
+def test_run_game_is_deterministic_per_seed():
+    """The same seed and params always give the same stats."""
+    first = run_game(3, PARAM_SETS[0], max_frames=3000)
+    assert first == run_game(3, PARAM_SETS[0], max_frames=3000)
+    assert 0 < first["frames"] <= 3000
+
+def test_run_game_applies_params():
+    """Damage and speed params reach the game."""
+    stats = run_game(1, {"damage": 50, "wave_size": (5, 5)}, max_frames=5000, policy="idle")
+    assert stats["hits"] == 1
+
+
+#run_batch Tests
+
+def test_run_batch_covers_every_seed_and_param_set():
+    """Each (param set, seed) pair runs exactly once, in order."""
+    results = run_batch(range(3), PARAM_SETS, max_frames=500, workers=1)
+    assert [(index, seed) for index, seed, _ in results] == [
+        (0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2)
+    ]
+
+def test_run_batch_process_pool_matches_serial():
+    """Running across processes gives the same results as in-process."""
+    serial = run_batch(range(4), PARAM_SETS, max_frames=300, workers=1)
+    parallel = run_batch(range(4), PARAM_SETS, max_frames=300, workers=2)
+    assert parallel == serial
+
+def test_run_batch_rejects_unknown_policy():
+    """Unknown bot policies are reported before any game runs."""
+    with pytest.raises(ValueError):
+        run_batch(range(1), [{}], policy="cheat")
+
+
+#Output Tests
+
+def test_write_results_and_summary(tmp_path):
+    """Results are written one row per game with flattened params."""
+    results = run_batch(range(2), PARAM_SETS, max_frames=200, workers=1)
+    path = tmp_path / "results.csv"
+    write_results(path, results, PARAM_SETS)
+
+    with open(path) as f:
+        rows = list(csv.DictReader(f))
+
+    assert len(rows) == 4
+    assert rows[2]["ship_speed_min"] == "8"
+    assert rows[2]["damage"] == "25"
+    assert len(summarize(results, 2)) == 2
+
+def test_main_writes_csv(tmp_path, capsys):
+    """The CLI runs a tiny sweep and prints a summary line."""
+    out = tmp_path / "out.csv"
+    assert main(["--seeds", "2", "--max-frames", "100", "--workers", "1", "--out", str(out)]) == 0
+    assert out.exists()
+    assert "set 0" in capsys.readouterr().out
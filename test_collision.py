@@ -0,0 +1,141 @@
+import random
+import pygame
+import pytest
+from collision import SpatialHash, collide_pairs, masks_overlap
+from SaveThePenguin import Game
+
+
+def random_rects(count, size, seed):
+    """Return count seeded random rects on an 800x600 screen."""
+    rng = random.Random(seed)
+    return [
+        pygame.Rect(rng.randint(-50, 800), rng.randint(-50, 600), size, size)
+        for _ in range(count)
+    ]
+
+
+#SpatialHash Tests
+
+def test_spatial_hash_query_matches_colliderect():
+    """Grid queries return exactly the rects that really overlap."""
+    rects = random_rects(300, 65, seed=1)
+    grid = SpatialHash(cell_size=64)
+    grid.rebuild(rects)
+    probe = pygame.Rect(300, 200, 75, 75)
+
+    assert len(grid) == 300
+    assert grid.query(probe) == probe.collidelistall(rects)
+
+def test_spatial_hash_rect_spanning_cells_found_once():
+    """A rect covering several cells is only reported once."""
+    grid = SpatialHash(cell_size=10)
+    grid.insert(pygame.Rect(0, 0, 45, 45))
+    assert grid.query(pygame.Rect(5, 5, 30, 30)) == [0]
+
+
+#collide_pairs Tests
+
+def test_collide_pairs_grid_and_fallback_agree():
+    """The grid path and the collidelistall fallback give the same pairs."""
+    actors = random_rects(40, 75, seed=2)
+    ships = random_rects(500, 65, seed=3)
+
+    brute = collide_pairs(actors, ships, small_n=10**6)
+    gridded = collide_pairs(actors, ships, small_n=0, min_grid_queries=0)
+
+    assert brute == gridded
+    assert brute
+
+def test_collide_pairs_empty_inputs():
+    """No rects on either side means no pairs."""
+    assert collide_pairs([], [pygame.Rect(0, 0, 1, 1)]) == []
+    assert collide_pairs([pygame.Rect(0, 0, 1, 1)], []) == []
+
+
+def disc_mask(size):
+    """Return the mask of a filled circle touching the edges of a size x size square."""
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(surface, (255, 255, 255), (size // 2, size // 2), size // 2)
+    return pygame.mask.from_surface(surface)
+
+
+#Mask Tests
+
+def test_masks_ignore_transparent_corners():
+    """Rects that only overlap at transparent corners do not collide."""
+    mask = disc_mask(60)
+    a = pygame.Rect(0, 0, 60, 60)
+    corner = pygame.Rect(50, 50, 60, 60)
+    centre = pygame.Rect(30, 0, 60, 60)
+
+    assert a.colliderect(corner)
+    assert masks_overlap(a, mask, corner, mask) is False
+    assert masks_overlap(a, mask, centre, mask) is True
+
+def test_ship_check_collision_with_masks():
+    """Ship.check_collision applies the mask check when given the penguin's mask."""
+    game = Game(wave_size=(1, 1))
+    ship = game.ships[0]
+    ship.config.mask = disc_mask(65)
+    penguin = pygame.Rect(0, 0, 75, 75)
+    ship.rect.topleft = (penguin.right - 5, penguin.bottom - 5)
+
+    assert ship.check_collision(penguin) is True
+    assert ship.check_collision(penguin, disc_mask(75)) is False
+
+def test_ship_view_check_collision_with_masks():
+    """ShipView.check_collision takes the penguin's mask like Ship does."""
+    game = Game(wave_size=(1, 1), vectorized=True)
+    game.fleet.mask = disc_mask(65)
+    penguin = pygame.Rect(0, 0, 75, 75)
+    view = game.fleet[0]
+    view.rect = pygame.Rect(penguin.right - 5, penguin.bottom - 5, 65, 65)
+
+    assert view.check_collision(penguin) is True
+    assert view.check_collision(penguin, disc_mask(75)) is False
+
+
+#Game Integration Tests
+
+def test_handle_collisions_ignores_distant_ships():
+    """Ships far from the penguin cause no damage and no new wave."""
+    game = Game(wave_size=(2, 2))
+    for ship in game.ships:
+        ship.rect.topleft = (0, -500)
+    ships = list(game.ships)
+
+    game.handle_collisions()
+
+    assert game.penguin.health == 50
+    assert game.ships == ships
+
+def test_vectorized_handle_collisions_damages_penguin():
+    """A fleet ship on top of the penguin damages it once."""
+    game = Game(vectorized=True, pool_size=100, wave_size=(100, 100))
+    game.fleet.y[:100] = -500
+    game.fleet[0].rect = game.penguin.get_rect()
+
+    game.handle_collisions()
+
+    assert game.penguin.health == 40
+
+@pytest.mark.parametrize("vectorized", (False, True))
+def test_mask_mode_skips_corner_overlaps(vectorized):
+    """In mask mode a ship touching only the penguin's empty corner does no damage."""
+    rect_game = Game(wave_size=(1, 1), vectorized=vectorized)
+    mask_game = Game(wave_size=(1, 1), vectorized=vectorized, collision_mode="mask")
+
+    for game in (rect_game, mask_game):
+        game.penguin.mask = disc_mask(75)
+        (game.fleet if vectorized else game.ship_config).mask = disc_mask(65)
+        penguin = game.penguin.get_rect()
+        game.ships[0].rect = pygame.Rect(penguin.right - 5, penguin.bottom - 5, 65, 65)
+        game.handle_collisions()
+
+    assert rect_game.penguin.health == 40
+    assert mask_game.penguin.health == 50
+
+def test_unknown_collision_mode_rejected():
+    """Only the rect and mask collision modes exist."""
+    with pytest.raises(ValueError):
+        Game(collision_mode="circle")
@@ -0,0 +1,94 @@
+import pygame
+from unittest.mock import patch
+from controls import InputState, allow_input_events, LEFT, RIGHT, UP, DOWN
+from SaveThePenguin import Game
+
+
+def key(kind, code):
+    """Return a KEYDOWN or KEYUP event for a key."""
+    return pygame.event.Event(kind, key=code)
+
+
+#InputState Tests
+
+def test_keydown_and_keyup_track_held_actions():
+    """Actions stay held from KEYDOWN until the matching KEYUP."""
+    state = InputState()
+    state.process([key(pygame.KEYDOWN, pygame.K_LEFT), key(pygame.KEYDOWN, pygame.K_UP)])
+    assert state() == LEFT | UP
+
+    state.process([key(pygame.KEYUP, pygame.K_LEFT)])
+    assert state() == UP
+
+def test_two_keys_for_one_action():
+    """Releasing one of two keys bound to the same action keeps it held."""
+    state = InputState()
+    state.bind(pygame.K_a, LEFT)
+    state.process([key(pygame.KEYDOWN, pygame.K_a), key(pygame.KEYDOWN, pygame.K_LEFT),
+                   key(pygame.KEYUP, pygame.K_LEFT)])
+    assert state() == LEFT
+
+def test_rebinding_keys():
+    """Rebound keys move the penguin and unbound keys are ignored."""
+    state = InputState()
+    state.bind(pygame.K_d, RIGHT)
+    state.unbind(pygame.K_RIGHT)
+    state.process([key(pygame.KEYDOWN, pygame.K_RIGHT)])
+    assert state() == 0
+
+    state.process([key(pygame.KEYDOWN, pygame.K_d)])
+    assert state() == RIGHT
+
+def test_gamepad_hat_stick_and_buttons():
+    """The hat, left stick, and d-pad buttons all produce directions."""
+    state = InputState()
+    state.process([pygame.event.Event(pygame.JOYHATMOTION, value=(-1, 1))])
+    assert state() == LEFT | UP
+
+    state.process([pygame.event.Event(pygame.JOYHATMOTION, value=(0, 0)),
+                   pygame.event.Event(pygame.JOYAXISMOTION, axis=1, value=0.9)])
+    assert state() == DOWN
+
+    state.process([pygame.event.Event(pygame.JOYAXISMOTION, axis=1, value=0.1),
+                   pygame.event.Event(pygame.JOYBUTTONDOWN, button=14)])
+    assert state() == RIGHT
+
+def test_focus_loss_releases_everything():
+    """Keys held when the window loses focus are not stuck down."""
+    state = InputState()
+    state.process([key(pygame.KEYDOWN, pygame.K_LEFT),
+                   pygame.event.Event(pygame.WINDOWFOCUSLOST)])
+    assert state() == 0
+
+def test_pushed_events_apply_on_next_call():
+    """Bots can drive the state by queueing events."""
+    state = InputState()
+    state.push(key(pygame.KEYDOWN, pygame.K_DOWN))
+    assert state.actions == 0
+    assert state() == DOWN
+
+def test_allow_input_events_blocks_others():
+    """Only input event types stay allowed on the event queue."""
+    allow_input_events()
+    try:
+        assert not pygame.event.get_blocked(pygame.KEYUP)
+        assert pygame.event.get_blocked(pygame.MOUSEMOTION)
+    finally:
+        pygame.event.set_allowed(None)
+
+
+#Game Integration Tests
+
+def test_game_moves_penguin_from_events_without_polling():
+    """Game.handle_events feeds the input state; update never polls the keyboard."""
+    game = Game()
+    start_x = game.penguin.rect.x
+
+    with patch("pygame.event.get", return_value=[key(pygame.KEYDOWN, pygame.K_RIGHT)]):
+        game.handle_events()
+    with patch("pygame.key.get_pressed") as get_pressed:
+        game.update()
+        game.update()
+
+    get_pressed.assert_not_called()
+    assert game.penguin.rect.x == start_x + 2 * game.penguin.speed
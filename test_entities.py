@@ -4,6 +4,7 @@ import sys
 import random
 from unittest.mock import MagicMock, patch
 from collections import defaultdict
+from controls import RIGHT
 from SaveThePenguin import Penguin, Ship, Game 
 
 
@@ -165,6 +166,46 @@ def test_ship_collision_check_positive(ship, penguin):
     ship.rect.x += penguin.rect.width + 1
     assert ship.check_collision(penguin.get_rect()) is False
 
+def test_ship_sub_pixel_speed_accumulates():
+    """Fractional speeds move the rect once enough fractions add up."""
+    ship = Ship("Ship.PNG", 800, speed_range=(0.5, 0.5))
+    start_y = ship.rect.y
+
+    ship.update()
+    assert ship.rect.y == start_y
+    ship.update()
+    assert ship.rect.y == start_y + 1
+
+def test_ship_follows_rect_moved_from_outside(ship):
+    """Moving the rect directly also moves the float position."""
+    ship.rect.y = 300
+    ship.update()
+    assert ship.rect.y == 300 + ship.speed
+
+def test_penguin_sub_pixel_speed():
+    """A fractional penguin speed moves it by whole pixels over several ticks."""
+    penguin = Penguin("PenguinCharacter.PNG", 800, 600, speed=0.25)
+    start_x = penguin.rect.x
+
+    for _ in range(4):
+        penguin.update(actions=RIGHT)
+
+    assert penguin.rect.x == start_x + 1
+
+
+#Memory Layout Tests
+
+def test_entities_are_slotted():
+    """Entities have no per-instance __dict__."""
+    assert not hasattr(Penguin("PenguinCharacter.PNG", 800, 600), "__dict__")
+    assert not hasattr(Ship("Ship.PNG", 800), "__dict__")
+
+def test_game_ships_share_config(game):
+    """Every pooled ship references one shared config and sprite."""
+    ships = [game.ship_pool.acquire() for _ in range(5)]
+    assert all(ship.config is game.ship_config for ship in ships)
+    assert all(ship.image is ships[0].image for ship in ships)
+
 
 #Game Class Tests
 
@@ -0,0 +1,101 @@
+import numpy as np
+from controls import LEFT
+from SaveThePenguin import Game
+from env import (PenguinEnv, VectorEnv, observation_size, OBS_BASE, SHIP_FEATURES,
+                 HIT_REWARD, TICK_REWARD)
+
+
+#PenguinEnv Tests
+
+def test_reset_returns_compact_observation():
+    """Observations are float32 vectors with the documented layout."""
+    env = PenguinEnv(k_ships=3, seed=1)
+    obs, info = env.reset()
+
+    assert obs.shape == (observation_size(3),)
+    assert obs.dtype == np.float32
+    assert obs[2] == 1.0  # full health
+    assert info["seed"] == 1
+
+def test_nearest_ships_come_first():
+    """Ship slots are ordered by distance to the penguin and padded with zeros."""
+    env = PenguinEnv(k_ships=4, seed=2, wave_size=(2, 2))
+    env.reset()
+    fleet = env.game.fleet
+    fleet.x[:2] = (100, 300)
+    fleet.y[:2] = (0, 400)
+
+    obs, *_ = env.step(0)
+    ships = obs[OBS_BASE:].reshape(4, SHIP_FEATURES)
+
+    assert ships[0, 1] > ships[1, 1]  # the lower ship is nearer
+    assert list(ships[:, 3]) == [1.0, 1.0, 0.0, 0.0]
+
+def test_step_moves_penguin_and_rewards_survival():
+    """An action moves the penguin and a quiet tick earns the tick reward."""
+    env = PenguinEnv(seed=3)
+    obs, _ = env.reset()
+    start_x = obs[0]
+    env.game.fleet.y[:env.game.fleet.count] = -500
+
+    obs, reward, terminated, truncated, _ = env.step(LEFT)
+
+    assert obs[0] < start_x
+    assert reward == TICK_REWARD
+    assert not terminated and not truncated
+
+def test_hit_is_penalized_and_death_terminates():
+    """Getting hit costs reward; losing all health ends the episode."""
+    env = PenguinEnv(seed=4, damage=50, wave_size=(1, 1))
+    env.reset()
+    env.game.fleet[0].rect = env.game.penguin.get_rect()
+
+    _, reward, terminated, _, _ = env.step(0)
+
+    assert reward == TICK_REWARD + HIT_REWARD
+    assert terminated
+
+def test_reset_with_seed_is_reproducible():
+    """Reseeding replays the same episode for the same actions."""
+    env = PenguinEnv(seed=5)
+    runs = []
+    for _ in range(2):
+        env.reset(seed=42)
+        runs.append(np.array([env.step(a % 16)[0].copy() for a in range(200)]))
+    assert np.array_equal(runs[0], runs[1])
+
+def test_reseed_matches_new_game():
+    """reset(seed) spawns the same ships as a new game with that seed."""
+    env = PenguinEnv(seed=7)
+    env.reset(seed=99)
+    fresh = Game(headless=True, vectorized=True, seed=99)
+    assert [ship.rect for ship in env.game.ships] == [ship.rect for ship in fresh.ships]
+
+def test_observation_buffer_is_reused():
+    """step() writes into the same array instead of allocating a new one."""
+    env = PenguinEnv(seed=6)
+    obs, _ = env.reset()
+    assert env.step(0)[0] is obs
+
+
+#VectorEnv Tests
+
+def test_vector_env_steps_games_in_lockstep():
+    """Each game gets its own action and row of the result arrays."""
+    envs = VectorEnv(4, k_ships=2, seed=10)
+    obs, _ = envs.reset()
+    obs, rewards, terminated, truncated, _ = envs.step(np.full(4, LEFT))
+
+    assert obs.shape == (4, observation_size(2))
+    assert rewards.shape == terminated.shape == truncated.shape == (4,)
+    assert len({env.game.seed for env in envs.envs}) == 4
+
+def test_vector_env_resets_finished_games():
+    """Truncated games start a new episode on the same step."""
+    envs = VectorEnv(2, max_steps=3, seed=20)
+    envs.reset()
+    for _ in range(3):
+        _, _, _, truncated, _ = envs.step([0, 0])
+
+    assert truncated.all()
+    assert all(env.game.frame == 0 for env in envs.envs)
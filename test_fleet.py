@@ -0,0 +1,89 @@
+import numpy as np
+import pygame
+import pytest
+from fleet import ShipFleet
+from SaveThePenguin import Game, SHIP_SIZE
+
+
+@pytest.fixture
+def fleet():
+    """Fixture for a seeded ShipFleet on an 800x600 screen."""
+    image = pygame.Surface(SHIP_SIZE, pygame.SRCALPHA)
+    return ShipFleet(100, 800, 600, image, rng=np.random.default_rng(0))
+
+
+#ShipFleet Tests
+
+def test_fleet_spawn_within_limits(fleet):
+    """Spawned ships start above the screen with speeds in range."""
+    assert fleet.spawn(40) == 40
+    n = len(fleet)
+    assert np.all(fleet.x[:n] >= 0)
+    assert np.all(fleet.x[:n] <= 800 - SHIP_SIZE[0])
+    assert np.all((fleet.y[:n] >= -120) & (fleet.y[:n] <= -40))
+    assert np.all((fleet.speed[:n] >= 3) & (fleet.speed[:n] <= 6))
+
+def test_fleet_spawn_capped_at_capacity(fleet):
+    """The fleet never holds more than its capacity."""
+    assert fleet.spawn(250) == 100
+    assert len(fleet) == 100
+
+def test_fleet_update_moves_and_culls(fleet):
+    """Ships move by their speed and off-screen ships are compacted away."""
+    fleet.spawn(3)
+    fleet.y[:3] = [0, 599, 10]
+    fleet.speed[:3] = [3, 5, 4]
+
+    assert fleet.update() == 1
+    assert len(fleet) == 2
+    assert list(fleet.y[:2]) == [3, 14]
+
+def test_fleet_recycle_respawns_in_place():
+    """With recycle on, off-screen ships are respawned above the screen."""
+    image = pygame.Surface(SHIP_SIZE, pygame.SRCALPHA)
+    fleet = ShipFleet(10, 800, 600, image, recycle=True)
+    fleet.spawn(10)
+    fleet.y[:10] = 600
+
+    assert fleet.update() == 10
+    assert len(fleet) == 10
+    assert np.all(fleet.y[:10] < 0)
+
+def test_ship_view_matches_ship_interface(fleet):
+    """Views expose rect, speed, draw, and collision like Ship does."""
+    fleet.spawn(1)
+    view = fleet[0]
+    view.rect = pygame.Rect(100, 200, 65, 65)
+    view.speed = 4
+
+    view.update()
+
+    assert view.get_rect().topleft == (100, 204)
+    assert view.check_collision(pygame.Rect(120, 220, 10, 10))
+    assert not view.is_off_screen(600)
+    view.draw(pygame.Surface((800, 600)))
+
+def test_fleet_floors_positions_like_ship(fleet):
+    """Rects, sprites, collisions, and positions all floor like Ship."""
+    fleet.spawn(1)
+    fleet.x[0], fleet.y[0] = 10.5, -40.5
+
+    assert fleet[0].get_rect().topleft == (10, -41)
+    assert fleet[0].sprite()[1] == (10, -41)
+    assert [list(axis) for axis in fleet.positions()] == [[10], [-41]]
+    assert list(fleet.collide_rect(pygame.Rect(0, 23, 20, 20))) == [0]
+    assert list(fleet.collide_rect(pygame.Rect(0, 24, 20, 20))) == []
+
+
+#Game Integration Tests
+
+def test_vectorized_game_runs_waves():
+    """A vectorized game spawns, moves, and respawns waves via the fleet."""
+    game = Game(vectorized=True, pool_size=1000, wave_size=(500, 500))
+    assert len(game.ships) == 500
+
+    game.fleet.y[:500] = game.height + 1
+    game.update_ships()
+
+    assert len(game.ships) == 500
+    assert all(not ship.is_off_screen(game.height) for ship in game.ships)
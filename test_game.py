@@ -136,3 +136,12 @@ def test_game_check_game_over_state_change(game, penguin):
     assert game.game_over is True
     
 
+
+def test_game_defers_music_until_run(game):
+    """Creating a game does not touch the mixer; starting the loop does."""
+    pygame.mixer.music.play.assert_not_called()
+
+    with patch("pygame.mixer.get_init", return_value=True):
+        game.start_music()
+
+    pygame.mixer.music.play.assert_called_once()
@@ -0,0 +1,66 @@
+import pygame
+from unittest.mock import patch
+from controls import ScriptedInput, keys_to_actions, LEFT, RIGHT, UP
+from conftest import make_keys
+from SaveThePenguin import Game
+
+
+def run_seeded(seed, frames, **kwargs):
+    """Run a seeded headless game and return its final state."""
+    game = Game(headless=True, seed=seed,
+                input_source=ScriptedInput([LEFT, RIGHT, UP], loop=True), **kwargs)
+    game.simulate(frames)
+    return game.frame, game.penguin.health, [ship.get_rect().topleft for ship in game.ships]
+
+
+#controls Tests
+
+def test_keys_to_actions_bitmask():
+    """Held arrow keys map onto the matching action bits."""
+    assert keys_to_actions(make_keys()) == 0
+    assert keys_to_actions(make_keys(pygame.K_LEFT, pygame.K_UP)) == LEFT | UP
+
+def test_scripted_input_plays_then_stops_or_loops():
+    """Scripted sources replay frames in order, then idle or loop."""
+    once = ScriptedInput([LEFT, RIGHT])
+    looped = ScriptedInput([LEFT, RIGHT], loop=True)
+
+    assert [once() for _ in range(4)] == [LEFT, RIGHT, 0, 0]
+    assert [looped() for _ in range(4)] == [LEFT, RIGHT, LEFT, RIGHT]
+
+
+#Headless Game Tests
+
+def test_headless_game_opens_no_window_or_music():
+    """Headless games skip the display, fonts, and mixer."""
+    with patch("pygame.display.set_mode") as set_mode:
+        game = Game(headless=True)
+
+    set_mode.assert_not_called()
+    pygame.mixer.music.play.assert_not_called()
+    assert game.screen is None
+    assert game.font is None
+
+def test_headless_scripted_input_moves_penguin():
+    """Penguin movement comes from the scripted source, not the keyboard."""
+    game = Game(headless=True, input_source=ScriptedInput([LEFT] * 10))
+    game.ships.clear()
+    start_x = game.penguin.rect.x
+
+    game.penguin.update(game.input_source())
+
+    assert game.penguin.rect.x == start_x - game.penguin.speed
+
+def test_headless_runs_are_deterministic():
+    """The same seed and script always produce the same game."""
+    assert run_seeded(7, 2000) == run_seeded(7, 2000)
+    assert run_seeded(7, 2000, vectorized=True) == run_seeded(7, 2000, vectorized=True)
+
+def test_step_stops_at_game_over():
+    """step() never simulates past the end of the game."""
+    game = Game(headless=True, input_source=ScriptedInput([]))
+    game.penguin.health = 0
+    game.check_game_over()
+
+    assert game.step(100) == 0
+    assert game.simulate(100) == 0
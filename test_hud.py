@@ -0,0 +1,66 @@
+import pygame
+from unittest.mock import MagicMock
+from hud import TextCache, build_game_over_overlay
+from SaveThePenguin import Game
+
+
+def make_font():
+    """Return a fake font whose render() builds a fresh surface each call."""
+    font = MagicMock()
+    font.render.side_effect = lambda text, aa, color: pygame.Surface((len(text) * 8, 20), pygame.SRCALPHA)
+    return font
+
+
+#TextCache Tests
+
+def test_text_cache_renders_each_string_once():
+    """Repeated requests for the same text and color hit the cache."""
+    font = make_font()
+    cache = TextCache(font)
+
+    first = cache.render("Health: 50", (255, 255, 255))
+    second = cache.render("Health: 50", (255, 255, 255))
+
+    assert first is second
+    assert font.render.call_count == 1
+
+def test_text_cache_rerenders_on_color_change():
+    """A new color is a new key."""
+    font = make_font()
+    cache = TextCache(font)
+
+    cache.render("Health: 20", (255, 255, 255))
+    cache.render("Health: 20", (255, 0, 0))
+
+    assert font.render.call_count == 2
+
+def test_text_cache_is_lru_bounded():
+    """The least recently used string is evicted first."""
+    font = make_font()
+    cache = TextCache(font, maxsize=2)
+
+    cache.render("a", (0, 0, 0))
+    cache.render("b", (0, 0, 0))
+    cache.render("a", (0, 0, 0))
+    cache.render("c", (0, 0, 0))
+    cache.render("a", (0, 0, 0))
+
+    assert len(cache) == 2
+    assert font.render.call_count == 3
+
+
+#Game Integration Tests
+
+def test_game_over_overlay_built_once():
+    """The game-over text is rasterized once, however many frames draw it."""
+    font = make_font()
+    overlay, rect = build_game_over_overlay(font, 800, 600)
+    assert overlay.get_size() == rect.size
+    assert rect.center[0] == 400
+
+    game = Game()
+    game.game_over = True
+    for _ in range(5):
+        game.draw()
+
+    assert game.font.render.call_count == 3  # health text + two overlay lines
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+from atlas import Viewport
+from particles import ParticleSystem, Effect, EXPLOSION
+from SaveThePenguin import Game
+
+
+@pytest.fixture
+def system():
+    """Fixture for a seeded ParticleSystem holding up to 100 particles."""
+    return ParticleSystem(100, rng=np.random.default_rng(0))
+
+
+#ParticleSystem Tests
+
+def test_emit_respects_hard_cap(system):
+    """Emissions past capacity are dropped."""
+    assert system.emit(EXPLOSION, 10, 20) == 48
+    assert system.emit(EXPLOSION, 10, 20) == 48
+    assert system.emit(EXPLOSION, 10, 20) == 4
+    assert system.emit(EXPLOSION, 10, 20) == 0
+    assert len(system) == 100
+
+def test_emit_at_many_origins(system):
+    """Each origin in an array gets its own particles."""
+    dots = Effect(2, (0, 0), (5, 5), [(255, 0, 0)])
+    system.emit(dots, np.array([1.0, 2.0, 3.0]), 50)
+    assert list(system.x[:6]) == [1, 1, 2, 2, 3, 3]
+    assert np.all(system.y[:6] == 50)
+
+def test_update_integrates_and_culls(system):
+    """Particles move by their velocity under gravity and expire with their life."""
+    short = Effect(3, (2, 2), (1, 1), [(255, 0, 0)], angle=(0, 0))
+    long = Effect(2, (0, 0), (10, 10), [(0, 0, 255)], gravity=0.5)
+    system.emit(short, 0, 0)
+    system.emit(long, 5, 5)
+
+    system.update()
+
+    assert len(system) == 2
+    assert list(system.y[:2]) == [5.5, 5.5]
+    assert list(system.life[:2]) == [9, 9]
+
+def test_queue_batches_one_call_per_color(system):
+    """Drawing hands the renderer one batch of positions per color."""
+    system.emit(Effect(10, (1, 2), (5, 5), [(255, 0, 0), (0, 255, 0)]), 50, 50)
+    renderer = MagicMock(viewport=None)
+
+    system.queue(renderer, "entities")
+
+    calls = renderer.queue_positions.call_args_list
+    assert len(calls) == 2
+    assert sum(len(call.args[2]) for call in calls) == 10
+
+def test_queue_scales_particles_with_viewport(system):
+    """Under a scaled viewport particles are drawn at the window's scale."""
+    system.emit(Effect(4, (1, 2), (5, 5), [(255, 0, 0)], size=3), 50, 50)
+    renderer = MagicMock(viewport=Viewport((800, 600), (1600, 1200)))
+
+    system.queue(renderer, "entities")
+
+    surface = renderer.queue_positions.call_args.args[1]
+    assert surface.get_size() == (6, 6)
+    assert surface.get_at((0, 0))[:3] == (255, 0, 0)
+    assert system.surfaces_at(2.0)[0] is surface
+
+
+#Game Effect Tests
+
+def test_hit_emits_explosion():
+    """A collision leaves an explosion of particles where it happened."""
+    game = Game(wave_size=(1, 1))
+    game.ships[0].rect = game.penguin.get_rect().copy()
+    game.handle_collisions()
+    assert len(game.particles) == EXPLOSION.count
+
+    game.draw()
+    game.reset_game()
+    assert len(game.particles) == 0
+
+def test_headless_games_have_no_particles():
+    """Effects are visual only, so headless games skip them."""
+    game = Game(headless=True, snow=True)
+    assert game.particles is None and not game.snow
+    game.step(10)
+
+def test_snow_falls_and_stays_capped():
+    """Snow keeps falling without ever passing the particle cap."""
+    game = Game(snow=True, particle_cap=50, wave_size=(1, 1))
+    game.penguin.health = float("inf")
+    game.step(300)
+    assert 0 < len(game.particles) <= 50
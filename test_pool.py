@@ -0,0 +1,62 @@
+import pytest
+from unittest.mock import patch
+from pool import ShipPool
+from SaveThePenguin import Ship, Game
+
+
+@pytest.fixture
+def pool():
+    """Fixture for a small ShipPool."""
+    return ShipPool(lambda: Ship("Ship.PNG", 800), 4)
+
+
+#ShipPool Tests
+
+def test_pool_acquire_respawns_and_exhausts(pool):
+    """Acquired ships are respawned and the pool never grows."""
+    with patch("random.randint", side_effect=[5, 123, -60]):
+        ship = pool.acquire()
+
+    assert ship.speed == 5
+    assert ship.get_rect().topleft == (123, -60)
+
+    for _ in range(3):
+        assert pool.acquire() is not None
+    assert pool.acquire() is None
+
+def test_pool_release_is_bounded(pool):
+    """Releasing more ships than capacity does not grow the free list."""
+    pool.release(Ship("Ship.PNG", 800))
+    assert pool.free_count() == 4
+
+
+#Game Integration Tests
+
+def test_game_waves_reuse_pooled_ships():
+    """Repeated waves only ever hand out ships owned by the pool."""
+    game = Game(pool_size=8, wave_size=(3, 3))
+    seen = set()
+    for _ in range(20):
+        game.spawn_wave()
+        seen.update(id(ship) for ship in game.ships)
+
+    assert len(game.ships) == 3
+    assert len(seen) <= 8
+
+def test_update_ships_compacts_in_place():
+    """Off-screen ships are recycled without replacing the live list."""
+    game = Game(pool_size=8, wave_size=(3, 3))
+    ships = game.ships
+    ships[0].rect.top = game.height + 10
+    free_before = game.ship_pool.free_count()
+
+    game.update_ships()
+
+    assert game.ships is ships
+    assert len(ships) == 2
+    assert game.ship_pool.free_count() == free_before + 1
+
+def test_large_wave_capped_by_pool_size():
+    """A wave larger than the pool is capped at the pool capacity."""
+    game = Game(pool_size=50, wave_size=(200, 200))
+    assert len(game.ships) == 50
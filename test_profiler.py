@@ -0,0 +1,134 @@
+import csv
+import json
+import pygame
+from unittest.mock import MagicMock, patch
+from profiler import FrameProfiler, NullProfiler, FRAME
+from SaveThePenguin import Game
+
+
+#FrameProfiler Tests
+
+def test_phase_records_samples():
+    """Timing a phase adds one sample per use."""
+    profiler = FrameProfiler()
+    for _ in range(3):
+        with profiler.phase("update"):
+            pass
+
+    assert len(profiler.samples["update"]) == 3
+    assert all(sample >= 0 for sample in profiler.samples["update"])
+
+def test_percentiles_over_rolling_window():
+    """Percentiles only consider the most recent window of samples."""
+    profiler = FrameProfiler(window=100)
+    for ms in range(1, 201):
+        profiler.record("draw", ms * 1_000_000)
+
+    p50, p95, p99 = profiler.percentiles("draw")
+    assert (p50, p95, p99) == (151.0, 195.0, 199.0)
+    assert profiler.percentiles("missing") == (0.0, 0.0, 0.0)
+
+def test_end_frame_counts_frames():
+    """Each end_frame() records a total frame time."""
+    profiler = FrameProfiler()
+    profiler.end_frame()
+    profiler.end_frame()
+
+    assert profiler.frame == 2
+    assert len(profiler.samples[FRAME]) == 2
+
+def test_skip_frame_drops_the_frames_samples():
+    """skip_frame() forgets what the current frame recorded."""
+    profiler = FrameProfiler()
+    profiler.record("events", 1_000_000)
+    profiler.end_frame()
+    profiler.record("events", 500_000_000)
+    profiler.skip_frame()
+
+    assert profiler.frame == 1
+    assert list(profiler.samples["events"]) == [1_000_000]
+    assert len(profiler.samples[FRAME]) == 1
+    assert [name for _, name, _ in profiler.trace] == ["events", FRAME]
+
+def test_export_csv_and_json(tmp_path):
+    """Traces export to both CSV rows and a JSON summary."""
+    profiler = FrameProfiler()
+    profiler.record("update", 2_000_000)
+    profiler.end_frame()
+
+    profiler.export(tmp_path / "trace.csv")
+    profiler.export(tmp_path / "trace.json")
+
+    with open(tmp_path / "trace.csv") as f:
+        rows = list(csv.DictReader(f))
+    with open(tmp_path / "trace.json") as f:
+        data = json.load(f)
+
+    assert rows[0] == {"frame": "0", "phase": "update", "ms": "2.0000"}
+    assert data["summary"]["update"]["p50"] == 2.0
+    assert len(data["trace"]) == 2
+
+def test_overlay_only_drawn_when_toggled():
+    """The overlay draws nothing until toggled on."""
+    profiler = FrameProfiler()
+    profiler.record("update", 1_000_000)
+    screen = pygame.Surface((400, 300))
+    font = MagicMock()
+    font.render.return_value = pygame.Surface((120, 12), pygame.SRCALPHA)
+
+    assert profiler.draw_overlay(screen, font) is None
+    profiler.toggle_overlay()
+    rect = profiler.draw_overlay(screen, font)
+
+    assert rect.right == 390
+    assert rect.height == 24
+
+def test_null_profiler_records_nothing():
+    """The null profiler accepts the same calls and keeps no data."""
+    profiler = NullProfiler()
+    with profiler.phase("update"):
+        pass
+    profiler.end_frame()
+    assert profiler.summary() == {}
+
+
+#Game Integration Tests
+
+def test_game_profiles_phases_and_exports_trace(tmp_path):
+    """Interactive games time each phase and write the trace on exit."""
+    trace = tmp_path / "trace.json"
+    game = Game(profile_trace=str(trace))
+    game.update()
+    game.draw()
+
+    assert {"update.ships", "update.collisions", "draw.background",
+            "draw.sprites", "draw.health", "draw.flip"} <= set(game.profiler.samples)
+
+    game.running = False
+    with patch("pygame.quit"):
+        game.run()
+    assert trace.exists()
+
+def test_trace_path_with_profiling_off_exits_cleanly(tmp_path):
+    """With profiling off, a trace path is ignored and the game still quits."""
+    trace = tmp_path / "trace.csv"
+    game = Game(profile=False, profile_trace=str(trace))
+    game.running = False
+    with patch("pygame.quit") as quit:
+        game.run()
+
+    quit.assert_called_once()
+    assert not trace.exists()
+    assert NullProfiler().percentiles("frame") == (0.0, 0.0, 0.0)
+
+def test_headless_game_uses_null_profiler():
+    """Headless simulation is not instrumented by default."""
+    assert isinstance(Game(headless=True).profiler, NullProfiler)
+
+def test_f3_toggles_overlay():
+    """Pressing F3 shows the profiler overlay."""
+    game = Game()
+    event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3)
+    with patch("pygame.event.get", return_value=[event]):
+        game.handle_events()
+    assert game.profiler.show_overlay is True
@@ -0,0 +1,187 @@
+import pygame
+import pytest
+from unittest.mock import MagicMock, patch
+from render import (DirtyRectRenderer, FullScreenRenderer, TextureRenderer, create_renderer,
+                    BACKGROUND, ENTITIES, HUD)
+from SaveThePenguin import Game
+
+
+@pytest.fixture
+def surfaces():
+    """Fixture for a blue screen and a red background of the same size."""
+    screen = pygame.Surface((200, 100))
+    screen.fill((0, 0, 255))
+    background = pygame.Surface((200, 100))
+    background.fill((255, 0, 0))
+    return screen, background
+
+
+#DirtyRectRenderer Tests
+
+def test_dirty_first_frame_is_full_flip(surfaces):
+    """The first frame repaints everything and flips the display."""
+    screen, background = surfaces
+    renderer = DirtyRectRenderer(screen, background)
+
+    with patch("pygame.display.flip") as flip, patch("pygame.display.update") as update:
+        renderer.clear()
+        renderer.present()
+
+    flip.assert_called_once()
+    update.assert_not_called()
+    assert screen.get_at((150, 80))[:3] == (255, 0, 0)
+
+def test_dirty_clear_restores_only_previous_rects(surfaces):
+    """Only areas drawn last frame get the background painted back."""
+    screen, background = surfaces
+    renderer = DirtyRectRenderer(screen, background)
+    with patch("pygame.display.flip"):
+        renderer.clear()
+        renderer.present()
+
+    screen.fill((0, 0, 255))
+    sprite = pygame.Surface((20, 20))
+    sprite.fill((0, 0, 255))
+    renderer.queue(ENTITIES, sprite, (10, 10))
+    with patch("pygame.display.update"):
+        renderer.present()
+    renderer.clear()
+    renderer.flush()
+
+    assert screen.get_at((15, 15))[:3] == (255, 0, 0)
+    assert screen.get_at((150, 80))[:3] == (0, 0, 255)
+
+def test_dirty_present_updates_old_and_new_rects(surfaces):
+    """present() pushes where sprites were and where they are now."""
+    screen, background = surfaces
+    renderer = DirtyRectRenderer(screen, background)
+    sprite, empty = pygame.Surface((5, 5)), pygame.Surface((0, 0))
+
+    with patch("pygame.display.flip"), patch("pygame.display.update") as update:
+        renderer.queue(ENTITIES, sprite, (0, 0))
+        renderer.present()
+        renderer.queue(ENTITIES, sprite, (3, 3))
+        renderer.queue(ENTITIES, empty, (9, 9))
+        renderer.present()
+
+    update.assert_called_once_with([pygame.Rect(0, 0, 5, 5), pygame.Rect(3, 3, 5, 5)])
+
+def test_dirty_invalidate_forces_full_flip(surfaces):
+    """invalidate() makes the next frame a full redraw."""
+    renderer = DirtyRectRenderer(*surfaces)
+    with patch("pygame.display.flip") as flip:
+        renderer.present()
+        renderer.invalidate()
+        renderer.present()
+    assert flip.call_count == 2
+
+
+#FullScreenRenderer Tests
+
+def test_full_screen_renderer_always_flips(surfaces):
+    """The full renderer repaints and flips every frame."""
+    renderer = FullScreenRenderer(*surfaces)
+    with patch("pygame.display.flip") as flip:
+        for _ in range(3):
+            renderer.clear()
+            renderer.present()
+    assert flip.call_count == 3
+
+
+#Layer Tests
+
+def test_layers_draw_bottom_to_top(surfaces):
+    """Later layers are drawn over earlier ones, in the configured order."""
+    screen, background = surfaces
+    green = pygame.Surface((10, 10))
+    green.fill((0, 255, 0))
+    white = pygame.Surface((10, 10))
+    white.fill((255, 255, 255))
+
+    for layers, expected in (((BACKGROUND, ENTITIES, HUD), (255, 255, 255)),
+                             ((BACKGROUND, HUD, ENTITIES), (0, 255, 0))):
+        renderer = FullScreenRenderer(screen, background, layers)
+        renderer.clear()
+        renderer.queue(HUD, white, (0, 0))
+        renderer.queue(ENTITIES, green, (0, 0))
+        with patch("pygame.display.flip"):
+            renderer.present()
+        assert screen.get_at((5, 5))[:3] == expected
+
+def test_flush_batches_one_blits_call_per_layer(surfaces):
+    """Every queued sprite on a layer is drawn by a single blits() call."""
+    screen, background = surfaces
+    spy = MagicMock(wraps=screen)
+    renderer = DirtyRectRenderer(spy, background)
+    sprite = pygame.Surface((5, 5))
+    renderer.clear()
+    renderer.queue_many(ENTITIES, [(sprite, (i * 6, 0)) for i in range(20)])
+    renderer.queue(HUD, sprite, (0, 50))
+
+    renderer.flush()
+
+    spy.blit.assert_not_called()
+    assert spy.blits.call_count == 3
+    assert len(renderer.dirty_rects()) == 21
+
+def test_fleet_positions_match_ship_rects():
+    """The vectorized fleet hands the renderer one position per live ship."""
+    game = Game(vectorized=True, wave_size=(5, 5), seed=3)
+    x, y = game.fleet.positions()
+    assert list(zip(x.astype(int).tolist(), y.astype(int).tolist())) == \
+        [ship.get_rect().topleft for ship in game.ships]
+
+
+#TextureRenderer Tests
+
+def test_texture_renderer_draws_layers_with_textures():
+    """Queued blits are drawn as textures, uploaded once per surface."""
+    renderer = create_renderer("texture", (200, 100))
+    assert isinstance(renderer, TextureRenderer)
+    renderer.background = pygame.Surface((200, 100))
+    renderer.background.fill((0, 0, 255))
+    sprite = pygame.Surface((10, 10))
+    sprite.fill((255, 0, 0))
+
+    for _ in range(3):
+        renderer.clear()
+        renderer.queue(ENTITIES, sprite, (20, 30))
+        renderer.queue(HUD, sprite, (50, 50), pygame.Rect(0, 0, 5, 5))
+        renderer.present()
+    frame = renderer.capture()
+
+    assert frame.get_at((25, 35))[:3] == (255, 0, 0)
+    assert frame.get_at((52, 52))[:3] == (255, 0, 0)
+    assert frame.get_at((57, 57))[:3] == (0, 0, 255)
+    assert len(renderer._textures) == 1
+
+def test_unknown_backend_is_rejected():
+    """Backends are picked by name and a typo fails at startup."""
+    with pytest.raises(ValueError):
+        Game(render_backend="opengl")
+
+
+#Game Integration Tests
+
+def test_game_draw_pushes_sprite_areas_only():
+    """After the first frame, Game.draw updates just the changed areas."""
+    game = Game(wave_size=(2, 2))
+    with patch("pygame.display.flip"), patch("pygame.display.update") as update:
+        game.draw()
+        game.draw()
+
+    rects = update.call_args[0][0]
+    assert game.penguin.get_rect() in rects
+    assert all(rect.width < game.width for rect in rects)
+
+def test_game_runs_on_texture_backend():
+    """A game on the texture backend draws frames and composes its scenes."""
+    game = Game(render_backend="texture", wave_size=(2, 2))
+    assert game.screen is None
+
+    game.draw()
+    game.penguin.health = 0
+    game.scenes.top.update()
+    game.scenes.top.draw(1.0)
+
+    assert game.scenes.top.surface.get_size() == (game.width, game.height)
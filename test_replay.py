@@ -0,0 +1,86 @@
+import random
+import pytest
+from controls import ScriptedInput, LEFT, RIGHT, UP, DOWN
+from replay import InputRecorder, Replay, play_replay
+from SaveThePenguin import Game, Ship
+
+
+def random_script(seed, frames):
+    """Return a seeded list of per-frame action bitmasks."""
+    rng = random.Random(seed)
+    return [rng.choice((0, LEFT, RIGHT, UP, DOWN, LEFT | UP)) for _ in range(frames)]
+
+
+def final_state(game):
+    """Return the parts of a game that a replay must reproduce."""
+    return (game.frame, game.penguin.health, game.penguin.rect.topleft,
+            [ship.get_rect().topleft for ship in game.ships])
+
+
+#Seeded RNG Tests
+
+def test_games_with_same_seed_spawn_identical_waves():
+    """Two games with one seed build the same ships."""
+    first = Game(seed=11, wave_size=(1, 5))
+    second = Game(seed=11, wave_size=(1, 5))
+    assert final_state(first) == final_state(second)
+
+def test_injected_rng_drives_ship_spawns():
+    """Ships draw from the injected RNG, not the random module."""
+    ship = Ship("Ship.PNG", 800, rng=random.Random(4))
+    again = Ship("Ship.PNG", 800, rng=random.Random(4))
+    assert (ship.speed, ship.rect.topleft) == (again.speed, again.rect.topleft)
+
+
+#Recorder and Replay Tests
+
+def test_replay_round_trips_through_bytes():
+    """Encoding and decoding a replay keeps every frame."""
+    replay = Replay(123, [0] * 500 + [LEFT] * 70000 + [RIGHT, UP])
+    data = replay.to_bytes()
+    decoded = Replay.from_bytes(data)
+
+    assert decoded.seed == 123
+    assert decoded.actions == replay.actions
+    assert len(data) < 40
+
+def test_replay_rejects_bad_data():
+    """Corrupt files are reported rather than replayed."""
+    with pytest.raises(ValueError):
+        Replay.from_bytes(b"NOPE" + bytes(13))
+
+    data = Replay(1, [LEFT] * 10).to_bytes()
+    with pytest.raises(ValueError):
+        Replay.from_bytes(data[:-3])
+
+@pytest.mark.parametrize("seed", (-5, 2 ** 70))
+def test_replay_rejects_seeds_that_do_not_fit(seed):
+    """A replay's seed must fit the file's u64 field."""
+    with pytest.raises(ValueError, match="Seed"):
+        Replay(seed, [0, 1])
+
+def test_recorded_session_replays_bit_for_bit(tmp_path):
+    """Replaying a recording reproduces the recorded game exactly."""
+    recorder = InputRecorder(ScriptedInput(random_script(5, 3000)))
+    game = Game(headless=True, seed=99, input_source=recorder)
+    game.simulate(3000)
+
+    path = tmp_path / "session.stpr"
+    recorder.to_replay(game.seed).save(path)
+    replayed = play_replay(Replay.load(path))
+
+    assert len(recorder.actions) == game.frame
+    assert final_state(replayed) == final_state(game)
+
+def test_recorder_stops_at_first_game_over():
+    """Ticks played after a restart are left out of the recording."""
+    game = Game(headless=True, seed=7)
+    recorder = InputRecorder(ScriptedInput(random_script(7, 50)), game)
+    game.input_source = recorder
+    first_game = game.simulate(20)
+    game.game_over = True
+    game.reset_game()
+    game.simulate(20)
+
+    assert game.frame == 20
+    assert len(recorder.actions) == first_game == 20
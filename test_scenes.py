@@ -0,0 +1,115 @@
+import pygame
+from unittest.mock import call, patch
+from scenes import SceneStack, PlayScene, PauseScene, GameOverScene, TitleScene
+from SaveThePenguin import Game
+
+
+def press(game, key):
+    """Send one KEYDOWN event through Game.handle_events."""
+    event = pygame.event.Event(pygame.KEYDOWN, key=key)
+    with patch("pygame.event.get", return_value=[event]):
+        game.handle_events()
+
+
+#SceneStack Tests
+
+def test_stack_push_pop_replace():
+    """The top scene is the active one; pop resumes the one below."""
+    game = Game()
+    stack = SceneStack()
+    play, pause, over = PlayScene(game), PauseScene(game), GameOverScene(game)
+
+    stack.push(play)
+    stack.push(pause)
+    assert stack.top is pause
+    assert stack.pop() is pause
+    assert stack.top is play
+    stack.replace(over)
+    assert stack.top is over and len(stack) == 1
+
+
+#Scene Transition Tests
+
+def test_death_switches_to_game_over_scene():
+    """The play scene hands over to the game-over scene when health runs out."""
+    game = Game(wave_size=(1, 1), damage=50)
+    game.ships[0].rect = game.penguin.get_rect().copy()
+
+    game.scenes.top.update()
+
+    assert game.game_over is True
+    assert isinstance(game.scenes.top, GameOverScene)
+
+def test_pause_stops_simulation_until_resumed():
+    """P pauses the game; only the play scene simulates."""
+    game = Game()
+    press(game, pygame.K_p)
+
+    assert isinstance(game.scenes.top, PauseScene)
+    assert game.scenes.top.simulates is False
+
+    press(game, pygame.K_p)
+    assert isinstance(game.scenes.top, PlayScene)
+    assert game.sim_clock.accumulator == 0.0
+
+def test_game_over_restart_and_quit():
+    """R starts a new game from the game-over scene and Q quits."""
+    game = Game()
+    game.penguin.health = 0
+    game.game_over = True
+    game.scenes.replace(GameOverScene(game))
+
+    press(game, pygame.K_r)
+    assert isinstance(game.scenes.top, PlayScene)
+    assert game.game_over is False and game.penguin.health == 50
+
+    game.scenes.replace(GameOverScene(game))
+    press(game, pygame.K_q)
+    assert game.running is False
+
+def test_title_scene_waits_for_any_key():
+    """The title screen is dismissed by the first key press."""
+    game = Game(title_screen=True)
+    game.scenes.push(TitleScene(game))
+    press(game, pygame.K_SPACE)
+    assert isinstance(game.scenes.top, PlayScene)
+
+
+#Static Scene Tests
+
+def test_static_scene_presents_once():
+    """A static scene is composed and flipped once, then draws nothing."""
+    game = Game()
+    game.game_over = True
+    game.scenes.replace(GameOverScene(game))
+    scene = game.scenes.top
+
+    with patch("pygame.display.flip") as flip, patch("pygame.display.update"):
+        for _ in range(10):
+            scene.draw(1.0)
+        assert scene.idle is True
+        presented = flip.call_count
+        scene.invalidate()
+        scene.draw(1.0)
+
+    assert presented <= 2
+    assert flip.call_count == presented + 1
+    assert game.font.render.call_count == 3  # health text + two overlay lines
+
+def test_idle_scene_blocks_on_events_instead_of_ticking():
+    """With a drawn static scene on top, run() sleeps in event.wait()."""
+    game = Game()
+    game.scenes.push(PauseScene(game))
+    with patch("pygame.display.flip"):
+        game.scenes.top.draw(1.0)
+    game.clock.tick.reset_mock()
+    quit_event = pygame.event.Event(pygame.QUIT)
+
+    with patch("pygame.event.get", return_value=[]), \
+         patch("pygame.event.wait", return_value=quit_event) as wait, \
+         patch("pygame.quit"), patch.object(game, "start_audio"):
+        game.run()
+
+    wait.assert_called_once()
+    assert call(game.max_fps) not in game.clock.tick.call_args_list
+    assert game.frame == 0
@@ -0,0 +1,101 @@
+import random
+import pytest
+from controls import ScriptedInput, LEFT, RIGHT, UP, DOWN
+from snapshot import snapshot, restore, SnapshotRing
+from waves import Level
+from SaveThePenguin import Game
+
+
+def script(seed, frames):
+    """Return a seeded input source of per-tick action bitmasks."""
+    rng = random.Random(seed)
+    return ScriptedInput([rng.choice((0, LEFT, RIGHT, UP, DOWN)) for _ in range(frames)])
+
+
+def state(game):
+    """Return the parts of a game a restore must reproduce."""
+    return (game.frame, game.hits, game.ships_dodged, game.game_over,
+            game.penguin.health, game.penguin.rect.topleft,
+            [(ship.get_rect().topleft, ship.speed) for ship in game.ships])
+
+
+#Snapshot Tests
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_restored_game_replays_the_same_future(vectorized):
+    """After a restore, the same inputs give exactly the same game again."""
+    game = Game(headless=True, vectorized=vectorized, seed=5, wave_size=(2, 6))
+    game.input_source = script(1, 200)
+    game.step(200)
+    saved = snapshot(game)
+
+    game.input_source = script(2, 400)
+    game.step(400)
+    first = state(game)
+
+    restore(game, saved)
+    game.input_source = script(2, 400)
+    game.step(400)
+    assert state(game) == first
+
+def test_restore_level_cursor():
+    """A game with a level resumes its spawn schedule from the snapshot."""
+    level = Level([{"time": 0.1, "count": 2, "speed": 3, "repeat": 20, "every": 0.5}])
+    game = Game(headless=True, seed=9, level=level)
+    game.step(50)
+    saved = snapshot(game)
+    game.step(300)
+    first = state(game)
+
+    restore(game, saved)
+    game.step(300)
+    assert state(game) == first
+
+def test_snapshot_is_compact_and_rejects_other_games():
+    """Snapshots are a few kilobytes and only restore into matching games."""
+    game = Game(headless=True, seed=1, wave_size=(3, 3))
+    data = snapshot(game)
+    assert len(data) < 3000
+
+    with pytest.raises(ValueError):
+        restore(Game(headless=True, vectorized=True), data)
+    with pytest.raises(ValueError):
+        restore(game, b"XXXX" + data[4:])
+    with pytest.raises(ValueError):
+        restore(Game(headless=True, pool_size=2), data)
+
+@pytest.mark.parametrize("seed", (-5, 2 ** 64, 2 ** 70, 1.5))
+def test_seeds_that_do_not_fit_a_snapshot_are_rejected(seed):
+    """Games only take seeds a snapshot can store, instead of failing in snapshot()."""
+    with pytest.raises(ValueError, match="Seed"):
+        Game(headless=True, seed=seed)
+    with pytest.raises(ValueError, match="Seed"):
+        Game(headless=True).reseed(seed)
+
+def test_largest_seed_round_trips():
+    """A seed of 2**64 - 1 survives a snapshot."""
+    game = Game(headless=True, seed=2 ** 64 - 1)
+    restore(game, snapshot(game))
+    assert game.seed == 2 ** 64 - 1
+
+
+#SnapshotRing Tests
+
+def test_ring_rewinds_and_keeps_only_recent_snapshots():
+    """The ring holds capacity snapshots and rewinds back through them."""
+    game = Game(headless=True, seed=4)
+    ring = SnapshotRing(capacity=5)
+    for _ in range(8):
+        ring.record(game)
+        game.step(1)
+
+    assert len(ring) == 5
+    assert ring.rewind(game, 2) is True
+    assert game.frame == 6
+    assert ring.rewind(game, 1) is True
+    assert game.frame == 5
+    assert ring.rewind(game, 1) is True
+    assert game.frame == 4
+    assert len(ring) == 1
+    assert ring.rewind(game, 2) is False
+    assert game.frame == 4
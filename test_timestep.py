@@ -0,0 +1,89 @@
+from unittest.mock import MagicMock, patch
+from controls import RIGHT
+from timestep import SimulationClock
+from SaveThePenguin import Game, Ship, Penguin
+
+
+#SimulationClock Tests
+
+def test_clock_ticks_at_fixed_rate():
+    """Elapsed time is turned into whole ticks with the rest carried over."""
+    clock = SimulationClock(tick_rate=100)
+
+    assert clock.advance(0.025) == 2
+    assert abs(clock.alpha - 0.5) < 1e-9
+    assert clock.advance(0.005) == 1
+    assert clock.alpha < 1e-6
+
+def test_fast_frames_run_no_ticks():
+    """Frames drawn faster than the tick rate just interpolate."""
+    clock = SimulationClock(tick_rate=60)
+    ticks = [clock.advance(1 / 240) for _ in range(8)]
+
+    assert sum(ticks) == 2
+    assert 0.0 <= clock.alpha < 1.0
+
+def test_slow_frame_is_capped():
+    """A very long frame runs at most max_ticks_per_frame ticks."""
+    clock = SimulationClock(tick_rate=60, max_ticks_per_frame=5)
+
+    assert clock.advance(2.0) == 5
+    assert clock.accumulator == 0.0
+
+
+#Interpolation Tests
+
+def test_ship_draws_between_ticks():
+    """Ships are drawn part of the way between their last two positions."""
+    ship = Ship("Ship.PNG", 800)
+    ship.rect.y = 100
+    ship.speed = 4
+    ship.move()
+    screen = MagicMock()
+
+    ship.draw(screen, alpha=0.5)
+
+    assert screen.blit.call_args[0][1] == (ship.rect.x, 102)
+
+def test_penguin_draws_between_ticks():
+    """The penguin is drawn part of the way through its last move."""
+    penguin = Penguin("PenguinCharacter.PNG", 800, 600, speed=10)
+    start_x = penguin.rect.x
+    penguin.update(actions=RIGHT)
+    screen = MagicMock()
+
+    penguin.draw(screen, alpha=0.25)
+
+    assert screen.blit.call_args[0][1][0] == round(start_x + 2.5)
+
+def test_fleet_ship_draws_between_ticks():
+    """Vectorized ships interpolate from their speed."""
+    game = Game(headless=True, vectorized=True, seed=5)
+    ship = game.ships[0]
+    y = ship.rect.y
+    screen = MagicMock()
+
+    ship.draw(screen, alpha=0.5)
+
+    assert screen.blit.call_args[0][1][1] == round(y - ship.speed * 0.5)
+
+
+#Game Loop Tests
+
+def test_slow_frames_still_advance_simulation():
+    """A 50 ms frame at 60 ticks/sec runs three updates before drawing."""
+    game = Game(tick_rate=60)
+    game.clock.tick.return_value = 50
+
+    def stop(wait=False):
+        game.running = False
+
+    with patch.object(game, "handle_events", side_effect=stop), \
+         patch.object(game, "draw") as draw, \
+         patch("pygame.quit"), \
+         patch("sys.exit"):
+        game.run()
+
+    assert game.frame == 3
+    alpha = draw.call_args[0][0]
+    assert 0.0 <= alpha < 1.0
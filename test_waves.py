@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+from waves import Level, Timeline, SPAWN_Y
+from SaveThePenguin import Game
+
+
+def compile_level(waves, loop=False, length=None, tick_rate=60, seed=0):
+    """Compile a level on an 800 pixel wide screen."""
+    return Level(waves, loop=loop, length=length).compile(
+        800, 100, tick_rate, np.random.default_rng(seed)
+    )
+
+
+#Level Tests
+
+def test_compile_sorts_spawns_by_tick():
+    """Waves are converted to ticks and sorted regardless of file order."""
+    timeline = compile_level([
+        {"time": 2, "count": 1, "speed": 4},
+        {"time": 0.5, "count": 2, "speed": [3, 5], "repeat": 2, "every": 0.5},
+    ])
+
+    assert list(timeline.ticks) == [30, 30, 60, 60, 120]
+    assert timeline.speed[-1] == 4.0
+    assert np.all((timeline.speed[:4] >= 3) & (timeline.speed[:4] <= 5))
+
+def test_formations_and_screen_limits():
+    """Line ships share a row, column ships a column, and all stay on screen."""
+    line = compile_level([{"time": 0, "count": 3, "formation": "line", "x": 0.5,
+                           "spacing": 50, "speed": 4}])
+    column = compile_level([{"time": 0, "count": 3, "formation": "column", "x": 1.0,
+                             "speed": 4}])
+    v = compile_level([{"time": 0, "count": 3, "formation": "v", "x": 0.5, "speed": 4}])
+
+    assert list(line.x) == [300, 350, 400] and np.all(line.y == SPAWN_Y)
+    assert np.all(column.x == 700) and list(np.diff(column.y)) == [-80, -80]
+    assert v.y[1] > v.y[0] == v.y[2]
+
+def test_invalid_wave_is_rejected():
+    """Unknown formations and waves without a count raise ValueError."""
+    with pytest.raises(ValueError):
+        Level([{"time": 0, "count": 1, "formation": "spiral"}])
+    with pytest.raises(ValueError):
+        Level([{"time": 0}])
+
+def test_example_level_loads():
+    """The bundled example level is valid."""
+    timeline = Level.load("example_level.json").compile(800, 100, 60,
+                                                        np.random.default_rng(1))
+    assert len(timeline) > 0 and timeline.period == 24 * 60
+
+
+#Timeline Tests
+
+def test_due_hands_out_each_group_once():
+    """Each group of spawns is returned once, on or after its tick."""
+    timeline = Timeline(np.array([5, 0, 5]), np.zeros(3), np.zeros(3), np.ones(3))
+
+    assert [timeline.due(tick) for tick in range(8)] == [
+        (0, 1), None, None, None, None, (1, 3), None, None
+    ]
+    timeline.reset()
+    assert timeline.due(0) == (0, 1)
+
+def test_looping_timeline_repeats_every_period():
+    """A looping level spawns its groups again one period later."""
+    timeline = compile_level([{"time": 0, "count": 1, "speed": 3}], loop=True, length=1,
+                             tick_rate=10)
+    due = [tick for tick in range(35) if timeline.due(tick)]
+    assert due == [0, 10, 20, 30]
+
+
+#Game Level Tests
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_game_spawns_from_level(vectorized):
+    """A game with a level starts empty and spawns ships on schedule."""
+    level = Level([{"time": 0.5, "count": 3, "speed": 2}])
+    game = Game(headless=True, vectorized=vectorized, seed=3, level=level)
+    assert len(game.ships) == 0
+
+    game.step(30)
+    assert len(game.ships) == 0
+    game.step(1)
+    assert len(game.ships) == 3
+    assert all(ship.speed == 2 for ship in game.ships)
+
+def test_level_reset_and_reseed_replay_the_same_spawns():
+    """reset_game() restarts the timeline, reseed() rolls it like a new game."""
+    level = Level([{"time": 0, "count": 4, "speed": [2, 6]}])
+    game = Game(headless=True, seed=8, level=level)
+    game.step(1)
+    first = [ship.rect.copy() for ship in game.ships]
+
+    game.reseed(8)
+    game.reset_game()
+    game.step(1)
+    assert [ship.rect for ship in game.ships] == first
+
+def test_scheduled_spawns_do_not_roll_random_ships():
+    """Pooled ships are placed straight from the timeline without drawing from the game RNG."""
+    level = Level([{"time": 0, "count": 5, "speed": 3}])
+    game = Game(headless=True, seed=2, level=level)
+    state = game.rng.getstate()
+    game.step(1)
+    assert len(game.ships) == 5
+    assert game.rng.getstate() == state
@@ -0,0 +1,50 @@
+"""
+Fixed-timestep simulation clock for Save the Penguin
+
+Game logic always advances in ticks of 1 / tick_rate seconds, however fast
+or slow frames are drawn. Real elapsed time is added to an accumulator
+each frame, whole ticks are taken out of it, and the fraction left over
+(alpha) is used to interpolate sprites between the last two ticks.
+"""
+
+
+DEFAULT_TICK_RATE = 60
+
+
+class SimulationClock:
+    """
+    Converts real frame times into a number of fixed simulation ticks.
+
+    If a frame takes so long that more than max_ticks_per_frame ticks
+    are owed, the extra time is dropped so a slow machine slows the game
+    down instead of falling further and further behind.
+    """
+
+    def __init__(self, tick_rate=DEFAULT_TICK_RATE, max_ticks_per_frame=5):
+        """Initialize with an empty accumulator."""
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.accumulator = 0.0
+
+    def advance(self, elapsed):
+        """
+        Add elapsed seconds and return how many ticks to simulate now.
+        """
+        self.accumulator += elapsed
+        ticks = int(self.accumulator / self.dt)
+        if ticks > self.max_ticks_per_frame:
+            ticks = self.max_ticks_per_frame
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= ticks * self.dt
+        return ticks
+
+    @property
+    def alpha(self):
+        """Fraction of a tick since the last one, for interpolation."""
+        return min(self.accumulator / self.dt, 1.0)
+
+    def reset(self):
+        """Empty the accumulator."""
+        self.accumulator = 0.0
@@ -0,0 +1,222 @@
+"""
+Data-driven levels for Save the Penguin
+
+A level file is JSON listing when ships appear, how many, how fast, and
+in what formation:
+
+    {
+        "name": "Warm-up",
+        "loop": true,
+        "length": 20,
+        "waves": [
+            {"time": 0, "count": 2, "speed": [3, 5]},
+            {"time": 4, "count": 5, "speed": {"normal": [5, 1]},
+             "formation": "v", "x": 0.5, "spacing": 70},
+            {"time": 8, "count": 3, "speed": 4.5, "formation": "line",
+             "repeat": 4, "every": 1.5}
+        ]
+    }
+
+Times are in seconds and are converted to simulation ticks. "speed" is a
+fixed number, an inclusive [min, max] range (whole numbers give whole
+pixel speeds), or {"normal": [mean, stddev]}. "formation" is "random"
+(the default), "line", "column", or "v"; "x" centres a formation at a
+fraction of the screen width (random if left out) and "spacing" is the
+gap in pixels between its ships. "repeat" and "every" spawn the same
+wave several times. With "loop", the level starts over every "length"
+seconds (one second after the last wave by default).
+
+Level.load() reads and checks the file once. compile() then rolls every
+random choice and expands every wave into one Timeline: parallel NumPy
+arrays of spawn tick, x, y, and speed, sorted by tick and grouped per
+tick. Each frame the game only compares the current tick with the next
+group's tick, so no per-frame decisions are made in Python.
+"""
+
+import json
+
+import numpy as np
+
+
+FORMATIONS = ("random", "line", "column", "v")
+SPAWN_Y = -80
+DEFAULT_SPACING = 80
+
+
+class Level:
+    """A parsed level file, not yet tied to a screen size or tick rate."""
+
+    def __init__(self, waves, name="", loop=False, length=None):
+        """
+        Initialize from a list of wave dicts (see the module docstring).
+
+        Raises:
+            ValueError: if a wave is missing its time or count, or names
+                an unknown formation.
+        """
+        for wave in waves:
+            if "time" not in wave or "count" not in wave:
+                raise ValueError(f"Wave needs a time and a count: {wave}")
+            if wave.get("formation", "random") not in FORMATIONS:
+                raise ValueError(f"Unknown formation: {wave['formation']}")
+        self.waves = waves
+        self.name = name
+        self.loop = loop
+        self.length = length
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a level from the parsed JSON of a level file."""
+        return cls(data["waves"], data.get("name", ""), data.get("loop", False),
+                   data.get("length"))
+
+    @classmethod
+    def load(cls, path):
+        """Read a JSON level file."""
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+    def compile(self, screen_width, ship_width, tick_rate, rng):
+        """
+        Expand every wave into a Timeline.
+
+        Args:
+            screen_width: width ships are spread across.
+            ship_width: sprite width, to keep ships on the screen.
+            tick_rate: simulation ticks per second.
+            rng: numpy Generator for every random spawn position and speed.
+        """
+        ticks, xs, ys, speeds = [], [], [], []
+        last_time = 0.0
+        for wave in self.waves:
+            every = wave.get("every", 0)
+            for repeat in range(wave.get("repeat", 1)):
+                time = wave["time"] + repeat * every
+                last_time = max(last_time, time)
+                x, y = _formation(wave, screen_width, ship_width, rng)
+                count = len(x)
+                ticks.append(np.full(count, round(time * tick_rate), dtype=np.int64))
+                xs.append(x)
+                ys.append(y)
+                speeds.append(_speeds(wave.get("speed", [3, 6]), count, rng))
+
+        period = 0
+        if self.loop:
+            length = self.length if self.length is not None else last_time + 1
+            period = max(1, round(length * tick_rate))
+
+        if not ticks:
+            empty = np.zeros(0)
+            return Timeline(np.zeros(0, dtype=np.int64), empty, empty, empty, period)
+        return Timeline(np.concatenate(ticks), np.concatenate(xs),
+                        np.concatenate(ys), np.concatenate(speeds), period)
+
+
+class Timeline:
+    """
+    Every spawn of a compiled level, sorted by tick.
+
+    Spawns that share a tick form one group. due(tick) hands out the next
+    group once its tick is reached and is called with increasing ticks;
+    with a period, the timeline repeats every period ticks.
+    """
+
+    def __init__(self, ticks, x, y, speed, period=0):
+        """Sort the spawns by tick and index the groups."""
+        order = np.argsort(ticks, kind="stable")
+        self.ticks = ticks[order]
+        self.x = x[order]
+        self.y = y[order]
+        self.speed = speed[order]
+        self.period = period
+
+        group_ticks, group_start = np.unique(self.ticks, return_index=True)
+        self.group_ticks = group_ticks.tolist()
+        self.group_bounds = list(zip(group_start.tolist(),
+                                     group_start[1:].tolist() + [len(self.ticks)]))
+        self.reset()
+
+    def reset(self):
+        """Go back to the start of the level."""
+        self._group = 0
+        self._offset = 0
+        self._next = self.group_ticks[0] if self.group_ticks else None
+
+    def due(self, tick):
+        """
+        Return the (start, end) slice of spawns for tick, or None.
+
+        Ticks that were skipped are not caught up: a group whose tick has
+        already passed is spawned on the next call.
+        """
+        next_tick = self._next
+        if next_tick is None or tick < next_tick:
+            return None
+
+        group = self._group
+        bounds = self.group_bounds[group]
+        group += 1
+        if group == len(self.group_ticks):
+            if self.period:
+                group = 0
+                self._offset += self.period
+            else:
+                self._next = None
+                return bounds
+        self._group = group
+        self._next = self._offset + self.group_ticks[group]
+        return bounds
+
+    def cursor(self):
+        """Return the (group, offset, next tick) position, for snapshots."""
+        return self._group, self._offset, self._next
+
+    def seek(self, group, offset, next_tick):
+        """Move to a position returned by cursor()."""
+        self._group = group
+        self._offset = offset
+        self._next = next_tick
+
+    def __len__(self):
+        return len(self.ticks)
+
+
+def _speeds(spec, count, rng):
+    """Roll count speeds from a speed spec."""
+    if isinstance(spec, dict):
+        mean, stddev = spec["normal"]
+        return np.maximum(rng.normal(mean, stddev, count), 0.5)
+    if isinstance(spec, (list, tuple)):
+        low, high = spec
+        if isinstance(low, int) and isinstance(high, int):
+            return rng.integers(low, high + 1, count).astype(float)
+        return rng.uniform(low, high, count)
+    return np.full(count, float(spec))
+
+
+def _formation(wave, screen_width, ship_width, rng):
+    """Return the x and y arrays of one wave's ships."""
+    count = wave["count"]
+    formation = wave.get("formation", "random")
+    spacing = wave.get("spacing", DEFAULT_SPACING)
+    right = screen_width - ship_width
+
+    if formation == "random":
+        x = rng.integers(0, right + 1, count).astype(float)
+        return x, np.full(count, float(SPAWN_Y))
+
+    centre = wave.get("x")
+    centre = rng.uniform(0, 1) if centre is None else centre
+    centre_x = centre * right
+    offsets = np.arange(count) - (count - 1) / 2
+
+    if formation == "line":
+        x = centre_x + offsets * spacing
+        y = np.full(count, float(SPAWN_Y))
+    elif formation == "column":
+        x = np.full(count, centre_x)
+        y = SPAWN_Y - np.arange(count) * spacing
+    else:  # "v": the middle ship leads, the others trail behind it
+        x = centre_x + offsets * spacing
+        y = SPAWN_Y - np.abs(offsets) * spacing / 2
+    return np.clip(x, 0, right), y.astype(float)